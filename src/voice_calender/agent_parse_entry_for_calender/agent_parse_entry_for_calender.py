@@ -10,25 +10,42 @@ The script also saves the parsed calendar events to a PostgreSQL database for ba
 and easier retrieval.
 """
 
+import asyncio
+import functools
+import hashlib
+import itertools
 import json
 import logging
 import logging.handlers
 import os
+import random
+import re
 import sys
-import yaml
+import tempfile
 import time
+import yaml
 import glob
 from datetime import datetime
 from pathlib import Path
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI
+
+# Prefer the libyaml based loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+from voice_calender import json_utils
 
 # Import database utilities
 from voice_calender.db_utils.db_manager import (
     initialize_db, 
     save_calendar_event,
-    close_all_connections
+    save_calendar_events_bulk
 )
-from voice_calender.db_utils.save_event_helper import save_event_flexible
+from voice_calender.db_utils.save_event_helper import validate_and_complete_event
+from voice_calender.db_utils.event_models import CalendarEvent
 
 # Initialize paths - handling both frozen (PyInstaller) and regular Python execution
 if getattr(sys, 'frozen', False):
@@ -46,49 +63,126 @@ CONFIG_DIR = PROJECT_ROOT / "project_modules_configs" / "config_agent_parse_entr
 CONFIG_PATH = CONFIG_DIR / "agent_parse_entry_config.json"
 OPENAI_CONFIG_PATH = CONFIG_DIR / "openai_config.json"
 PROMPTS_PATH = CONFIG_DIR / "prompts.yaml"
+PROMPTS_CACHE_PATH = CONFIG_DIR / "prompts.yaml.cache.json"
 LOG_DIR = SCRIPT_DIR / "logs"
 
+# Cached assistant responses, keyed by content hash
+RESPONSE_CACHE_DIR = LOG_DIR / "response_cache"
+
+# Marker created next to a transcription once it has been parsed
+DONE_MARKER_SUFFIX = ".done"
+
+# Assistant run polling: exponential backoff with jitter (seconds)
+RUN_POLL_INITIAL_DELAY = 0.2
+RUN_POLL_BACKOFF = 1.7
+RUN_POLL_MAX_DELAY = 2.0
+RUN_POLL_JITTER = 0.05
+
+# Attempts per entry when the configured assistant has to be replaced
+MAX_ASSISTANT_ATTEMPTS = 3
+
+# Patterns for extracting JSON from assistant responses
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*([\s\S]*?)\s*```')
+_CURLY_RE = re.compile(r'({[\s\S]*})')
+
 # Create log directory if it doesn't exist
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 
 # Initialize logger
 logger = logging.getLogger("parse_entry")
 
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Sequence number for JSON output filenames
+_output_counter = itertools.count()
+
+# Timestamp format for the OpenAI usage log
+USAGE_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+# Shared async OpenAI client and the event loop it belongs to
+_client = None
+_client_loop = None
+
+@functools.lru_cache(maxsize=1)
 def load_config():
     """Load configuration from JSON file"""
     try:
-        with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return json_utils.load_file(CONFIG_PATH)
     except Exception as e:
         logger.error(f"Error loading configuration: {str(e)}")
         sys.exit(1)
 
+@functools.lru_cache(maxsize=1)
 def load_openai_config():
     """Load OpenAI configuration from JSON file"""
     try:
-        with open(OPENAI_CONFIG_PATH, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return json_utils.load_file(OPENAI_CONFIG_PATH)
     except Exception as e:
         logger.error(f"Error loading OpenAI configuration: {str(e)}")
         sys.exit(1)
 
+@functools.lru_cache(maxsize=1)
 def load_prompts():
-    """Load prompt templates from YAML file"""
+    """
+    Load prompt templates from YAML file.
+    The parsed form is cached in a JSON sidecar which is used instead of the
+    YAML as long as it is not older than prompts.yaml.
+    """
     try:
+        try:
+            if PROMPTS_CACHE_PATH.stat().st_mtime >= PROMPTS_PATH.stat().st_mtime:
+                return json_utils.load_file(PROMPTS_CACHE_PATH).get('prompts', {})
+        except (OSError, ValueError):
+            # Missing or unreadable sidecar, fall back to the YAML
+            pass
+        
         with open(PROMPTS_PATH, 'r', encoding='utf-8') as f:
-            prompts_data = yaml.safe_load(f)
-            return prompts_data.get('prompts', {})
+            prompts_data = yaml.load(f, Loader=YamlLoader)
+        
+        try:
+            json_utils.dump_file(prompts_data, PROMPTS_CACHE_PATH, indent=False)
+        except OSError as e:
+            logger.warning(f"Could not write prompts cache {PROMPTS_CACHE_PATH}: {str(e)}")
+        
+        return prompts_data.get('prompts', {})
     except Exception as e:
         logger.error(f"Error loading prompt templates: {str(e)}")
         sys.exit(1)
 
+def _update_openai_config(openai_config, mutator):
+    """
+    Apply a change to the OpenAI settings, write them back to disk and
+    invalidate the cached configuration so later loads see the new state
+    
+    Args:
+        openai_config (dict): The OpenAI configuration to update in place
+        mutator (callable): Function receiving the 'openai_config' section
+    """
+    mutator(openai_config['openai_config'])
+    json_utils.dump_file(openai_config, OPENAI_CONFIG_PATH)
+    load_openai_config.cache_clear()
+
 def setup_logging(config):
     """Setup logging based on configuration"""
     log_config = config.get("logging", {})
-    log_level = getattr(logging, log_config.get("log_level", "INFO"))
+    log_level = getattr(logging, str(log_config.get("log_level", "INFO")).upper(), logging.INFO)
     
     logger.setLevel(log_level)
     
+    # Records are handled here only, not again by the root logger's handlers
+    logger.propagate = False
+    
+    # Handlers are attached once per process; later calls only update the level
+    if logger.handlers:
+        for handler in logger.handlers:
+            handler.setLevel(log_level)
+        return
+    
     # Set up console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(log_level)
@@ -141,7 +235,8 @@ def setup_logging(config):
 
 def get_transcription_files(transcription_dir):
     """
-    Get transcription files from the specified directory
+    Get transcription files from the specified directory.
+    Zero-byte files and files with a .done marker from an earlier run are skipped.
     
     Args:
         transcription_dir (str): Directory containing transcription files
@@ -150,25 +245,119 @@ def get_transcription_files(transcription_dir):
         list: List of transcription file paths
     """
     try:
-        transcription_path = Path(transcription_dir)
-        if not transcription_path.exists():
+        if not Path(transcription_dir).exists():
             logger.error(f"Transcription directory does not exist: {transcription_dir}")
             return []
-            
-        # Look for text files in the directory
+        
+        # Single directory pass; DirEntry caches stat results, so empty files
+        # are skipped without opening them
         # This assumes that transcription files have a .txt extension
-        transcript_files = list(transcription_path.glob("*.txt"))
+        transcript_files = []
+        transcript_stems = set()
+        done_stems = set()
+        with os.scandir(transcription_dir) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                if entry.name.endswith('.txt'):
+                    transcript_stems.add(entry.name[:-len('.txt')])
+                    if entry.stat().st_size > 0:
+                        transcript_files.append(Path(entry.path))
+                elif entry.name.endswith(DONE_MARKER_SUFFIX):
+                    done_stems.add(entry.name[:-len(DONE_MARKER_SUFFIX)])
+        
+        # Remove markers left behind after their transcription was deleted
+        for stem in done_stems - transcript_stems:
+            try:
+                os.remove(os.path.join(transcription_dir, stem + DONE_MARKER_SUFFIX))
+            except OSError as e:
+                logger.warning(f"Could not remove stale marker for {stem}: {str(e)}")
+        
+        pending_files = [f for f in transcript_files if f.stem not in done_stems]
+        skipped = len(transcript_files) - len(pending_files)
+        if skipped:
+            logger.info(f"Skipping {skipped} already processed transcription files")
         
-        if not transcript_files:
+        if not pending_files:
             logger.warning(f"No transcription files found in {transcription_dir}")
             return []
             
-        logger.info(f"Found {len(transcript_files)} transcription files")
-        return transcript_files
+        logger.info(f"Found {len(pending_files)} transcription files")
+        return pending_files
     except Exception as e:
         logger.error(f"Error getting transcription files: {str(e)}")
         return []
 
+def mark_transcription_done(file_path):
+    """
+    Create the .done marker that stops a transcription from being parsed again
+    
+    Args:
+        file_path (str): Path to the transcription file
+    """
+    try:
+        Path(file_path).with_suffix(DONE_MARKER_SUFFIX).touch()
+    except OSError as e:
+        logger.warning(f"Could not mark {file_path} as processed: {str(e)}")
+
+def _response_cache_path(entry_content, prompt_template, openai_config):
+    """
+    Get the cache file for a transcription, keyed by a hash of the content,
+    prompt template and model so a change to any of them is a cache miss
+    """
+    model = openai_config['openai_config']['model']
+    key = hashlib.sha256(
+        entry_content.encode('utf-8') + prompt_template.encode('utf-8') + model.encode('utf-8')
+    ).hexdigest()
+    return RESPONSE_CACHE_DIR / f"{key}.json"
+
+def get_cached_response(entry_content, prompt_template, openai_config):
+    """
+    Get a cached assistant response for an identical transcription
+    
+    Args:
+        entry_content (str): The transcribed entry content
+        prompt_template (str): The prompt template used for the entry
+        openai_config (dict): The OpenAI configuration
+        
+    Returns:
+        str: The cached response, or None if missing or older than the TTL
+    """
+    ttl = openai_config['openai_config'].get('response_cache_ttl_seconds', 0)
+    if not ttl:
+        return None
+    
+    cache_path = _response_cache_path(entry_content, prompt_template, openai_config)
+    try:
+        if time.time() - cache_path.stat().st_mtime > ttl:
+            return None
+        return json_utils.load_file(cache_path).get("response")
+    except (OSError, ValueError):
+        return None
+
+def store_cached_response(entry_content, prompt_template, openai_config, response):
+    """
+    Cache an assistant response, writing it atomically
+    
+    Args:
+        entry_content (str): The transcribed entry content
+        prompt_template (str): The prompt template used for the entry
+        openai_config (dict): The OpenAI configuration
+        response (str): The assistant response to cache
+    """
+    if not openai_config['openai_config'].get('response_cache_ttl_seconds', 0):
+        return
+    
+    cache_path = _response_cache_path(entry_content, prompt_template, openai_config)
+    try:
+        RESPONSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=RESPONSE_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(json_utils.dumps({"response": response}))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not write response cache {cache_path}: {str(e)}")
+
 def load_transcription(file_path):
     """
     Load transcription from a file
@@ -187,7 +376,218 @@ def load_transcription(file_path):
         logger.error(f"Error loading transcription from {file_path}: {str(e)}")
         return None
 
-def process_with_openai_assistant(entry_content, prompt_template, openai_config, prompts=None):
+def get_client(openai_config):
+    """
+    Get the shared async OpenAI client, creating it on first use.
+    The client's connection pool is bound to the event loop it was created in,
+    so a new client is built when called from a different loop.
+    
+    Args:
+        openai_config (dict): The OpenAI configuration
+        
+    Returns:
+        AsyncOpenAI: Configured async client
+    """
+    global _client, _client_loop
+    
+    loop = asyncio.get_running_loop()
+    if _client is not None and _client_loop is loop:
+        return _client
+    
+    config = openai_config['openai_config']
+    api_key = config['api_key'] or os.environ.get('OPENAI_API_KEY')
+    
+    if not api_key:
+        logger.error("No OpenAI API key found. Set it in the config file or as an environment variable.")
+        raise ValueError("No OpenAI API key found. Set it in the config file or as an environment variable.")
+    
+    _client = AsyncOpenAI(
+        api_key=api_key,
+        http_client=httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=httpx.Timeout(600.0, connect=5.0)
+        )
+    )
+    _client_loop = loop
+    return _client
+
+async def close_client():
+    """Close the shared async OpenAI client if one is open"""
+    global _client, _client_loop
+    
+    if _client is not None:
+        try:
+            await _client.close()
+        except Exception as e:
+            logger.warning(f"Error closing OpenAI client: {str(e)}")
+    _client = None
+    _client_loop = None
+
+async def ensure_assistant(client, openai_config, prompts=None):
+    """
+    Verify the configured assistant exists, creating a new one if needed
+    
+    Args:
+        client (AsyncOpenAI): The async OpenAI client
+        openai_config (dict): The OpenAI configuration
+        prompts (dict): Dictionary of prompts loaded from YAML
+        
+    Returns:
+        str: The assistant ID
+    """
+    config = openai_config['openai_config']
+    
+    # Check if we have a saved assistant_id in the config
+    assistant_id = config.get('assistant_id', None)
+    
+    if assistant_id:
+        # Verify assistant exists
+        try:
+            await client.beta.assistants.retrieve(assistant_id)
+            logger.info(f"Using existing Assistant with ID: {assistant_id}")
+            return assistant_id
+        except Exception as e:
+            error_msg = str(e)
+            if "No assistant found" in error_msg:
+                logger.error(f"Assistant ID {assistant_id} no longer exists on OpenAI server: {e}")
+                # Remove the invalid assistant_id from config
+                logger.info("Removing invalid assistant_id from config")
+                _update_openai_config(openai_config, lambda c: c.pop('assistant_id', None))
+            else:
+                # For other errors, propagate them
+                raise
+    
+    # Create a new assistant if we don't have one
+    logger.info("Creating new OpenAI Assistant for parsing calendar entries")
+    
+    # Get assistant instructions from prompts config
+    if not prompts:
+        logger.error("Prompts dictionary is required for assistant creation")
+        raise ValueError("Prompts dictionary is required for assistant creation")
+        
+    assistant_instructions = get_prompt_template(prompts, "assistant_instructions")
+    
+    # Get tools configuration from config
+    tools = config.get('tools', [{"type": "file_search"}])
+    logger.info(f"Creating assistant with tools: {tools}")
+    
+    assistant = await client.beta.assistants.create(
+        name="Calendar Entry Parser",
+        instructions=assistant_instructions,
+        tools=tools,
+        model=config['model']
+    )
+    assistant_id = assistant.id
+    
+    # Add the assistant_id to the config for future use
+    _update_openai_config(openai_config, lambda c: c.update(assistant_id=assistant_id))
+    
+    logger.info(f"Assistant created with ID: {assistant_id}")
+    return assistant_id
+
+async def ensure_thread(client, openai_config):
+    """
+    Get the persisted thread, rotating it when older than the retention period
+    
+    Args:
+        client (AsyncOpenAI): The async OpenAI client
+        openai_config (dict): The OpenAI configuration
+        
+    Returns:
+        str: The thread ID
+    """
+    config = openai_config['openai_config']
+    
+    # Check if we have a saved thread_id in the config
+    thread_id = config.get('thread_id', None)
+    
+    # Check if thread needs to be rotated based on creation date
+    thread_needs_rotation = False
+    if thread_id:
+        try:
+            # Get thread creation time
+            thread = await client.beta.threads.retrieve(thread_id)
+            thread_created_at = datetime.fromtimestamp(thread.created_at)
+            days_since_creation = (datetime.now() - thread_created_at).days
+            
+            # Check if thread is older than retention period
+            retention_days = config.get('thread_retention_days', 30)
+            if days_since_creation > retention_days:
+                logger.info(f"Thread is {days_since_creation} days old (retention: {retention_days} days). Creating new thread.")
+                thread_needs_rotation = True
+            else:
+                logger.info(f"Using existing thread (age: {days_since_creation} days, retention: {retention_days} days)")
+        except Exception as e:
+            error_msg = str(e)
+            if "No thread found" in error_msg:
+                logger.error(f"Thread ID {thread_id} no longer exists on OpenAI server: {e}")
+                # Remove the invalid thread_id from config
+                logger.info("Removing invalid thread_id from config")
+                def drop_thread(c):
+                    c.pop('thread_id', None)
+                    c.pop('thread_created_at', None)
+                _update_openai_config(openai_config, drop_thread)
+                
+                # Continue with a new thread
+                thread_needs_rotation = True
+                logger.info("Will create a new thread")
+            else:
+                logger.warning(f"Error checking thread age, will create new thread: {e}")
+                thread_needs_rotation = True
+    
+    # Create a new thread if needed
+    if not thread_id or thread_needs_rotation:
+        logger.info("Creating new thread for event parsing tasks")
+        thread = await client.beta.threads.create()
+        thread_id = thread.id
+        
+        # Add the thread_id and its creation time to the config for future use
+        _update_openai_config(openai_config, lambda c: c.update(
+            thread_id=thread_id,
+            thread_created_at=datetime.now().isoformat()
+        ))
+        
+        logger.info(f"Thread created with ID: {thread_id}")
+    else:
+        logger.info(f"Using existing thread with ID: {thread_id}")
+    
+    return thread_id
+
+async def replace_assistant(client, openai_config, prompts, stale_assistant_id, lock=None):
+    """
+    Replace an assistant the server no longer knows about
+    
+    With a shared lock, only the first concurrent caller creates the new
+    assistant; the others pick up the ID it saved to the config.
+    
+    Args:
+        client (AsyncOpenAI): The async OpenAI client
+        openai_config (dict): The OpenAI configuration
+        prompts (dict): Dictionary of prompts loaded from YAML
+        stale_assistant_id (str): Assistant ID that was reported as not found
+        lock (asyncio.Lock, optional): Serializes callers sharing openai_config
+        
+    Returns:
+        str: The assistant ID to use
+    """
+    if lock is not None:
+        async with lock:
+            return await replace_assistant(client, openai_config, prompts, stale_assistant_id)
+    
+    current_id = openai_config['openai_config'].get('assistant_id')
+    if current_id and current_id != stale_assistant_id:
+        # Already replaced by another caller
+        return current_id
+    
+    if current_id:
+        # Remove the invalid assistant_id from config so a new one is created
+        logger.info("Removing invalid assistant_id from config")
+        _update_openai_config(openai_config, lambda c: c.pop('assistant_id', None))
+    return await ensure_assistant(client, openai_config, prompts)
+
+async def process_with_openai_assistant(entry_content, prompt_template, openai_config, prompts=None, client=None,
+                                        thread_id=None, assistant_id=None, assistant_lock=None):
     """
     Process the entry content with OpenAI Assistants API to parse calendar events.
     
@@ -196,6 +596,12 @@ def process_with_openai_assistant(entry_content, prompt_template, openai_config,
         prompt_template (str): The prompt template to use
         openai_config (dict): The OpenAI configuration
         prompts (dict): Dictionary of prompts loaded from YAML
+        client (AsyncOpenAI): Async client to use, created from the config if omitted
+        thread_id (str): Thread to run on, the persisted thread is used if omitted
+        assistant_id (str): Assistant already resolved by the caller, looked up
+            with ensure_assistant if omitted
+        assistant_lock (asyncio.Lock): Shared by concurrent callers so only one
+            replaces a missing assistant
         
     Returns:
         str: The JSON response from the assistant
@@ -205,154 +611,56 @@ def process_with_openai_assistant(entry_content, prompt_template, openai_config,
         entry_content=entry_content
     )
     
-    # Set up the API client
     config = openai_config['openai_config']
-    api_key = config['api_key'] or os.environ.get('OPENAI_API_KEY')
-    
-    if not api_key:
-        logger.error("No OpenAI API key found. Set it in the config file or as an environment variable.")
-        raise ValueError("No OpenAI API key found. Set it in the config file or as an environment variable.")
     
-    client = OpenAI(api_key=api_key)
+    # Set up the API client
+    if client is None:
+        client = get_client(openai_config)
     
-    try:
-        # Check if we have a saved assistant_id in the config
-        assistant_id = config.get('assistant_id', None)
-        
-        # Create a new assistant if we don't have one
-        if not assistant_id:
-            logger.info("Creating new OpenAI Assistant for parsing calendar entries")
-            
-            # Get assistant instructions from prompts config
-            if not prompts:
-                logger.error("Prompts dictionary is required for assistant creation")
-                raise ValueError("Prompts dictionary is required for assistant creation")
-                
-            assistant_instructions = get_prompt_template(prompts, "assistant_instructions")
+    stale_assistant_id = None
+    for attempt in range(1, MAX_ASSISTANT_ATTEMPTS + 1):
+        try:
+            if stale_assistant_id:
+                assistant_id = await replace_assistant(
+                    client, openai_config, prompts, stale_assistant_id, assistant_lock
+                )
+                stale_assistant_id = None
+            elif not assistant_id:
+                assistant_id = await ensure_assistant(client, openai_config, prompts)
             
-            # Get tools configuration from config
-            tools = config.get('tools', [{"type": "file_search"}])
-            logger.info(f"Creating assistant with tools: {tools}")
+            if not thread_id:
+                thread_id = await ensure_thread(client, openai_config)
             
-            assistant = client.beta.assistants.create(
-                name="Calendar Entry Parser",
-                instructions=assistant_instructions,
-                tools=tools,
-                model=config['model']
+            # Add message to the thread with the entry content
+            logger.info(f"Adding message with entry content to thread {thread_id}")
+            await client.beta.threads.messages.create(
+                thread_id=thread_id,
+                role="user",
+                content=prompt
             )
-            assistant_id = assistant.id
-            
-            # Add the assistant_id to the config for future use
-            config['assistant_id'] = assistant_id
-            with open(OPENAI_CONFIG_PATH, 'w', encoding='utf-8') as f:
-                json.dump(openai_config, f, indent=2)
             
-            logger.info(f"Assistant created with ID: {assistant_id}")
-        else:
-            # Verify assistant exists
-            try:
-                client.beta.assistants.retrieve(assistant_id)
-                logger.info(f"Using existing Assistant with ID: {assistant_id}")
-            except Exception as e:
-                error_msg = str(e)
-                if "No assistant found" in error_msg:
-                    logger.error(f"Assistant ID {assistant_id} no longer exists on OpenAI server: {e}")
-                    # Remove the invalid assistant_id from config
-                    logger.info("Removing invalid assistant_id from config")
-                    config.pop('assistant_id', None)
-                    with open(OPENAI_CONFIG_PATH, 'w', encoding='utf-8') as f:
-                        json.dump(openai_config, f, indent=2)
-                    
-                    # Restart the process (recursive call after fixing config)
-                    logger.info("Restarting process with updated config")
-                    return process_with_openai_assistant(entry_content, prompt_template, openai_config, prompts)
-                else:
-                    # For other errors, propagate them
-                    raise
-        
-        # Check if we have a saved thread_id in the config
-        thread_id = config.get('thread_id', None)
-        
-        # Check if thread needs to be rotated based on creation date
-        thread_needs_rotation = False
-        if thread_id:
-            try:
-                # Get thread creation time
-                thread = client.beta.threads.retrieve(thread_id)
-                thread_created_at = datetime.fromtimestamp(thread.created_at)
-                days_since_creation = (datetime.now() - thread_created_at).days
-                
-                # Check if thread is older than retention period
-                retention_days = config.get('thread_retention_days', 30)
-                if days_since_creation > retention_days:
-                    logger.info(f"Thread is {days_since_creation} days old (retention: {retention_days} days). Creating new thread.")
-                    thread_needs_rotation = True
-                else:
-                    logger.info(f"Using existing thread (age: {days_since_creation} days, retention: {retention_days} days)")
-            except Exception as e:
-                error_msg = str(e)
-                if "No thread found" in error_msg:
-                    logger.error(f"Thread ID {thread_id} no longer exists on OpenAI server: {e}")
-                    # Remove the invalid thread_id from config
-                    logger.info("Removing invalid thread_id from config")
-                    config.pop('thread_id', None)
-                    if 'thread_created_at' in config:
-                        config.pop('thread_created_at', None)
-                    with open(OPENAI_CONFIG_PATH, 'w', encoding='utf-8') as f:
-                        json.dump(openai_config, f, indent=2)
-                    
-                    # Continue with a new thread
-                    thread_needs_rotation = True
-                    logger.info("Will create a new thread")
-                else:
-                    logger.warning(f"Error checking thread age, will create new thread: {e}")
-                    thread_needs_rotation = True
-        
-        # Create a new thread if needed
-        if not thread_id or thread_needs_rotation:
-            logger.info("Creating new thread for event parsing tasks")
-            thread = client.beta.threads.create()
-            thread_id = thread.id
-            
-            # Add the thread_id to the config for future use
-            config['thread_id'] = thread_id
-            # Store thread creation time
-            config['thread_created_at'] = datetime.now().isoformat()
-            with open(OPENAI_CONFIG_PATH, 'w', encoding='utf-8') as f:
-                json.dump(openai_config, f, indent=2)
-            
-            logger.info(f"Thread created with ID: {thread_id}")
-        else:
-            logger.info(f"Using existing thread with ID: {thread_id}")
-        
-        # Add message to the thread with the entry content
-        logger.info("Adding message with entry content to thread")
-        client.beta.threads.messages.create(
-            thread_id=thread_id,
-            role="user",
-            content=prompt
-        )
-        
-        # Run the assistant on the thread
-        logger.info("Running assistant to parse calendar entry")
-        try:
-            run = client.beta.threads.runs.create(
+            # Run the assistant on the thread
+            logger.info("Running assistant to parse calendar entry")
+            run = await client.beta.threads.runs.create(
                 thread_id=thread_id,
                 assistant_id=assistant_id
             )
             
             # Poll for completion
-            run_status = client.beta.threads.runs.retrieve(
+            run_status = await client.beta.threads.runs.retrieve(
                 thread_id=thread_id,
                 run_id=run.id
             )
             
-            # Wait for run to complete
+            # Wait for run to complete, backing off between polls
             logger.info("Waiting for assistant to complete processing")
+            delay = RUN_POLL_INITIAL_DELAY
             while run_status.status not in ["completed", "failed", "cancelled", "expired"]:
-                logger.debug(f"Run status: {run_status.status}")
-                time.sleep(1)
-                run_status = client.beta.threads.runs.retrieve(
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Run status: %s", run_status.status)
+                await asyncio.sleep(delay + random.uniform(0, RUN_POLL_JITTER))
+                delay = min(delay * RUN_POLL_BACKOFF, RUN_POLL_MAX_DELAY)
+                run_status = await client.beta.threads.runs.retrieve(
                     thread_id=thread_id,
                     run_id=run.id
                 )
@@ -361,64 +669,59 @@ def process_with_openai_assistant(entry_content, prompt_template, openai_config,
                 logger.error(f"Assistant run failed with status: {run_status.status}")
                 raise ValueError(f"Assistant run failed with status: {run_status.status}")
             
-            # Get the messages
+            # Get only the newest message, which is the assistant's reply to this run
             logger.info("Retrieving assistant's response")
-            messages = client.beta.threads.messages.list(
-                thread_id=thread_id
+            messages = await client.beta.threads.messages.list(
+                thread_id=thread_id,
+                limit=1,
+                order='desc'
             )
             
-            # Get the latest assistant response
-            for message in messages.data:
-                if message.role == "assistant":
-                    # Extract the content from the message
-                    content = message.content[0].text.value
-                    
-                    # Log usage statistics if available
-                    if config['save_usage_stats'] and hasattr(run_status, 'usage'):
-                        usage = run_status.usage
-                        # Handle usage data correctly - usage is an object, not a dictionary
-                        try:
-                            usage_log = f"{datetime.now().isoformat()} | {config['model']} | " \
-                                       f"Input: {usage.prompt_tokens if hasattr(usage, 'prompt_tokens') else 0} | " \
-                                       f"Output: {usage.completion_tokens if hasattr(usage, 'completion_tokens') else 0} | " \
-                                       f"Total: {usage.total_tokens if hasattr(usage, 'total_tokens') else 0}"
-                            
-                            openai_logger = logging.getLogger('openai_usage')
-                            openai_logger.info(usage_log)
-                        except Exception as e:
-                            logger.warning(f"Error logging usage statistics: {e}")
-                    
-                    return content
+            if not messages.data or messages.data[0].role != "assistant":
+                logger.error("No assistant response found in the thread")
+                raise ValueError("No assistant response found in the thread")
             
-            logger.error("No assistant response found in the thread")
-            raise ValueError("No assistant response found in the thread")
+            # Extract the content from the message
+            content = messages.data[0].content[0].text.value
+            
+            # Log usage statistics if available
+            openai_logger = logging.getLogger('openai_usage')
+            if config['save_usage_stats'] and hasattr(run_status, 'usage') and openai_logger.isEnabledFor(logging.INFO):
+                usage = run_status.usage
+                # Handle usage data correctly - usage is an object, not a dictionary
+                try:
+                    openai_logger.info(
+                        "%s | %s | Input: %s | Output: %s | Total: %s",
+                        time.strftime(USAGE_TIME_FORMAT), config['model'],
+                        getattr(usage, 'prompt_tokens', 0),
+                        getattr(usage, 'completion_tokens', 0),
+                        getattr(usage, 'total_tokens', 0)
+                    )
+                except Exception as e:
+                    logger.warning(f"Error logging usage statistics: {e}")
+            
+            return content
             
         except Exception as e:
-            error_msg = str(e)
-            if "No assistant found" in error_msg:
+            if "No assistant found" in str(e) and attempt < MAX_ASSISTANT_ATTEMPTS:
                 logger.error(f"Assistant ID {assistant_id} not found: {e}")
-                # Remove the invalid assistant_id from config
-                logger.info("Removing invalid assistant_id from config")
-                config.pop('assistant_id', None)
-                with open(OPENAI_CONFIG_PATH, 'w', encoding='utf-8') as f:
-                    json.dump(openai_config, f, indent=2)
-                
-                # Restart the process (recursive call after fixing config)
-                logger.info("Restarting process with updated config")
-                return process_with_openai_assistant(entry_content, prompt_template, openai_config, prompts)
-            else:
-                logger.error(f"Error processing with OpenAI Assistant: {e}")
-                raise ValueError(f"Error processing with OpenAI Assistant: {e}")
-    
-    except Exception as e:
-        logger.error(f"Error processing with OpenAI Assistant: {e}")
-        raise ValueError(f"Error processing with OpenAI Assistant: {e}")
+                # The next attempt replaces it, once for all concurrent callers
+                stale_assistant_id = assistant_id
+                logger.info(f"Retrying with updated config (attempt {attempt + 1} of {MAX_ASSISTANT_ATTEMPTS})")
+                continue
+            
+            logger.error(f"Error processing with OpenAI Assistant: {e}")
+            raise ValueError(f"Error processing with OpenAI Assistant: {e}")
 
 def get_prompt_template(prompts, name):
     """
     Get a specific prompt template by name from the prompts dictionary.
     Raises an exception if the prompt is not found to ensure data precision.
     
+    A prompt is either a single 'template' or a 'static_prefix' followed by a
+    'dynamic_suffix' holding the placeholders. Keeping the static text first
+    and unchanged lets the provider's prompt cache reuse it between requests.
+    
     Args:
         prompts (dict): Dictionary of prompts loaded from YAML
         name (str): Name of the prompt template to retrieve
@@ -439,6 +742,8 @@ def get_prompt_template(prompts, name):
         raise ValueError(f"Prompt '{name}' not found in prompts configuration")
     
     template = prompt_data.get("template")
+    if not template and prompt_data.get("static_prefix"):
+        template = prompt_data["static_prefix"] + prompt_data.get("dynamic_suffix", "")
     if not template:
         logger.error(f"Template not found for prompt '{name}'")
         raise ValueError(f"Template not found for prompt '{name}'")
@@ -461,9 +766,9 @@ def save_json_output(json_data, output_dir):
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
-        # Generate a timestamp for the filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = output_path / f"calendar_event_{timestamp}.json"
+        # Millisecond timestamp plus a process-wide counter, so entries saved
+        # concurrently or within the same millisecond never collide
+        output_file = output_path / f"calendar_event_{int(time.time() * 1000)}_{next(_output_counter)}.json"
         
         # Extract valid JSON from the response
         # The assistant might return formatted code blocks or extra text
@@ -473,9 +778,9 @@ def save_json_output(json_data, output_dir):
             logger.error("Failed to extract valid JSON from assistant response")
             return None, None
         
-        # Write the JSON to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(json_object, f, indent=2)
+        # Write the JSON to file; atomically, since the scheduler may pick up
+        # *.json files from this directory at any time
+        json_utils.dump_file(json_object, output_file, atomic=True)
             
         logger.info(f"Saved JSON output to {output_file}")
         return str(output_file), json_object
@@ -495,30 +800,30 @@ def extract_json_from_text(text):
         dict: Parsed JSON object, or None if parsing fails
     """
     try:
-        # First try to parse the entire text as JSON
-        try:
-            return json.loads(text)
-        except json.JSONDecodeError:
-            # If that fails, look for JSON within code blocks
-            pass
+        # First try to parse the entire text as JSON, unless it obviously isn't
+        if text.lstrip().startswith(('{', '[')):
+            try:
+                return json_utils.loads(text)
+            except json.JSONDecodeError:
+                # If that fails, look for JSON within code blocks
+                pass
             
         # Look for JSON within markdown code blocks
         # Match content between ```json and ``` or between ``` and ```
-        import re
-        json_block_matches = re.findall(r'```(?:json)?\s*([\s\S]*?)\s*```', text)
+        json_block_matches = _JSON_FENCE_RE.findall(text)
         
         for match in json_block_matches:
             try:
-                return json.loads(match)
+                return json_utils.loads(match)
             except json.JSONDecodeError:
                 continue
                 
         # If we still haven't found valid JSON, look for content between { and }
         # This is a more aggressive approach and might catch unintended content
-        curly_brace_match = re.search(r'({[\s\S]*})', text)
+        curly_brace_match = _CURLY_RE.search(text)
         if curly_brace_match:
             try:
-                return json.loads(curly_brace_match.group(1))
+                return json_utils.loads(curly_brace_match.group(1))
             except json.JSONDecodeError:
                 pass
                 
@@ -541,8 +846,7 @@ def get_transcription_dir():
             logger.error(f"Transcribe configuration file not found at {transcribe_config_path}")
             return None
             
-        with open(transcribe_config_path, 'r', encoding='utf-8') as f:
-            transcribe_config = json.load(f)
+        transcribe_config = json_utils.load_file(transcribe_config_path)
             
         # Get transcriptions directory
         transcriptions_dir = transcribe_config.get("transcriptions_dir")
@@ -566,8 +870,20 @@ def save_to_database(event_data):
         int: Database record ID if successful, None otherwise
     """
     try:
-        # Use the flexible event saving helper
-        event_id = save_event_flexible(event_data)
+        # Fill in missing summary/start/end the same way the flexible helper does
+        valid, completed_data, error = validate_and_complete_event(event_data)
+        if not valid:
+            logger.error(f"Invalid event data: {error}")
+            return None
+        
+        # Extract and type-check all fields in one pass
+        try:
+            event = CalendarEvent.from_dict(completed_data)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Malformed calendar event data: {str(e)}")
+            return None
+        
+        event_id = save_calendar_event(**event.to_db_kwargs())
         
         if event_id:
             logger.info(f"Successfully saved calendar event to database with ID: {event_id}")
@@ -579,9 +895,252 @@ def save_to_database(event_data):
         logger.error(f"Error saving calendar event to database: {str(e)}")
         return None
 
-def parse_calendar_entries():
+def save_events_to_database(events):
     """
-    Main function to parse calendar entries from transcriptions
+    Save parsed calendar events to the database in a single transaction
+    
+    Args:
+        events (list): Parsed JSON objects, each an event or a list of events
+        
+    Returns:
+        list: Database record IDs of the saved events
+    """
+    rows = []
+    for event_data in events:
+        for item in (event_data if isinstance(event_data, list) else [event_data]):
+            valid, completed_data, error = validate_and_complete_event(item)
+            if not valid:
+                logger.error(f"Invalid event data: {error}")
+                continue
+            try:
+                rows.append(CalendarEvent.from_dict(completed_data).to_db_kwargs())
+            except (TypeError, ValueError) as e:
+                logger.error(f"Malformed calendar event data: {str(e)}")
+    
+    if not rows:
+        return []
+    
+    event_ids = save_calendar_events_bulk(rows)
+    if event_ids:
+        logger.info(f"Saved {len(event_ids)} calendar events to database")
+    else:
+        logger.error("Failed to save calendar events to database")
+    return event_ids
+
+async def parse_entries_concurrently(client, entries, json_output_dir, openai_config, prompts,
+                                     parse_entry_template, max_concurrency, parsed_events=None):
+    """
+    Parse transcription files through the Assistants API, several at a time
+    
+    Args:
+        client (AsyncOpenAI): The async OpenAI client
+        entries (list): (file_path, content) tuples of loaded transcriptions
+        json_output_dir (str): Directory to save the JSON files
+        openai_config (dict): The OpenAI configuration
+        prompts (dict): Dictionary of prompts loaded from YAML
+        parse_entry_template (str): The parse entry prompt template
+        max_concurrency (int): Number of files sent to OpenAI at the same time
+        parsed_events (list, optional): Collects the parsed JSON objects
+        
+    Returns:
+        int: Number of successfully processed files
+    """
+    try:
+        # Resolve the assistant once so concurrent files don't each look it up or create one
+        assistant_id = await ensure_assistant(client, openai_config, prompts)
+        assistant_lock = asyncio.Lock()
+        # A thread only accepts one active run, so the persisted thread is
+        # only shared when files are processed one at a time
+        shared_thread_id = await ensure_thread(client, openai_config) if max_concurrency == 1 else None
+    except Exception as e:
+        logger.error(f"Error preparing OpenAI Assistant: {str(e)}")
+        return 0
+    
+    semaphore = asyncio.Semaphore(max_concurrency)
+    logger.info(f"Processing {len(entries)} files with max concurrency {max_concurrency}")
+    
+    async def process_file(file_path, content):
+        async with semaphore:
+            logger.info(f"Processing transcription file: {file_path}")
+            
+            thread_id = shared_thread_id
+            try:
+                if not thread_id:
+                    thread = await client.beta.threads.create()
+                    thread_id = thread.id
+                
+                # Process with OpenAI Assistant to parse calendar entry
+                response = await process_with_openai_assistant(
+                    content, parse_entry_template, openai_config, prompts, client, thread_id,
+                    assistant_id=assistant_id, assistant_lock=assistant_lock
+                )
+                
+                if not response:
+                    logger.warning(f"No response from assistant for {file_path}")
+                    return False
+                
+                # Save JSON output to file and get the parsed object
+                output_file, json_object = save_json_output(response, json_output_dir)
+                
+                if output_file and json_object:
+                    logger.info(f"Successfully processed {file_path} and saved to {output_file}")
+                    store_cached_response(content, parse_entry_template, openai_config, response)
+                    mark_transcription_done(file_path)
+                    if parsed_events is not None:
+                        parsed_events.append(json_object)
+                    return True
+                
+                logger.warning(f"Failed to save output for {file_path}")
+                return False
+                
+            except Exception as e:
+                logger.error(f"Error processing {file_path}: {str(e)}")
+                return False
+            finally:
+                # Per-file threads are single use
+                if thread_id and thread_id != shared_thread_id:
+                    try:
+                        await client.beta.threads.delete(thread_id)
+                    except Exception as e:
+                        logger.warning(f"Error deleting thread {thread_id}: {str(e)}")
+    
+    results = await asyncio.gather(
+        *(process_file(file_path, content) for file_path, content in entries),
+        return_exceptions=True
+    )
+    
+    for (file_path, _), result in zip(entries, results):
+        if isinstance(result, Exception):
+            logger.error(f"Error processing {file_path}: {str(result)}")
+    
+    return sum(1 for result in results if result is True)
+
+async def parse_calendar_entries_batch(client, entries, json_output_dir, openai_config, prompts,
+                                       parse_entry_template, poll_interval=60, parsed_events=None):
+    """
+    Parse transcription files with a single OpenAI Batch API job.
+    Batch requests are billed at half price but may take up to 24 hours,
+    so this path is meant for backlog runs rather than interactive use.
+    
+    Args:
+        client (AsyncOpenAI): The async OpenAI client
+        entries (list): (file_path, content) tuples of loaded transcriptions
+        json_output_dir (str): Directory to save the JSON files
+        openai_config (dict): The OpenAI configuration
+        prompts (dict): Dictionary of prompts loaded from YAML
+        parse_entry_template (str): The parse entry prompt template
+        poll_interval (int): Seconds between batch status checks
+        parsed_events (list, optional): Collects the parsed JSON objects
+        
+    Returns:
+        int: Number of successfully processed files
+    """
+    config = openai_config['openai_config']
+    
+    try:
+        assistant_instructions = get_prompt_template(prompts, "assistant_instructions")
+    except ValueError as e:
+        logger.error(f"Error getting assistant instructions: {str(e)}")
+        return 0
+    
+    # Build one chat completion request per transcription file
+    request_lines = []
+    entries_by_id = {}
+    for file_path, content in entries:
+        entries_by_id[Path(file_path).stem] = (file_path, content)
+        request_lines.append(json_utils.dumps({
+            "custom_id": Path(file_path).stem,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": config['model'],
+                "messages": [
+                    {"role": "system", "content": assistant_instructions},
+                    {"role": "user", "content": parse_entry_template.format(entry_content=content)}
+                ]
+            }
+        }))
+    
+    try:
+        batch_input = ("\n".join(request_lines) + "\n").encode('utf-8')
+        input_file = await client.files.create(file=("calendar_entries_batch.jsonl", batch_input), purpose="batch")
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info(f"Submitted batch {batch.id} with {len(request_lines)} requests")
+        
+        # Wait for the batch to finish
+        while batch.status not in ["completed", "failed", "cancelled", "expired"]:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Batch status: %s", batch.status)
+            await asyncio.sleep(poll_interval)
+            batch = await client.batches.retrieve(batch.id)
+        
+        if batch.status != "completed" or not batch.output_file_id:
+            logger.error(f"Batch {batch.id} finished with status: {batch.status}")
+            return 0
+        
+        if batch.error_file_id:
+            logger.warning(f"Batch {batch.id} has failed requests, see file {batch.error_file_id}")
+        
+        output = await client.files.content(batch.output_file_id)
+    except Exception as e:
+        logger.error(f"Error running OpenAI batch: {str(e)}")
+        return 0
+    
+    success_count = 0
+    openai_logger = logging.getLogger('openai_usage')
+    
+    for line in output.text.splitlines():
+        if not line.strip():
+            continue
+        
+        try:
+            result = json_utils.loads(line)
+            custom_id = result.get("custom_id")
+            response = result.get("response") or {}
+            
+            if result.get("error") or response.get("status_code") != 200:
+                logger.error(f"Batch request {custom_id} failed: {result.get('error') or response.get('status_code')}")
+                continue
+            
+            body = response.get("body", {})
+            content = body["choices"][0]["message"]["content"]
+            
+            # Log usage statistics if available
+            usage = body.get("usage")
+            if config['save_usage_stats'] and usage and openai_logger.isEnabledFor(logging.INFO):
+                openai_logger.info(
+                    "%s | %s (batch) | Input: %s | Output: %s | Total: %s",
+                    time.strftime(USAGE_TIME_FORMAT), config['model'],
+                    usage.get('prompt_tokens', 0),
+                    usage.get('completion_tokens', 0),
+                    usage.get('total_tokens', 0)
+                )
+            
+            output_file, json_object = save_json_output(content, json_output_dir)
+            if output_file and json_object:
+                logger.info(f"Successfully processed {custom_id} and saved to {output_file}")
+                if custom_id in entries_by_id:
+                    file_path, entry_content = entries_by_id[custom_id]
+                    store_cached_response(entry_content, parse_entry_template, openai_config, content)
+                    mark_transcription_done(file_path)
+                if parsed_events is not None:
+                    parsed_events.append(json_object)
+                success_count += 1
+            else:
+                logger.warning(f"Failed to save output for {custom_id}")
+        except Exception as e:
+            logger.error(f"Error processing batch result: {str(e)}")
+    
+    return success_count
+
+async def parse_calendar_entries_async():
+    """
+    Parse calendar entries from transcriptions, processing files concurrently
+    or as a single batch job when batch_mode is enabled
     """
     config = load_config()
     setup_logging(config)
@@ -627,57 +1186,68 @@ def parse_calendar_entries():
         logger.error(f"Error getting parse entry prompt template: {str(e)}")
         return False
     
-    # Process each transcription file
-    success_count = 0
+    # Read all transcriptions up front so disk latency overlaps
+    contents = await asyncio.gather(
+        *(asyncio.to_thread(load_transcription, file_path) for file_path in transcription_files)
+    )
     
-    for file_path in transcription_files:
-        logger.info(f"Processing transcription file: {file_path}")
-        
-        # Load transcription content
-        content = load_transcription(file_path)
+    entries = []
+    for file_path, content in zip(transcription_files, contents):
         if not content:
             logger.warning(f"Failed to load content from {file_path}")
-            continue
-        
-        # Skip empty files
-        if not content.strip():
+        elif not content.strip():
+            # Skip empty files
             logger.warning(f"File {file_path} is empty, skipping")
-            continue
-        
-        try:
-            # Process with OpenAI Assistant to parse calendar entry
-            response = process_with_openai_assistant(content, parse_entry_template, openai_config, prompts)
-            
-            if not response:
-                logger.warning(f"No response from assistant for {file_path}")
-                continue
-            
-            # Save JSON output to file and get the parsed object
+        else:
+            entries.append((file_path, content))
+    
+    if not entries:
+        logger.warning("No transcription content to process")
+        return False
+    
+    # Reuse earlier parses of identical transcriptions instead of calling OpenAI
+    success_count = 0
+    parsed_events = []
+    pending_entries = []
+    for file_path, content in entries:
+        response = get_cached_response(content, parse_entry_template, openai_config)
+        if response is not None:
             output_file, json_object = save_json_output(response, json_output_dir)
-            
             if output_file and json_object:
-                logger.info(f"Successfully processed {file_path} and saved to {output_file}")
+                logger.info(f"Used cached response for {file_path} and saved to {output_file}")
+                mark_transcription_done(file_path)
+                parsed_events.append(json_object)
                 success_count += 1
-                
-                # Comment out database save to prevent duplicate entries
-                # This is now handled by app_calender_scheduler.py when processing JSON files
-                # event_id = save_to_database(json_object)
-                # if event_id:
-                #     db_success_count += 1
-                #     logger.info(f"Event saved to database with ID: {event_id}")
-                # else:
-                #     logger.warning(f"Failed to save event to database for {file_path}")
+                continue
+        pending_entries.append((file_path, content))
+    
+    if pending_entries:
+        try:
+            client = get_client(openai_config)
+        except ValueError:
+            return success_count > 0
+        
+        try:
+            if config.get("batch_mode", False):
+                success_count += await parse_calendar_entries_batch(
+                    client, pending_entries, json_output_dir, openai_config, prompts,
+                    parse_entry_template, config.get("batch_poll_interval_seconds", 60),
+                    parsed_events
+                )
             else:
-                logger.warning(f"Failed to save output for {file_path}")
-            
-        except Exception as e:
-            logger.error(f"Error processing {file_path}: {str(e)}")
+                # Number of files sent to OpenAI at the same time
+                max_concurrency = max(1, int(config.get("max_concurrency", 4)))
+                success_count += await parse_entries_concurrently(
+                    client, pending_entries, json_output_dir, openai_config, prompts,
+                    parse_entry_template, max_concurrency, parsed_events
+                )
+        finally:
+            await close_client()
     
-    # Clean up database connections
-    try:
-        close_all_connections()
-    except Exception as e:
-        logger.warning(f"Error closing database connections: {str(e)}")
+    # By default app_calender_scheduler.py saves events when it processes the
+    # JSON files; only write here when enabled, to prevent duplicate entries
+    if config.get("save_to_database", False) and parsed_events:
+        await asyncio.to_thread(save_events_to_database, parsed_events)
     
     if success_count > 0:
         logger.info(f"Successfully processed {success_count} of {len(transcription_files)} transcription files")
@@ -686,5 +1256,11 @@ def parse_calendar_entries():
         logger.warning("No transcription files were successfully processed")
         return False
 
+def parse_calendar_entries():
+    """
+    Main function to parse calendar entries from transcriptions
+    """
+    return asyncio.run(parse_calendar_entries_async())
+
 if __name__ == "__main__":
     parse_calendar_entries()
@@ -13,25 +13,55 @@ The scheduler runs at configured intervals and handles logging,
 error recovery, and state management.
 """
 
+import asyncio
+import atexit
+import importlib
 import logging
 import logging.handlers
-import json
 import os
+import queue
+import re
+import shutil
+import signal
 import sys
-import time
-import traceback
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 
 # Import voice calendar components
-from voice_calender.download_files_for_calender.download_files_for_calender import main as download_files_main
-from voice_calender.transcribe_audio_for_calender.transcribe_audio_for_calender import run_transcribe
-from voice_calender.agent_parse_entry_for_calender.agent_parse_entry_for_calender import parse_calendar_entries
-from voice_calender.insert_event_in_gcalendar.insert_event_in_gcalendar import GoogleCalendarManager
-from voice_calender.db_utils.db_manager import get_calendar_events_by_config_interval, initialize_db, close_all_connections, save_calendar_event
-from voice_calender.send_email.send_email import main as send_email_main
-from voice_calender.file_utils.delete_files import main as delete_files_main
+from voice_calender import json_utils
+
+def _lazy_import(module_name, attribute):
+    """
+    Return a callable that imports module_name.attribute on its first call.
+    
+    The pipeline stages pull in the Google, OpenAI and database client
+    libraries and load their configs at import time, so they are only
+    imported once the stage first runs.
+    """
+    target = None
+    
+    def call(*args, **kwargs):
+        nonlocal target
+        if target is None:
+            target = getattr(importlib.import_module(module_name), attribute)
+        return target(*args, **kwargs)
+    
+    call.__name__ = attribute
+    return call
+
+download_files_main = _lazy_import("voice_calender.download_files_for_calender.download_files_for_calender", "main")
+run_transcribe = _lazy_import("voice_calender.transcribe_audio_for_calender.transcribe_audio_for_calender", "run_transcribe")
+parse_calendar_entries = _lazy_import("voice_calender.agent_parse_entry_for_calender.agent_parse_entry_for_calender", "parse_calendar_entries")
+GoogleCalendarManager = _lazy_import("voice_calender.insert_event_in_gcalendar.insert_event_in_gcalendar", "GoogleCalendarManager")
+invalidate_calendar_service = _lazy_import("voice_calender.insert_event_in_gcalendar.insert_event_in_gcalendar", "invalidate_service")
+get_calendar_events_by_config_interval = _lazy_import("voice_calender.db_utils.db_manager", "get_calendar_events_by_config_interval")
+initialize_db = _lazy_import("voice_calender.db_utils.db_manager", "initialize_db")
+save_calendar_events_bulk = _lazy_import("voice_calender.db_utils.db_manager", "save_calendar_events_bulk")
+send_email_main = _lazy_import("voice_calender.send_email.send_email", "main")
+delete_files_main = _lazy_import("voice_calender.file_utils.delete_files", "main")
 
 # === Constants ===
 # Initialize paths - handling both frozen (PyInstaller) and regular Python execution
@@ -59,35 +89,67 @@ LOG_DIR = SCRIPT_DIR / 'logs'
 # Ensure log directory exists
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 
+def _config_candidates(config_subdir, config_name):
+    """Build the locations searched for a project config file, in order of preference."""
+    relative = Path("project_modules_configs") / config_subdir / config_name
+    return (
+        PROJECT_ROOT / relative,
+        Path(__file__).parent.parent / relative,
+        Path().absolute() / "src" / "voice_calender" / relative,
+        Path().absolute().parent / "src" / "voice_calender" / relative
+    )
+
+def _resolve_config_path(candidates):
+    """Return the first candidate that is an existing file, or None."""
+    for path in candidates:
+        if os.path.isfile(path):
+            return path
+    return None
+
+# Config file locations, resolved once since the layout doesn't change while running
+SCHEDULER_CONFIG_CANDIDATES = _config_candidates("config_app_calender_scheduler", "app_calender_scheduler_config.json")
+PARSE_CONFIG_CANDIDATES = _config_candidates("config_agent_parse_entry", "agent_parse_entry_config.json")
+
+SCHEDULER_CONFIG_PATH = _resolve_config_path(SCHEDULER_CONFIG_CANDIDATES)
+PARSE_CONFIG_PATH = _resolve_config_path(PARSE_CONFIG_CANDIDATES)
+
 # Initialize logger
 logger = logging.getLogger(__name__)
 
 # === Config Handling ===
+# Parsed config files keyed by path, with the (mtime, size) they were read at
+_CONFIG_CACHE = {}
+
+def _load_json_cached(path):
+    """
+    Load a JSON config file, reusing the parsed result while the file is unchanged.
+    
+    Args:
+        path (Path): Config file to load
+    
+    Returns:
+        dict: Parsed config; treat as read-only since it is shared between calls
+    """
+    st = path.stat()
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    
+    data = json_utils.load_file(path)
+    _CONFIG_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
 def load_config():
     """Load configuration from JSON file."""
-    # Try multiple possible paths
-    possible_config_paths = [
-        CONFIG_FILE,
-        Path(__file__).parent.parent / "project_modules_configs" / "config_app_calender_scheduler" / "app_calender_scheduler_config.json",
-        Path().absolute() / "src" / "voice_calender" / "project_modules_configs" / "config_app_calender_scheduler" / "app_calender_scheduler_config.json",
-        Path().absolute().parent / "src" / "voice_calender" / "project_modules_configs" / "config_app_calender_scheduler" / "app_calender_scheduler_config.json"
-    ]
-    
-    config_path = None
-    for path in possible_config_paths:
-        if path.exists():
-            config_path = path
-            print(f"Found scheduler config at: {config_path}")
-            break
-    
+    config_path = SCHEDULER_CONFIG_PATH
     if not config_path:
-        paths_tried = "\n".join([str(p) for p in possible_config_paths])
+        paths_tried = "\n".join([str(p) for p in SCHEDULER_CONFIG_CANDIDATES])
         print(f"Config file not found. Tried paths:\n{paths_tried}")
         sys.exit(1)
+    print(f"Found scheduler config at: {config_path}")
         
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = _load_json_cached(config_path)
         if "scheduler" not in config:
             raise ValueError("Missing 'scheduler' section in config file")
         return config
@@ -102,6 +164,61 @@ def validate_config(config):
         raise ValueError("Missing 'runs_per_day' in scheduler section")
     if not isinstance(scheduler["runs_per_day"], (int, float)):
         raise ValueError("runs_per_day must be a number")
+    EventProcessingSettings.from_config(config)
+
+@dataclass(frozen=True)
+class EventProcessingSettings:
+    """
+    Event file handling settings from the scheduler config, with defaults applied.
+    
+    Built once per run, so per-event code reads attributes instead of looking
+    up each config key with its default.
+    """
+    archive_processed_files: bool
+    archive_directory_name: str
+    add_end_time_if_missing: bool
+    default_event_duration: timedelta
+    max_parallel_files: int
+    required_fields: tuple
+    start_fields: tuple
+    end_fields: tuple
+    
+    @classmethod
+    def from_config(cls, config):
+        """
+        Read the file_processing and event_validation sections of the scheduler config.
+        
+        Raises:
+            ValueError: If a setting has the wrong type
+        """
+        file_processing = config.get("file_processing", {})
+        event_validation = config.get("event_validation", {})
+        
+        duration_hours = file_processing.get("default_event_duration_hours", 1)
+        if isinstance(duration_hours, bool) or not isinstance(duration_hours, (int, float)):
+            raise ValueError("default_event_duration_hours must be a number")
+        
+        max_parallel_files = file_processing.get("max_parallel_files", 8)
+        if isinstance(max_parallel_files, bool) or not isinstance(max_parallel_files, int) or max_parallel_files < 1:
+            raise ValueError("max_parallel_files must be a positive integer")
+        
+        field_lists = {}
+        for name, default in (("required_fields", ("summary", "start")),
+                              ("start_fields", ("dateTime", "date")),
+                              ("end_fields", ("dateTime", "date"))):
+            value = event_validation.get(name, default)
+            if not isinstance(value, (list, tuple)) or not all(isinstance(field, str) for field in value):
+                raise ValueError(f"{name} must be a list of field names")
+            field_lists[name] = tuple(value)
+        
+        return cls(
+            archive_processed_files=bool(file_processing.get("archive_processed_files", True)),
+            archive_directory_name=str(file_processing.get("archive_directory_name", "processed")),
+            add_end_time_if_missing=bool(file_processing.get("add_end_time_if_missing", True)),
+            default_event_duration=timedelta(hours=duration_hours),
+            max_parallel_files=max_parallel_files,
+            **field_lists
+        )
 
 # === Interval Calculation ===
 def calculate_interval_seconds(runs_per_day):
@@ -117,76 +234,220 @@ def calculate_next_run_time(interval_seconds):
 def update_pipeline_state(state_file, updates):
     """Update the pipeline state file with the latest run information."""
     try:
-        with open(state_file, 'w') as f:
-            json.dump(updates, f, indent=2)
+        # Written to a temporary file and renamed into place, so an interrupted
+        # run never leaves a truncated state file behind
+        json_utils.dump_file(updates, state_file, indent=False, atomic=True)
     except Exception as e:
         logger.error(f"Failed to update state file: {e}")
 
 # === Calendar Event Processing ===
-def process_calendar_event_files():
+# Characters dropped from attendee names when building a placeholder email
+# (anything but letters, digits and spaces)
+ATTENDEE_NAME_STRIP_PATTERN = re.compile(r'[^\w ]|_')
+
+# Authenticated Google Calendar manager, shared across scheduler runs
+_calendar_manager = None
+_calendar_manager_lock = threading.Lock()
+
+def create_calendar_manager():
+    """
+    Get the Google Calendar manager, creating and authenticating it on first use.
+    
+    The manager is kept for the lifetime of the process so the OAuth token
+    and API client are reused; the credentials refresh themselves on expiry.
+    
+    Returns:
+        GoogleCalendarManager: Authenticated manager, or None if authentication failed
+    """
+    global _calendar_manager
+    
+    with _calendar_manager_lock:
+        if _calendar_manager is not None:
+            return _calendar_manager
+        
+        try:
+            calendar_manager = GoogleCalendarManager()
+            calendar_manager.authenticate()
+            logger.info("Successfully authenticated with Google Calendar API")
+            _calendar_manager = calendar_manager
+            return _calendar_manager
+        except Exception as e:
+            logger.error(f"Failed to authenticate with Google Calendar API: {e}")
+            return None
+
+def discard_calendar_manager(calendar_manager):
+    """
+    Drop the cached Google Calendar manager so the next run authenticates again.
+    
+    Used when a request fails outright, typically a google.auth RefreshError
+    after the refresh token was revoked or expired.
+    
+    Args:
+        calendar_manager (GoogleCalendarManager): Manager that failed
+    """
+    global _calendar_manager
+    
+    with _calendar_manager_lock:
+        if _calendar_manager is calendar_manager:
+            _calendar_manager = None
+        # The service and credentials are also shared process wide, drop them too
+        invalidate_calendar_service(calendar_manager.credentials_path)
+
+def prepare_calendar_event(event, json_file, settings):
+    """
+    Validate a parsed event and fill in what Google Calendar needs.
+    
+    Adds a default end time when it is missing and placeholder emails for
+    attendees without one. The event is modified in place.
+    
+    Args:
+        event (dict): Event parsed from a JSON file
+        json_file (Path): File the event came from, for log messages
+        settings (EventProcessingSettings): Validation and end-time settings
+    
+    Returns:
+        bool: True if the event is valid and can be inserted
+    """
+    # Validate event has required fields based on config
+    missing_fields = []
+    for field in settings.required_fields:
+        if not event.get(field):
+            missing_fields.append(field)
+    
+    if missing_fields:
+        logger.warning(f"Event in {json_file} missing required fields: {', '.join(missing_fields)}")
+        return False
+    
+    # Validate start date/time
+    start = event.get('start')
+    has_valid_start = bool(start) and any(start.get(field) for field in settings.start_fields)
+    
+    if not has_valid_start:
+        logger.warning(f"Event in {json_file} missing valid start date/time fields: {', '.join(settings.start_fields)}")
+        return False
+    
+    # Ensure end date/time is present if add_end_time_if_missing is enabled
+    if settings.add_end_time_if_missing:
+        end = event.get('end')
+        has_valid_end = bool(end) and any(end.get(field) for field in settings.end_fields)
+        
+        if not has_valid_end:
+            logger.warning(f"Event in {json_file} missing end date/time - adding one")
+            
+            # Copy start to end if missing
+            if 'start' in event:
+                if 'end' not in event:
+                    event['end'] = {}
+                
+                # Copy date/time fields from start to end
+                for field in settings.start_fields:
+                    if field in event['start']:
+                        event['end'][field] = event['start'][field]
+                
+                # If using dateTime, add configured hours to end time
+                if 'dateTime' in event['start']:
+                    # Parse datetime and add hours using datetime arithmetic
+                    try:
+                        # fromisoformat keeps any UTC offset, which isoformat() writes back out
+                        start_dt = datetime.fromisoformat(event['start']['dateTime'].replace('Z', '+00:00'))
+                        end_dt = start_dt + settings.default_event_duration
+                        event['end']['dateTime'] = end_dt.isoformat()
+                    
+                    except (AttributeError, ValueError) as e:
+                        # Skip the event rather than guess an end time from the raw string
+                        logger.error(f"Event in {json_file} has an invalid start dateTime, skipping it: {e}")
+                        return False
+    
+    # Fix attendees without email addresses
+    if 'attendees' in event and isinstance(event['attendees'], list):
+        for i, attendee in enumerate(event['attendees']):
+            if isinstance(attendee, dict) and 'email' not in attendee:
+                display_name = attendee.get('displayName') or f"attendee{i+1}"
+                sanitized_name = ATTENDEE_NAME_STRIP_PATTERN.sub('', display_name).lower().replace(' ', '.')
+                placeholder_email = f"{sanitized_name}@example.com"
+                logger.warning(f"Attendee {display_name} is missing email - adding placeholder: {placeholder_email}")
+                event['attendees'][i]['email'] = placeholder_email
+    
+    return True
+
+def _extract_dt(section):
+    """Get (dateTime or date, timeZone) from an event's start or end, or (None, None)."""
+    if not section:
+        return None, None
+    return section.get('dateTime') or section.get('date'), section.get('timeZone')
+
+def event_to_db_row(event):
+    """
+    Map a Google Calendar style event to the fields stored in the database.
+    
+    Args:
+        event (dict): Event as inserted into Google Calendar
+    
+    Returns:
+        dict: Keyword fields for save_calendar_events_bulk
+    """
+    start_datetime, start_timezone = _extract_dt(event.get('start'))
+    end_datetime, end_timezone = _extract_dt(event.get('end'))
+    return dict(
+        summary=event.get('summary'),
+        start_datetime=start_datetime,
+        end_datetime=end_datetime,
+        location=event.get('location'),
+        description=event.get('description'),
+        start_timezone=start_timezone,
+        end_timezone=end_timezone,
+        attendees=event.get('attendees'),
+        recurrence=event.get('recurrence'),
+        reminders=event.get('reminders'),
+        visibility=event.get('visibility'),
+        color_id=event.get('colorId'),
+        transparency=event.get('transparency'),
+        status=event.get('status')
+    )
+
+def load_event_file(json_file):
+    """
+    Read a calendar event JSON file without raising.
+    
+    Returns:
+        tuple: (object, Exception) The parsed content and None, or None and the error
+    """
+    try:
+        return json_utils.load_file(json_file), None
+    except Exception as e:
+        return None, e
+
+def process_calendar_event_files(calendar_manager=None):
     """
     Process JSON files created by the parser and add them to Google Calendar.
     
+    Args:
+        calendar_manager (GoogleCalendarManager, optional): Authenticated manager to use,
+            one is created when omitted
+    
     Returns:
         tuple: (int, int) Count of successfully inserted events and errors
     """
     # Get path to JSON output directory from agent_parse_entry config
     try:
-        # Load scheduler config - try multiple possible paths
-        possible_scheduler_config_paths = [
-            PROJECT_ROOT / "project_modules_configs" / "config_app_calender_scheduler" / "app_calender_scheduler_config.json",
-            Path(__file__).parent.parent / "project_modules_configs" / "config_app_calender_scheduler" / "app_calender_scheduler_config.json",
-            Path().absolute() / "src" / "voice_calender" / "project_modules_configs" / "config_app_calender_scheduler" / "app_calender_scheduler_config.json",
-            Path().absolute().parent / "src" / "voice_calender" / "project_modules_configs" / "config_app_calender_scheduler" / "app_calender_scheduler_config.json"
-        ]
-        
-        scheduler_config_path = None
-        for path in possible_scheduler_config_paths:
-            if path.exists():
-                scheduler_config_path = path
-                logger.info(f"Found scheduler config at: {scheduler_config_path}")
-                break
-        
+        # Load scheduler config
+        scheduler_config_path = SCHEDULER_CONFIG_PATH
         if not scheduler_config_path:
-            logger.error(f"Scheduler config file not found. Tried paths: {[str(p) for p in possible_scheduler_config_paths]}")
+            logger.error(f"Scheduler config file not found. Tried paths: {[str(p) for p in SCHEDULER_CONFIG_CANDIDATES]}")
             return 0, 0
             
-        with open(scheduler_config_path, 'r', encoding='utf-8') as f:
-            scheduler_config = json.load(f)
+        scheduler_config = _load_json_cached(scheduler_config_path)
             
         # Load validation settings from config
-        file_processing_config = scheduler_config.get("file_processing", {})
-        event_validation_config = scheduler_config.get("event_validation", {})
-        
-        archive_processed_files = file_processing_config.get("archive_processed_files", True)
-        archive_directory_name = file_processing_config.get("archive_directory_name", "processed")
-        default_event_duration_hours = file_processing_config.get("default_event_duration_hours", 1)
-        
-        required_fields = event_validation_config.get("required_fields", ["summary", "start"])
-        start_fields = event_validation_config.get("start_fields", ["dateTime", "date"])
-        end_fields = event_validation_config.get("end_fields", ["dateTime", "date"])
-        
-        # Get path to JSON output directory from agent_parse_entry config - try multiple possible paths
-        possible_parse_config_paths = [
-            PROJECT_ROOT / "project_modules_configs" / "config_agent_parse_entry" / "agent_parse_entry_config.json",
-            Path(__file__).parent.parent / "project_modules_configs" / "config_agent_parse_entry" / "agent_parse_entry_config.json",
-            Path().absolute() / "src" / "voice_calender" / "project_modules_configs" / "config_agent_parse_entry" / "agent_parse_entry_config.json",
-            Path().absolute().parent / "src" / "voice_calender" / "project_modules_configs" / "config_agent_parse_entry" / "agent_parse_entry_config.json"
-        ]
-        
-        parse_config_path = None
-        for path in possible_parse_config_paths:
-            if path.exists():
-                parse_config_path = path
-                logger.info(f"Found parse entry config at: {parse_config_path}")
-                break
+        settings = EventProcessingSettings.from_config(scheduler_config)
         
+        # Get path to JSON output directory from agent_parse_entry config
+        parse_config_path = PARSE_CONFIG_PATH
         if not parse_config_path:
-            logger.error(f"Parse entry config file not found. Tried paths: {[str(p) for p in possible_parse_config_paths]}")
+            logger.error(f"Parse entry config file not found. Tried paths: {[str(p) for p in PARSE_CONFIG_CANDIDATES]}")
             return 0, 0
             
-        with open(parse_config_path, 'r', encoding='utf-8') as f:
-            parse_config = json.load(f)
+        parse_config = _load_json_cached(parse_config_path)
             
         json_output_dir = parse_config.get("paths", {}).get("json_output_directory")
         
@@ -197,457 +458,134 @@ def process_calendar_event_files():
         # Initialize database
         initialize_db()
             
-        # Create Google Calendar Manager
-        calendar_manager = GoogleCalendarManager()
-        
-        # Authenticate explicitly before processing events
-        try:
-            calendar_manager.authenticate()
-            logger.info("Successfully authenticated with Google Calendar API")
-        except Exception as e:
-            logger.error(f"Failed to authenticate with Google Calendar API: {e}")
+        # Create and authenticate the Google Calendar Manager before processing events
+        if calendar_manager is None:
+            calendar_manager = create_calendar_manager()
+        if calendar_manager is None:
             return 0, 0
         
-        # Find all JSON files in the output directory
-        json_files = list(Path(json_output_dir).glob("*.json"))
+        # Find all JSON files in the output directory; DirEntry.is_file() uses
+        # the type from the directory listing instead of a stat() per file
+        with os.scandir(json_output_dir) as entries:
+            json_files = [Path(entry.path) for entry in entries
+                          if entry.name.endswith('.json') and entry.is_file()]
         
         if not json_files:
             logger.info("No calendar event JSON files found to process")
             return 0, 0
             
-        logger.info(f"Found {len(json_files)} calendar event files to process")
+        logger.info("Found %d calendar event files to process", len(json_files))
         
         # Process each JSON file
         success_count = 0
         error_count = 0
+        db_rows = []
+        
+        # Validated events waiting for the Google Calendar insert, as (json_file, event)
+        pending_events = []
+        
+        # Read the files concurrently, then validate their events in order
+        with ThreadPoolExecutor(max_workers=min(settings.max_parallel_files, len(json_files))) as executor:
+            loaded_files = list(executor.map(load_event_file, json_files))
         
-        for json_file in json_files:
+        for json_file, (event_data, load_error) in zip(json_files, loaded_files):
             try:
-                logger.info(f"Processing calendar event file: {json_file}")
+                logger.info("Processing calendar event file: %s", json_file)
                 
-                # Load the JSON file
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    event_data = json.load(f)
+                if load_error is not None:
+                    raise load_error
                 
-                # Check if event_data is a list of events
+                # A file holds either a list of events or a single event
                 if isinstance(event_data, list):
-                    logger.info(f"Processing {len(event_data)} events from file {json_file}")
-                    file_success_count = 0
-                    
-                    for event in event_data:
-                        try:
-                            # Validate event has required fields based on config
-                            missing_fields = []
-                            for field in required_fields:
-                                if not event.get(field):
-                                    missing_fields.append(field)
-                            
-                            if missing_fields:
-                                logger.warning(f"Event in {json_file} missing required fields: {', '.join(missing_fields)}")
-                                error_count += 1
-                                continue
-                            
-                            # Validate start date/time
-                            has_valid_start = False
-                            if 'start' in event:
-                                for field in start_fields:
-                                    if event['start'].get(field):
-                                        has_valid_start = True
-                                        break
-                            
-                            if not has_valid_start:
-                                logger.warning(f"Event in {json_file} missing valid start date/time fields: {', '.join(start_fields)}")
-                                error_count += 1
-                                continue
-                            
-                            # Ensure end date/time is present if add_end_time_if_missing is enabled
-                            if file_processing_config.get("add_end_time_if_missing", True):
-                                has_valid_end = False
-                                if 'end' in event:
-                                    for field in end_fields:
-                                        if event['end'].get(field):
-                                            has_valid_end = True
-                                            break
-                                
-                                if not has_valid_end:
-                                    logger.warning(f"Event in {json_file} missing end date/time - adding one")
-                                    
-                                    # Copy start to end if missing
-                                    if 'start' in event:
-                                        if 'end' not in event:
-                                            event['end'] = {}
-                                        
-                                        # Copy date/time fields from start to end
-                                        for field in start_fields:
-                                            if field in event['start']:
-                                                event['end'][field] = event['start'][field]
-                                        
-                                        # If using dateTime, add configured hours to end time
-                                        if 'dateTime' in event['start']:
-                                            # Parse datetime and add hours using datetime arithmetic
-                                            try:
-                                                from datetime import datetime, timedelta
-                                                
-                                                # Remove timezone info for processing if present
-                                                dt_str = event['start']['dateTime']
-                                                # Handle different timezone formats
-                                                if '+' in dt_str:
-                                                    dt_parts = dt_str.split('+')
-                                                    dt_str = dt_parts[0]
-                                                    tz_part = '+' + dt_parts[1]
-                                                elif 'Z' in dt_str:
-                                                    dt_str = dt_str.replace('Z', '')
-                                                    tz_part = 'Z'
-                                                else:
-                                                    tz_part = ''
-                                                
-                                                # Parse datetime
-                                                if 'T' in dt_str:
-                                                    start_dt = datetime.fromisoformat(dt_str)
-                                                else:
-                                                    # If only date is provided
-                                                    start_dt = datetime.fromisoformat(f"{dt_str}T00:00:00")
-                                                
-                                                # Add configured hours
-                                                end_dt = start_dt + timedelta(hours=default_event_duration_hours)
-                                                
-                                                # Format back with timezone
-                                                end_dt_str = end_dt.isoformat()
-                                                if tz_part:
-                                                    end_dt_str = end_dt_str + tz_part
-                                                
-                                                event['end']['dateTime'] = end_dt_str
-                                                
-                                            except Exception as e:
-                                                logger.error(f"Error calculating end time: {e}")
-                                                # Fallback to simple string manipulation if datetime parsing fails
-                                                dt_parts = event['start']['dateTime'].split('T')
-                                                if len(dt_parts) == 2:
-                                                    date_part = dt_parts[0]
-                                                    time_parts = dt_parts[1].split(':')
-                                                    if len(time_parts) >= 2:
-                                                        hour = int(time_parts[0])
-                                                        new_hour = (hour + default_event_duration_hours) % 24
-                                                        time_parts[0] = f"{new_hour:02d}"
-                                                        event['end']['dateTime'] = f"{date_part}T{':'.join(time_parts)}"
-                            
-                            # Fix attendees without email addresses
-                            if 'attendees' in event and isinstance(event['attendees'], list):
-                                for i, attendee in enumerate(event['attendees']):
-                                    if isinstance(attendee, dict) and 'email' not in attendee:
-                                        display_name = attendee.get('displayName', f"attendee{i+1}")
-                                        sanitized_name = ''.join(c for c in display_name if c.isalnum() or c == ' ').lower().replace(' ', '.')
-                                        placeholder_email = f"{sanitized_name}@example.com"
-                                        logger.warning(f"Attendee {display_name} is missing email - adding placeholder: {placeholder_email}")
-                                        event['attendees'][i]['email'] = placeholder_email
-                            
-                            # Insert event into Google Calendar
-                            logger.info(f"Inserting event: {json.dumps(event)[:200]}...")
-                            result = calendar_manager.insert_event(event)
-                            
-                            if result:
-                                logger.info(f"Successfully created calendar event: {event.get('summary')}")
-                                success_count += 1
-                                file_success_count += 1
-                                
-                                # Also save to database
-                                try:
-                                    # Extract fields needed for database insertion
-                                    summary = event.get('summary')
-                                    start_datetime = None
-                                    start_timezone = None
-                                    end_datetime = None
-                                    end_timezone = None
-                                    
-                                    if 'start' in event:
-                                        if 'dateTime' in event['start']:
-                                            start_datetime = event['start']['dateTime']
-                                        elif 'date' in event['start']:
-                                            start_datetime = event['start']['date']
-                                        
-                                        start_timezone = event['start'].get('timeZone')
-                                    
-                                    if 'end' in event:
-                                        if 'dateTime' in event['end']:
-                                            end_datetime = event['end']['dateTime']
-                                        elif 'date' in event['end']:
-                                            end_datetime = event['end']['date']
-                                        
-                                        end_timezone = event['end'].get('timeZone')
-                                    
-                                    # Extract other optional fields
-                                    location = event.get('location')
-                                    description = event.get('description')
-                                    attendees = event.get('attendees')
-                                    recurrence = event.get('recurrence')
-                                    reminders = event.get('reminders')
-                                    visibility = event.get('visibility')
-                                    color_id = event.get('colorId')
-                                    transparency = event.get('transparency')
-                                    status = event.get('status')
-                                    
-                                    # Save to database
-                                    db_event_id = save_calendar_event(
-                                        summary=summary,
-                                        start_datetime=start_datetime,
-                                        end_datetime=end_datetime,
-                                        location=location,
-                                        description=description,
-                                        start_timezone=start_timezone,
-                                        end_timezone=end_timezone,
-                                        attendees=attendees,
-                                        recurrence=recurrence,
-                                        reminders=reminders,
-                                        visibility=visibility,
-                                        color_id=color_id,
-                                        transparency=transparency,
-                                        status=status
-                                    )
-                                    
-                                    if db_event_id:
-                                        logger.info(f"Event also saved to database with ID {db_event_id}")
-                                    else:
-                                        logger.warning(f"Event added to Google Calendar but failed to save to database")
-                                        
-                                except Exception as db_error:
-                                    logger.error(f"Error saving event to database: {db_error}")
-                            else:
-                                logger.error(f"Failed to create calendar event from {json_file}")
-                                error_count += 1
-                                
-                        except Exception as e:
-                            logger.error(f"Error processing event from file {json_file}: {e}")
-                            logger.error(traceback.format_exc())
-                            error_count += 1
-                    
-                    # Archive or delete the file if at least one event was processed successfully
-                    if file_success_count > 0 and archive_processed_files:
-                        archive_dir = Path(json_output_dir) / archive_directory_name
-                        archive_dir.mkdir(exist_ok=True)
-                        
-                        try:
-                            # Archive the file by moving it to the processed directory
-                            json_file.rename(archive_dir / json_file.name)
-                            logger.info(f"Moved {json_file.name} to archive directory")
-                        except Exception as e:
-                            logger.error(f"Error archiving {json_file}: {e}")
-                    
+                    logger.info("Processing %d events from file %s", len(event_data), json_file)
+                    events = event_data
                 else:
-                    # Handle the case where event_data is a single event (not a list)
-                    # Validate event has required fields based on config
-                    missing_fields = []
-                    for field in required_fields:
-                        if not event_data.get(field):
-                            missing_fields.append(field)
-                    
-                    if missing_fields:
-                        logger.warning(f"Event in {json_file} missing required fields: {', '.join(missing_fields)}")
-                        error_count += 1
-                        continue
-                    
-                    # Validate start date/time
-                    has_valid_start = False
-                    if 'start' in event_data:
-                        for field in start_fields:
-                            if event_data['start'].get(field):
-                                has_valid_start = True
-                                break
-                    
-                    if not has_valid_start:
-                        logger.warning(f"Event in {json_file} missing valid start date/time fields: {', '.join(start_fields)}")
-                        error_count += 1
-                        continue
-                    
-                    # Ensure end date/time is present if add_end_time_if_missing is enabled
-                    if file_processing_config.get("add_end_time_if_missing", True):
-                        has_valid_end = False
-                        if 'end' in event_data:
-                            for field in end_fields:
-                                if event_data['end'].get(field):
-                                    has_valid_end = True
-                                    break
-                        
-                        if not has_valid_end:
-                            logger.warning(f"Event in {json_file} missing end date/time - adding one")
-                            
-                            # Copy start to end if missing
-                            if 'start' in event_data:
-                                if 'end' not in event_data:
-                                    event_data['end'] = {}
-                                
-                                # Copy date/time fields from start to end
-                                for field in start_fields:
-                                    if field in event_data['start']:
-                                        event_data['end'][field] = event_data['start'][field]
-                                
-                                # If using dateTime, add configured hours to end time
-                                if 'dateTime' in event_data['start']:
-                                    # Parse datetime and add hours using datetime arithmetic
-                                    try:
-                                        from datetime import datetime, timedelta
-                                        
-                                        # Remove timezone info for processing if present
-                                        dt_str = event_data['start']['dateTime']
-                                        # Handle different timezone formats
-                                        if '+' in dt_str:
-                                            dt_parts = dt_str.split('+')
-                                            dt_str = dt_parts[0]
-                                            tz_part = '+' + dt_parts[1]
-                                        elif 'Z' in dt_str:
-                                            dt_str = dt_str.replace('Z', '')
-                                            tz_part = 'Z'
-                                        else:
-                                            tz_part = ''
-                                        
-                                        # Parse datetime
-                                        if 'T' in dt_str:
-                                            start_dt = datetime.fromisoformat(dt_str)
-                                        else:
-                                            # If only date is provided
-                                            start_dt = datetime.fromisoformat(f"{dt_str}T00:00:00")
-                                        
-                                        # Add configured hours
-                                        end_dt = start_dt + timedelta(hours=default_event_duration_hours)
-                                        
-                                        # Format back with timezone
-                                        end_dt_str = end_dt.isoformat()
-                                        if tz_part:
-                                            end_dt_str = end_dt_str + tz_part
-                                        
-                                        event_data['end']['dateTime'] = end_dt_str
-                                        
-                                    except Exception as e:
-                                        logger.error(f"Error calculating end time: {e}")
-                                        # Fallback to simple string manipulation if datetime parsing fails
-                                        dt_parts = event_data['start']['dateTime'].split('T')
-                                        if len(dt_parts) == 2:
-                                            date_part = dt_parts[0]
-                                            time_parts = dt_parts[1].split(':')
-                                            if len(time_parts) >= 2:
-                                                hour = int(time_parts[0])
-                                                new_hour = (hour + default_event_duration_hours) % 24
-                                                time_parts[0] = f"{new_hour:02d}"
-                                                event_data['end']['dateTime'] = f"{date_part}T{':'.join(time_parts)}"
-                    
-                    # Fix attendees without email addresses
-                    if 'attendees' in event_data and isinstance(event_data['attendees'], list):
-                        for i, attendee in enumerate(event_data['attendees']):
-                            if isinstance(attendee, dict) and 'email' not in attendee:
-                                display_name = attendee.get('displayName', f"attendee{i+1}")
-                                sanitized_name = ''.join(c for c in display_name if c.isalnum() or c == ' ').lower().replace(' ', '.')
-                                placeholder_email = f"{sanitized_name}@example.com"
-                                logger.warning(f"Attendee {display_name} is missing email - adding placeholder: {placeholder_email}")
-                                event_data['attendees'][i]['email'] = placeholder_email
-                    
-                    # Insert event into Google Calendar
-                    logger.info(f"Inserting event: {json.dumps(event_data)[:200]}...")
-                    result = calendar_manager.insert_event(event_data)
-                    
-                    if result:
-                        logger.info(f"Successfully created calendar event: {event_data.get('summary')}")
-                        success_count += 1
+                    events = [event_data]
+                
+                for event in events:
+                    try:
+                        if not prepare_calendar_event(event, json_file, settings):
+                            error_count += 1
+                            continue
                         
-                        # Also save to database
-                        try:
-                            # Extract fields needed for database insertion
-                            summary = event_data.get('summary')
-                            start_datetime = None
-                            start_timezone = None
-                            end_datetime = None
-                            end_timezone = None
-                            
-                            if 'start' in event_data:
-                                if 'dateTime' in event_data['start']:
-                                    start_datetime = event_data['start']['dateTime']
-                                elif 'date' in event_data['start']:
-                                    start_datetime = event_data['start']['date']
-                                
-                                start_timezone = event_data['start'].get('timeZone')
-                            
-                            if 'end' in event_data:
-                                if 'dateTime' in event_data['end']:
-                                    end_datetime = event_data['end']['dateTime']
-                                elif 'date' in event_data['end']:
-                                    end_datetime = event_data['end']['date']
-                                
-                                end_timezone = event_data['end'].get('timeZone')
-                            
-                            # Extract other optional fields
-                            location = event_data.get('location')
-                            description = event_data.get('description')
-                            attendees = event_data.get('attendees')
-                            recurrence = event_data.get('recurrence')
-                            reminders = event_data.get('reminders')
-                            visibility = event_data.get('visibility')
-                            color_id = event_data.get('colorId')
-                            transparency = event_data.get('transparency')
-                            status = event_data.get('status')
-                            
-                            # Save to database
-                            db_event_id = save_calendar_event(
-                                summary=summary,
-                                start_datetime=start_datetime,
-                                end_datetime=end_datetime,
-                                location=location,
-                                description=description,
-                                start_timezone=start_timezone,
-                                end_timezone=end_timezone,
-                                attendees=attendees,
-                                recurrence=recurrence,
-                                reminders=reminders,
-                                visibility=visibility,
-                                color_id=color_id,
-                                transparency=transparency,
-                                status=status
-                            )
-                            
-                            if db_event_id:
-                                logger.info(f"Event also saved to database with ID {db_event_id}")
-                            else:
-                                logger.warning(f"Event added to Google Calendar but failed to save to database")
-                                
-                        except Exception as db_error:
-                            logger.error(f"Error saving event to database: {db_error}")
+                        # Queue the event for the batched Google Calendar insert
+                        logger.info("Inserting event: %s at %s", event.get('summary'), event['start'].get('dateTime') or event['start'].get('date'))
+                        pending_events.append((json_file, event))
                         
-                        # Handle the processed file - archive or delete based on config
-                        if archive_processed_files:
-                            archive_dir = Path(json_output_dir) / archive_directory_name
-                            archive_dir.mkdir(exist_ok=True)
-                            
-                            try:
-                                # Archive the file by moving it to the processed directory
-                                json_file.rename(archive_dir / json_file.name)
-                                logger.info(f"Moved {json_file.name} to archive directory")
-                            except Exception as e:
-                                logger.error(f"Error archiving {json_file}: {e}")
-                    else:
-                        logger.error(f"Failed to create calendar event from {json_file}")
+                    except Exception as e:
+                        logger.exception(f"Error processing event from file {json_file}: {e}")
                         error_count += 1
-                    
+                
             except Exception as e:
-                logger.error(f"Error processing calendar event file {json_file}: {e}")
-                logger.error(traceback.format_exc())
+                logger.exception(f"Error processing calendar event file {json_file}: {e}")
                 error_count += 1
+        
+        # Insert the queued events into Google Calendar using batched requests
+        processed_files = []
+        insert_failed = False
+        if pending_events:
+            # insert_events returns the events created so far even when a batch
+            # fails, those are archived and saved below before the manager is dropped
+            try:
+                results = calendar_manager.insert_events([event for _, event in pending_events])
+                insert_failed = calendar_manager.last_insert_error is not None
+            except Exception as e:
+                logger.exception(f"Error inserting events into Google Calendar: {e}")
+                results = [None] * len(pending_events)
+                insert_failed = True
+            
+            for (json_file, event), result in zip(pending_events, results):
+                if not result:
+                    logger.error(f"Failed to create calendar event from {json_file}")
+                    error_count += 1
+                    continue
                 
-        # Close database connections after processing all files
-        close_all_connections()
+                logger.info("Successfully created calendar event: %s", event.get('summary'))
+                success_count += 1
+                if json_file not in processed_files:
+                    processed_files.append(json_file)
+                
+                # Queue for the database, all events are saved in one transaction
+                db_rows.append(event_to_db_row(event))
+        
+        # Archive the files that had at least one event created
+        if processed_files and settings.archive_processed_files:
+            archive_dir = Path(json_output_dir) / settings.archive_directory_name
+            archive_dir.mkdir(exist_ok=True)
+            
+            for json_file in processed_files:
+                try:
+                    # Archive the file by moving it to the processed directory,
+                    # copying instead when the archive is on another filesystem
+                    archive_path = archive_dir / json_file.name
+                    try:
+                        os.replace(json_file, archive_path)
+                    except OSError:
+                        shutil.move(str(json_file), str(archive_path))
+                    logger.info("Moved %s to archive directory", json_file.name)
+                except Exception as e:
+                    logger.error(f"Error archiving {json_file}: {e}")
+        
+        # Save the events added to Google Calendar in a single transaction
+        if db_rows:
+            db_event_ids = save_calendar_events_bulk(db_rows)
+            if db_event_ids:
+                logger.info(f"Saved {len(db_event_ids)} events to database")
+            else:
+                logger.warning(f"{len(db_rows)} events added to Google Calendar but failed to save to database")
+        
+        # Re-authenticate on the next run once the successes are safely recorded
+        if insert_failed:
+            discard_calendar_manager(calendar_manager)
                 
         return success_count, error_count
         
     except Exception as e:
-        logger.error(f"Error in process_calendar_event_files: {e}")
-        logger.error(traceback.format_exc())
-        
-        # Ensure connections are closed on error
-        try:
-            close_all_connections()
-        except:
-            pass
-            
+        logger.exception(f"Error in process_calendar_event_files: {e}")
         return 0, 0
 
 # === Main Pipeline Implementation ===
-def run_pipeline():
+async def run_pipeline_async():
     """
     Run the main Voice Calendar pipeline:
     1. Download audio files from Google Drive
@@ -655,38 +593,44 @@ def run_pipeline():
     3. Parse transcriptions to extract calendar events
     4. Insert events into Google Calendar
     5. Delete processed files to prevent duplication
+    
+    Each stage consumes the previous stage's output directory, so the stages
+    run in order on worker threads. Google Calendar authentication doesn't
+    depend on them and runs alongside the download, transcribe and parse steps.
     """
     state = {"last_run_time": datetime.now().isoformat()}
     
+    calendar_task = asyncio.create_task(asyncio.to_thread(create_calendar_manager))
+    
     try:
         # Step 1: Download files from Google Drive
         logger.info("Starting file download from Google Drive")
-        download_files_main()
+        await asyncio.to_thread(download_files_main)
         logger.info("Completed file download from Google Drive")
         
         # Step 2: Transcribe downloaded audio files
         logger.info("Starting transcription of audio files")
-        run_transcribe()
+        await asyncio.to_thread(run_transcribe)
         logger.info("Completed transcription of audio files")
         
         # Step 3: Parse transcriptions to extract calendar events
         logger.info("Starting parsing of transcriptions for calendar events")
-        parse_calendar_entries()
+        await asyncio.to_thread(parse_calendar_entries)
         logger.info("Completed parsing of transcriptions for calendar events")
         
         # Step 4: Process calendar events and insert into Google Calendar
         logger.info("Starting insertion of events into Google Calendar")
-        success_count, error_count = process_calendar_event_files()
+        calendar_manager = await calendar_task
+        success_count, error_count = await asyncio.to_thread(process_calendar_event_files, calendar_manager)
         logger.info(f"Calendar event processing completed: {success_count} events created, {error_count} errors")
         
         # Step 5: Delete processed files to prevent duplication
         logger.info("Starting deletion of processed files")
         try:
-            delete_files_main()
+            await asyncio.to_thread(delete_files_main)
             logger.info("Completed deletion of processed files")
         except Exception as e:
-            logger.error(f"Error deleting processed files: {e}")
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error deleting processed files: {e}")
         
         state["last_run_status"] = "success"
         state["events_created"] = success_count
@@ -695,13 +639,19 @@ def run_pipeline():
     except Exception as e:
         state["last_run_status"] = "failed"
         state["error"] = str(e)
-        logger.error(f"Pipeline execution failed: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Pipeline execution failed: {e}")
+    finally:
+        # Don't leave the authentication thread unawaited if an earlier step failed
+        await asyncio.gather(calendar_task, return_exceptions=True)
     
     # Update state file
     update_pipeline_state(STATE_FILE, state)
     return state["last_run_status"] == "success"
 
+def run_pipeline():
+    """Run the main Voice Calendar pipeline once, see run_pipeline_async."""
+    return asyncio.run(run_pipeline_async())
+
 # === Calendar Event Summary Task ===
 def run_calendar_summary_task():
     """
@@ -717,7 +667,8 @@ def run_calendar_summary_task():
         
         # Retrieve calendar events from the database
         logger.info("Retrieving calendar events from database")
-        events = get_calendar_events_by_config_interval()
+        # The email body includes event descriptions, so fetch every column
+        events = get_calendar_events_by_config_interval(full=True)
         
         if not events:
             logger.warning("No calendar events found for the configured time interval")
@@ -727,66 +678,18 @@ def run_calendar_summary_task():
         logger.info(f"Formatting {len(events)} calendar events for email")
         email_content = format_events_for_email(events)
         
-        # Update email config with events
-        try:
-            # Load the email config - try multiple possible paths
-            possible_email_config_paths = [
-                PROJECT_ROOT / "project_modules_configs" / "config_send_email" / "email_config.json",
-                Path(__file__).parent.parent / "project_modules_configs" / "config_send_email" / "email_config.json",
-                Path().absolute() / "src" / "voice_calender" / "project_modules_configs" / "config_send_email" / "email_config.json",
-                Path().absolute().parent / "src" / "voice_calender" / "project_modules_configs" / "config_send_email" / "email_config.json"
-            ]
-            
-            email_config_path = None
-            for path in possible_email_config_paths:
-                if path.exists():
-                    email_config_path = path
-                    logger.info(f"Found email config at: {email_config_path}")
-                    break
-            
-            if not email_config_path:
-                logger.error(f"Email config file not found. Tried paths: {[str(p) for p in possible_email_config_paths]}")
-                return False
-                
-            with open(email_config_path, 'r', encoding='utf-8') as f:
-                email_config = json.load(f)
-            
-            # Update the email message with the events content
-            if 'email' in email_config:
-                today = datetime.now().strftime("%Y-%m-%d")
-                email_config['email']['subject'] = f"Voice Calendar Events Summary for {today}"
-                email_config['email']['message'] = email_content
-                
-                # Save the updated config
-                with open(email_config_path, 'w', encoding='utf-8') as f:
-                    json.dump(email_config, f, indent=2)
-                
-                logger.info("Updated email message with calendar events")
-            else:
-                logger.warning("Email configuration doesn't contain 'email' section")
-                return False
-        except Exception as e:
-            logger.error(f"Error updating email config: {e}")
-            logger.error(traceback.format_exc())
-            return False
-        
-        # Send email
+        # Send email, passing the summary directly instead of storing it in the email config
         logger.info("Starting email sending process")
-        send_email_main()
+        today = datetime.now().strftime("%Y-%m-%d")
+        result = send_email_main(subject=f"Voice Calendar Events Summary for {today}", message=email_content)
+        if result != 0:
+            logger.warning("Calendar summary email was not sent")
+            return False
         logger.info("Completed email sending process")
         
-        # Clean up database connections
-        close_all_connections()
-        
         return True
     except Exception as e:
-        logger.error(f"Calendar summary task failed: {e}")
-        logger.error(traceback.format_exc())
-        # Ensure connections are closed even on error
-        try:
-            close_all_connections()
-        except:
-            pass
+        logger.exception(f"Calendar summary task failed: {e}")
         return False
 
 def format_events_for_email(events):
@@ -794,7 +697,7 @@ def format_events_for_email(events):
     Format calendar events for email content
     
     Args:
-        events (list): List of calendar event records from database
+        events (list): Calendar event records (named tuples) from the database
         
     Returns:
         str: Formatted email content
@@ -802,62 +705,94 @@ def format_events_for_email(events):
     if not events:
         return "No upcoming calendar events found."
     
-    formatted_content = "Upcoming Calendar Events:\n\n"
+    parts = ["Upcoming Calendar Events:\n\n"]
     
     for i, event in enumerate(events, 1):
         # Extract event details
-        summary = event.get('summary', 'Untitled Event')
+        summary = event.summary or 'Untitled Event'
         
-        # Format start date/time - using the correct field name from db_manager.py
-        start_datetime = event.get('start_datetime')
-        if not start_datetime:
-            # Try alternate field name based on db_manager.py
-            start_datetime = event.get('start_dateTime')
-            
-        if start_datetime:
+        # Format start date/time
+        start_datetime = event.start_datetime
+        
+        # Timestamp columns come back as datetimes, text columns as ISO 8601 strings
+        if isinstance(start_datetime, datetime):
+            start_formatted = start_datetime.strftime("%Y-%m-%d at %H:%M:%S")
+        elif isinstance(start_datetime, str) and 'T' in start_datetime:
             try:
-                # If the format is ISO 8601 with a T separator
-                if 'T' in start_datetime:
-                    dt_parts = start_datetime.split('T')
-                    date_part = dt_parts[0]
-                    time_part = dt_parts[1].split('+')[0].split('Z')[0]  # Remove timezone if present
-                    start_formatted = f"{date_part} at {time_part}"
-                else:
-                    # Just use as is if not in expected format
-                    start_formatted = start_datetime
-            except:
+                start_dt = datetime.fromisoformat(start_datetime.replace('Z', '+00:00'))
+                start_formatted = start_dt.strftime("%Y-%m-%d at %H:%M:%S")
+            except ValueError:
                 start_formatted = start_datetime
+        elif start_datetime:
+            # Just use as is if not in expected format
+            start_formatted = start_datetime
         else:
             start_formatted = "No start time"
         
         # Format location
-        location = event.get('location')
+        location = event.location
         location_text = f"\nLocation: {location}" if location else ""
         
         # Format description (truncate if too long)
-        description = event.get('description')
+        description = event.description
         if description and len(description) > 100:
             description = description[:97] + "..."
         description_text = ""#####################################f"\nDetails: {description}" if description else ""
         
         # Add event to content
-        formatted_content += f"{i}. {summary}\n   When: {start_formatted}{location_text}{description_text}\n\n"
+        parts.append(f"{i}. {summary}\n   When: {start_formatted}{location_text}{description_text}\n\n")
     
     # Add footer
-    formatted_content += "\nThis email was automatically generated by Voice Calendar.\n"
+    parts.append("\nThis email was automatically generated by Voice Calendar.\n")
     
-    return formatted_content
+    return "".join(parts)
 
 # === Future Tasks Scheduler ===
+# Time of day for the calendar summary task, set from the config at startup
+_daily_task_time = {"hour": 23, "minute": 55}
+
+# Strong references to fire-and-forget tasks, the event loop only keeps weak ones
+_background_tasks = set()
+
+def _on_background_task_done(task):
+    """Drop a finished background task and log it if it failed."""
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Background task {task.get_name()} failed", exc_info=task.exception())
+
+def start_background_task(coro, name=None):
+    """Schedule a coroutine on the running loop, keeping it alive until it finishes."""
+    task = asyncio.create_task(coro, name=name)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_task_done)
+    return task
+
+def set_daily_task_time(config):
+    """Read the daily task time from the scheduler config, keeping the fallbacks for missing keys."""
+    scheduler_config = config.get("scheduler", {})
+    _daily_task_time["hour"] = scheduler_config.get("daily_task_hour", 23)
+    _daily_task_time["minute"] = scheduler_config.get("daily_task_minute", 55)
+
+def reload_daily_task_time(*_):
+    """
+    Re-read the daily task time, used from the next scheduled summary on.
+    
+    Runs before every summary cycle and as the SIGHUP handler where signals
+    are available; the cached config is only re-parsed after the file changes.
+    """
+    try:
+        previous = dict(_daily_task_time)
+        set_daily_task_time(_load_json_cached(SCHEDULER_CONFIG_PATH))
+        if _daily_task_time != previous:
+            logger.info(f"Reloaded daily task time: {_daily_task_time['hour']:02d}:{_daily_task_time['minute']:02d}")
+    except Exception as e:
+        logger.error(f"Failed to reload scheduler config, keeping current daily task time: {e}")
+
 def calculate_seconds_until_daily_task():
     """Calculate seconds until the configured daily task time."""
     now = datetime.now()
-    
-    # Get time from config, or use fallback values
-    config = load_config()
-    scheduler_config = config.get("scheduler", {})
-    hour = scheduler_config.get("daily_task_hour", 23)
-    minute = scheduler_config.get("daily_task_minute", 55)
+    hour = _daily_task_time["hour"]
+    minute = _daily_task_time["minute"]
     
     target_today = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
     
@@ -868,21 +803,23 @@ def calculate_seconds_until_daily_task():
     seconds_until_target = (target_today - now).total_seconds()
     return seconds_until_target
 
-def future_tasks_scheduler():
+async def future_tasks_scheduler():
     """
     Runs the calendar summary task at the scheduled time each day.
-    This function runs in an infinite loop in a separate thread.
+    This coroutine runs in an infinite loop alongside the main pipeline.
     It calculates the time until the next scheduled run, sleeps until then,
     and sends the calendar events summary by email.
     """
     while True:
+        # Pick up daily_task_hour/daily_task_minute edits without a restart
+        reload_daily_task_time()
         sleep_time = calculate_seconds_until_daily_task()
         next_run_time = datetime.now() + timedelta(seconds=sleep_time)
         logger.info(f"Next calendar summary task scheduled in {sleep_time:.0f} seconds (at {next_run_time.strftime('%Y-%m-%d %H:%M:%S')})")
         
-        time.sleep(sleep_time)
+        await asyncio.sleep(sleep_time)
         logger.info("Starting calendar summary task")
-        success = run_calendar_summary_task()
+        success = await asyncio.to_thread(run_calendar_summary_task)
         
         if success:
             logger.info("Calendar summary task completed successfully")
@@ -891,7 +828,12 @@ def future_tasks_scheduler():
 
 # === Setup Logging ===
 def setup_logging():
-    """Configure logging with console and file handlers."""
+    """
+    Configure logging with console and file handlers.
+    
+    Records are handed to a queue and written by a QueueListener thread, so
+    pipeline threads never block on console output or log file rotation.
+    """
     log_file = LOG_DIR / 'app_calender_scheduler.log'
     
     # Create handlers
@@ -910,13 +852,69 @@ def setup_logging():
     # Set logger level
     logger.setLevel(logging.INFO)
     
-    # Add handlers to logger
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    # Write records from a background thread, flushing what is queued at exit
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, console_handler, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # Add queue handler to logger
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     logger.info(f"Logging to: {log_file}")
 
 # === Main Scheduler ===
+async def pipeline_scheduler(interval):
+    """
+    Run the main pipeline every interval seconds.
+    
+    Runs are scheduled on a fixed cadence measured with the event loop's
+    monotonic clock, so the time a run takes doesn't accumulate as drift.
+    Runs missed while a long one was still going are skipped, not queued.
+    """
+    loop = asyncio.get_running_loop()
+    next_deadline = loop.time()
+    
+    while True:
+        logger.info("Starting main pipeline execution")
+        await run_pipeline_async()
+        
+        now = loop.time()
+        next_deadline += interval
+        missed_runs = 0
+        while next_deadline <= now:
+            next_deadline += interval
+            missed_runs += 1
+        if missed_runs:
+            logger.warning(f"Main pipeline run took longer than the interval, skipped {missed_runs} run(s)")
+        
+        delay = next_deadline - now
+        next_run = calculate_next_run_time(delay)
+        logger.info(f"Next main pipeline run at: {next_run.strftime('%Y-%m-%d %H:%M:%S')}")
+        await asyncio.sleep(delay)
+
+async def run_scheduler(config, interval):
+    """Run the main pipeline and the daily summary task on one event loop."""
+    set_daily_task_time(config)
+    if hasattr(signal, "SIGHUP"):
+        # Not available on Windows, where the time is only re-read each cycle
+        asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, reload_daily_task_time)
+    
+    # Start future tasks scheduler alongside the main pipeline
+    start_background_task(future_tasks_scheduler(), name="future_tasks_scheduler")
+    
+    # Log with the actual configured time
+    logger.info(f"Started future tasks scheduler (runs at {_daily_task_time['hour']:02d}:{_daily_task_time['minute']:02d} daily)")
+
+    if interval == 0:
+        # Run once mode
+        logger.info("Main pipeline: Running once and exiting")
+        await run_pipeline_async()
+    else:
+        # Main loop for recurring execution
+        logger.info("Main pipeline: Running in continuous mode")
+        await pipeline_scheduler(interval)
+
 def main():
     """Main function to run the Voice Calendar scheduler."""
     # Setup logging
@@ -936,34 +934,12 @@ def main():
         runs_per_day = config["scheduler"]["runs_per_day"]
         logger.info(f"Configuration loaded: {runs_per_day} runs per day (every {interval//60} minutes)")
 
-        # Start future tasks scheduler in parallel thread
-        future_tasks_thread = threading.Thread(target=future_tasks_scheduler, daemon=True)
-        future_tasks_thread.start()
-        
-        # Log with the actual configured time
-        hour = config["scheduler"].get("daily_task_hour", 23)
-        minute = config["scheduler"].get("daily_task_minute", 55)
-        logger.info(f"Started future tasks scheduler thread (runs at {hour:02d}:{minute:02d} daily)")
-
-        if interval == 0:
-            # Run once mode
-            logger.info("Main pipeline: Running once and exiting")
-            run_pipeline()
-        else:
-            # Main loop for recurring execution
-            logger.info("Main pipeline: Running in continuous mode")
-            while True:
-                logger.info("Starting main pipeline execution")
-                run_pipeline()
-                next_run = calculate_next_run_time(interval)
-                logger.info(f"Next main pipeline run at: {next_run.strftime('%Y-%m-%d %H:%M:%S')}")
-                time.sleep(interval)
+        asyncio.run(run_scheduler(config, interval))
 
     except KeyboardInterrupt:
         logger.info("Scheduler interrupted by user")
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Unexpected error: {e}")
 
 if __name__ == "__main__":
     main()
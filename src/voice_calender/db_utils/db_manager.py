@@ -1,113 +1,371 @@
+import atexit
+import csv
+import functools
+import io
 import logging
+import os
+import threading
+import weakref
+from contextlib import contextmanager
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
 import psycopg2
 from psycopg2 import pool
-from psycopg2.extras import RealDictCursor
-import json
+from psycopg2.extras import Json, NamedTupleCursor, execute_batch, execute_values, register_default_jsonb
 
+from voice_calender import json_utils
 from voice_calender.db_utils.db_config import get_db_url
 
 # Ensure logging is configured
 logger = logging.getLogger(__name__)
 
-# Connection pool for reusing database connections
+# Decode JSONB columns with the shared helpers (orjson when installed)
+register_default_jsonb(globally=True, loads=json_utils.loads)
+
+# Connection pool for reusing database connections, kept for the lifetime of the process
 connection_pool = None
 
+# Separate pool for the read paths, so reads don't queue behind writes and
+# a runaway query is cancelled by the server
+read_pool = None
+READ_POOL_OPTIONS = "-c default_transaction_read_only=on -c statement_timeout=5000"
+
+_pool_lock = threading.Lock()
+_atexit_registered = False
+
+# Column lists for the read queries: the short one covers list views (and is
+# answered from idx_calendar_events_upcoming_covering), the full one adds the text blobs
+EVENT_FIELDS_SHORT = "id, summary, start_datetime, end_datetime, location, status"
+EVENT_FIELDS_FULL = """id, summary, location, description, start_datetime, start_timezone,
+    end_datetime, end_timezone, attendees, recurrence, reminders,
+    visibility, color_id, transparency, status, created_at"""
+
+_DATE_RANGE_QUERY = """
+    SELECT {fields}
+    FROM calendar_events
+    WHERE start_datetime >= $1 AND start_datetime < $2
+    ORDER BY start_datetime ASC
+    LIMIT $3
+    """
+_UPCOMING_QUERY = """
+    SELECT {fields}
+    FROM calendar_events
+    WHERE start_datetime >= CURRENT_TIMESTAMP
+    ORDER BY start_datetime ASC
+    LIMIT $1
+    """
+
+# Fixed-shape hot queries, prepared once per connection and then run with EXECUTE
+PREPARED_STATEMENTS = {
+    "stmt_events_by_date_range_short": _DATE_RANGE_QUERY.format(fields=EVENT_FIELDS_SHORT),
+    "stmt_events_by_date_range_full": _DATE_RANGE_QUERY.format(fields=EVENT_FIELDS_FULL),
+    "stmt_upcoming_events_short": _UPCOMING_QUERY.format(fields=EVENT_FIELDS_SHORT),
+    "stmt_upcoming_events_full": _UPCOMING_QUERY.format(fields=EVENT_FIELDS_FULL),
+}
+
+# Pooled connections that already hold PREPARED_STATEMENTS. Weak references,
+# not id()s: the pool closes surplus connections inside putconn and CPython
+# reuses ids, so a new connection could look prepared when it is not
+_prepared_connections = weakref.WeakSet()
+
+# Holds the calendar date interval and query limit
+DB_UTILS_CONFIG_PATH = Path(__file__).parent / 'db_utils_config' / 'db_utils_config.json'
+
 def initialize_db():
-    """Initialize database and create necessary tables if they don't exist"""
-    global connection_pool
+    """
+    Initialize database and create necessary tables if they don't exist.
+    
+    The pools are created once per process; later calls reuse them. They are
+    only published once the schema is in place, so a failed attempt leaves
+    the module uninitialized and the next call tries again.
+    """
+    global connection_pool, read_pool, _atexit_registered
 
-    try:
-        # Initialize connection pool
-        db_url = get_db_url()
-        connection_pool = pool.SimpleConnectionPool(1, 10, db_url)
+    with _pool_lock:
+        if connection_pool is not None:
+            return True
+        
+        new_pool = None
+        new_read_pool = None
+        try:
+            # Initialize thread-safe connection pools, pipeline stages run on worker threads
+            db_url = get_db_url()
+            new_pool = pool.ThreadedConnectionPool(1, 10, db_url)
+            new_read_pool = pool.ThreadedConnectionPool(1, 10, db_url, options=READ_POOL_OPTIONS)
+            
+            # Check an existing table's schema, then create tables
+            conn = new_pool.getconn()
+            try:
+                check_schema_migrated(conn)
+                create_tables(conn)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                new_pool.putconn(conn)
+        except Exception as e:
+            for created_pool in (new_read_pool, new_pool):
+                if created_pool is not None:
+                    created_pool.closeall()
+            logger.error(f"Failed to initialize database: {str(e)}")
+            return False
         
-        # Create tables
-        create_tables()
-        logger.info("Database initialized successfully")
-        return True
-    except Exception as e:
-        logger.error(f"Failed to initialize database: {str(e)}")
-        return False
+        connection_pool = new_pool
+        read_pool = new_read_pool
+        if not _atexit_registered:
+            atexit.register(close_all_connections)
+            _atexit_registered = True
+    
+    logger.info("Database initialized successfully")
+    return True
+
+def get_connection(read_only=False):
+    """
+    Get a connection from the pool, creating the pools on first use
+    
+    Args:
+        read_only (bool, optional): Borrow from the read-only pool
+    """
+    # Unlocked fast path; initialize_db re-checks under _pool_lock, so racing
+    # first callers still end up sharing a single pool
+    if connection_pool is None and not initialize_db():
+        raise psycopg2.OperationalError("Database connection pool could not be initialized")
+    
+    return (read_pool if read_only else connection_pool).getconn()
+
+def return_connection(conn, read_only=False):
+    """
+    Return a connection to the pool it was borrowed from
+    
+    Args:
+        conn: Connection from get_connection
+        read_only (bool, optional): The connection came from the read-only pool
+    """
+    target_pool = read_pool if read_only else connection_pool
+    if target_pool is not None:
+        target_pool.putconn(conn)
 
-def get_connection():
-    """Get a connection from the pool"""
-    global connection_pool
+def prepare_statements(conn):
+    """
+    Prepare the hot queries on a connection the first time it is used
     
-    if connection_pool is None:
-        initialize_db()
+    The PREPAREs are committed right away so they outlive any later rollback
+    of the caller's transaction.
+    
+    Args:
+        conn: Connection borrowed from the pool
+    """
+    if conn in _prepared_connections and not conn.closed:
+        return
     
-    return connection_pool.getconn()
+    cur = conn.cursor()
+    for name, query in PREPARED_STATEMENTS.items():
+        cur.execute(f"PREPARE {name} AS {query}")
+    conn.commit()
+    _prepared_connections.add(conn)
 
-def return_connection(conn):
-    """Return a connection to the pool"""
-    global connection_pool
+@contextmanager
+def db_conn(read_only=False):
+    """
+    Borrow a connection from the pool for a with block
+    
+    Commits when the block completes, rolls back if it raises, and always
+    returns the connection to the pool.
     
-    if connection_pool is not None:
-        connection_pool.putconn(conn)
+    Args:
+        read_only (bool, optional): Use the read-only, statement_timeout pool
+    """
+    conn = get_connection(read_only)
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        return_connection(conn, read_only)
+
+# Secondary indexes on calendar_events, by name; create_tables and the
+# migration script both build them from here
+EVENT_INDEXES = {
+    # Index on end_datetime for faster range queries
+    "idx_calendar_events_end_datetime": "calendar_events(end_datetime)",
+    # Composite index for date range queries
+    "idx_calendar_events_date_range": "calendar_events(start_datetime, end_datetime)",
+    # Covering index so upcoming event lookups are answered by index-only scans
+    "idx_calendar_events_upcoming_covering":
+        "calendar_events(start_datetime) INCLUDE (id, summary, location, end_datetime, status)",
+}
 
-def create_tables():
-    """Create necessary tables if they don't exist"""
-    conn = None
+def create_tables(conn):
+    """
+    Create necessary tables if they don't exist
+    
+    Args:
+        conn: Connection to run the DDL on, the caller commits
+    """
     try:
-        conn = get_connection()
         cur = conn.cursor()
         
-        # Create calendar_events table with relaxed constraints
+        # Create calendar_events table with relaxed constraints and its indexes,
+        # sent as one batch so the whole schema costs a single round trip
         cur.execute("""
         CREATE TABLE IF NOT EXISTS calendar_events (
             id SERIAL PRIMARY KEY,
             summary TEXT,
             location TEXT,
             description TEXT,
-            start_dateTime TEXT,
-            start_timeZone TEXT,
-            end_dateTime TEXT,
-            end_timeZone TEXT,
-            attendees TEXT,         -- JSON string containing array of attendees
-            recurrence TEXT,        -- JSON string or comma-separated RRULEs
-            reminders TEXT,         -- JSON string containing reminder config
+            start_datetime TIMESTAMP WITH TIME ZONE,
+            start_timezone TEXT,
+            end_datetime TIMESTAMP WITH TIME ZONE,
+            end_timezone TEXT,
+            attendees JSONB,        -- Array of attendees
+            recurrence JSONB,       -- Array of RRULE strings
+            reminders JSONB,        -- Reminder config
             visibility TEXT,
-            colorId TEXT,
+            color_id TEXT,
             transparency TEXT,
             status TEXT,
             created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-        )
-        """)
-        
-        # Create index on calendar_events.start_dateTime for faster date-based queries
-        cur.execute("""
-        CREATE INDEX IF NOT EXISTS idx_calendar_events_start_datetime ON calendar_events(start_dateTime)
-        """)
-        
-        # Add index on calendar_events.end_dateTime for faster range queries
-        cur.execute("""
-        CREATE INDEX IF NOT EXISTS idx_calendar_events_end_datetime ON calendar_events(end_dateTime)
-        """)
-        
-        # Create a composite index for date range queries
-        cur.execute("""
-        CREATE INDEX IF NOT EXISTS idx_calendar_events_date_range ON calendar_events(start_dateTime, end_dateTime)
-        """)
+        );
+        """ + "".join(
+            f"\n        CREATE INDEX IF NOT EXISTS {name} ON {definition};"
+            for name, definition in EVENT_INDEXES.items()
+        ))
         
-        conn.commit()
         logger.info("Database tables created successfully")
     except Exception as e:
-        if conn:
-            conn.rollback()
         logger.error(f"Error creating tables: {str(e)}")
         raise
-    finally:
-        if conn:
-            return_connection(conn)
+
+def create_indexes_concurrently(conn):
+    """
+    Build EVENT_INDEXES on an existing table without blocking writers
+    
+    CONCURRENTLY cannot run inside a transaction block, so the connection is
+    switched to autocommit. An interrupted concurrent build leaves an INVALID
+    index behind that IF NOT EXISTS would silently keep, so those are dropped
+    and built again.
+    
+    Args:
+        conn: Connection to build the indexes on
+    """
+    conn.autocommit = True
+    cur = conn.cursor()
+    cur.execute("""
+    SELECT index_class.relname
+    FROM pg_index
+    JOIN pg_class index_class ON index_class.oid = pg_index.indexrelid
+    WHERE pg_index.indrelid = 'calendar_events'::regclass
+    AND NOT pg_index.indisvalid
+    """)
+    invalid_indexes = {name for (name,) in cur.fetchall()}
+    
+    for name, definition in EVENT_INDEXES.items():
+        if name in invalid_indexes:
+            logger.warning(f"Index {name} is invalid after an interrupted build, rebuilding it")
+            cur.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+        cur.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition}")
+
+# Columns an un-migrated calendar_events table still has, and the types
+# migrate_timestamp_schema converts away from
+LEGACY_COLUMNS = frozenset({"colorid"})
+LEGACY_COLUMN_TYPES = {
+    "start_datetime": "text",
+    "end_datetime": "text",
+    "attendees": "text",
+    "recurrence": "text",
+    "reminders": "text",
+}
+
+def check_schema_migrated(conn):
+    """
+    Refuse to run against a calendar_events table with the old schema
+    
+    CREATE TABLE IF NOT EXISTS keeps an existing table as it is, and the
+    inserts write color_id and JSONB values, so every save would fail.
+    
+    Args:
+        conn: Connection to read information_schema on
+    
+    Raises:
+        RuntimeError: The table still needs migrate_timestamp_schema
+    """
+    cur = conn.cursor()
+    cur.execute("""
+    SELECT column_name, data_type
+    FROM information_schema.columns
+    WHERE table_schema = 'public'
+    AND table_name = 'calendar_events'
+    """)
+    column_types = {column_name: data_type.lower() for column_name, data_type in cur.fetchall()}
+    
+    outdated = sorted(
+        column for column, data_type in column_types.items()
+        if column in LEGACY_COLUMNS or LEGACY_COLUMN_TYPES.get(column) == data_type
+    )
+    if outdated:
+        raise RuntimeError(
+            f"calendar_events uses the old schema (columns: {', '.join(outdated)}). "
+            "Run 'python -m voice_calender.db_utils.migrate_timestamp_schema' to upgrade it"
+        )
 
 def close_all_connections():
-    """Close all database connections"""
-    global connection_pool
+    """Close all database connections, runs automatically at interpreter exit"""
+    global connection_pool, read_pool
     
-    if connection_pool:
-        connection_pool.closeall()
-        connection_pool = None
-        logger.info("All database connections closed")
+    with _pool_lock:
+        if connection_pool:
+            connection_pool.closeall()
+            connection_pool = None
+            if read_pool:
+                read_pool.closeall()
+                read_pool = None
+            _prepared_connections.clear()
+            logger.info("All database connections closed")
+
+# Columns update_calendar_event may set
+UPDATABLE_COLUMNS = frozenset({
+    "summary", "location", "description", "start_datetime", "start_timezone",
+    "end_datetime", "end_timezone", "attendees", "recurrence", "reminders",
+    "visibility", "color_id", "transparency", "status"
+})
+
+# Columns stored as JSONB, their Python values are bound through psycopg2's Json adapter
+JSONB_COLUMNS = frozenset({"attendees", "recurrence", "reminders"})
+
+def as_timestamp(value):
+    """
+    Parse an ISO date/time string for a TIMESTAMP WITH TIME ZONE column
+    
+    Empty values become SQL NULL. Strings fromisoformat can't read (it is
+    stricter before Python 3.11) are passed through for Postgres to parse.
+    """
+    if not value:
+        return None
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return value
+    return value
+
+def as_jsonb(value):
+    """Wrap a value for a JSONB column, keeping None as SQL NULL"""
+    return None if value is None else Json(value, dumps=json_utils.dumps)
+
+# Columns written when saving events, and one row in that order for execute_values
+EVENT_INSERT_COLUMNS = """summary, location, description, start_datetime, start_timezone,
+    end_datetime, end_timezone, attendees, recurrence, reminders,
+    visibility, color_id, transparency, status"""
+EVENT_ROW_TEMPLATE = "(" + ", ".join(["%s"] * 14) + ")"
+
+# Batches of at least this many events are streamed with COPY instead of INSERT
+COPY_THRESHOLD = 100
+
+# NULL marker in the COPY CSV stream, so empty strings stay empty strings
+COPY_NULL = r'\N'
 
 def save_calendar_event(summary, start_datetime, end_datetime, location=None, description=None, 
                        start_timezone=None, end_timezone=None, attendees=None, recurrence=None, 
@@ -117,15 +375,15 @@ def save_calendar_event(summary, start_datetime, end_datetime, location=None, de
     
     Args:
         summary (str): Event summary/title
-        start_datetime (str): Start date and time in ISO format
-        end_datetime (str): End date and time in ISO format
+        start_datetime (str or datetime): Start date and time, ISO strings are accepted
+        end_datetime (str or datetime): End date and time, ISO strings are accepted
         location (str, optional): Event location
         description (str, optional): Event description
         start_timezone (str, optional): Timezone for the start time
         end_timezone (str, optional): Timezone for the end time
-        attendees (list, optional): List of attendees as dicts
-        recurrence (list/str, optional): Recurrence rules 
-        reminders (dict, optional): Reminder configuration
+        attendees (list, optional): List of attendees as dicts, stored as JSONB
+        recurrence (list, optional): Recurrence rules, stored as JSONB
+        reminders (dict, optional): Reminder configuration, stored as JSONB
         visibility (str, optional): Event visibility
         color_id (str, optional): Color identifier
         transparency (str, optional): Whether event blocks time
@@ -134,153 +392,240 @@ def save_calendar_event(summary, start_datetime, end_datetime, location=None, de
     Returns:
         int: ID of the inserted record or None if error
     """
-    conn = None
-    event_id = None
+    event_ids = save_calendar_events_bulk([dict(
+        summary=summary,
+        start_datetime=start_datetime,
+        end_datetime=end_datetime,
+        location=location,
+        description=description,
+        start_timezone=start_timezone,
+        end_timezone=end_timezone,
+        attendees=attendees,
+        recurrence=recurrence,
+        reminders=reminders,
+        visibility=visibility,
+        color_id=color_id,
+        transparency=transparency,
+        status=status
+    )])
+    return event_ids[0] if event_ids else None
+
+def save_calendar_events_bulk(events, bulk_load=False):
+    """
+    Save several calendar events in a single transaction
     
-    # Convert complex objects to JSON strings
-    if attendees and isinstance(attendees, list):
-        attendees = json.dumps(attendees)
-        
-    if recurrence and isinstance(recurrence, list):
-        recurrence = json.dumps(recurrence)
+    Batches smaller than COPY_THRESHOLD go out as one multi-row INSERT,
+    larger ones are streamed with COPY.
+    
+    Args:
+        events (list): Dicts with the same keys as the save_calendar_event arguments
+        bulk_load (bool): Commit without waiting for the WAL flush. A crash right
+            after the commit can lose this batch, but never corrupts data; meant
+            for re-runnable imports
         
-    if reminders and isinstance(reminders, dict):
-        reminders = json.dumps(reminders)
+    Returns:
+        list: IDs of the inserted records in input order, or [] if error
+    """
+    if not events:
+        return []
+    
+    rows = []
+    for event in events:
+        rows.append((
+            event.get('summary'), event.get('location'), event.get('description'),
+            as_timestamp(event.get('start_datetime')), event.get('start_timezone'),
+            as_timestamp(event.get('end_datetime')), event.get('end_timezone'),
+            as_jsonb(event.get('attendees')), as_jsonb(event.get('recurrence')),
+            as_jsonb(event.get('reminders')),
+            event.get('visibility'), event.get('color_id'),
+            event.get('transparency'), event.get('status')
+        ))
     
     try:
-        conn = get_connection()
-        cur = conn.cursor()
-        
-        # The database now expects timestamp values
-        # If inputs are ISO strings, psycopg2 will handle the conversion
-        # If they're already datetime objects, they'll work as is
-        
-        # Insert event
-        cur.execute("""
-        INSERT INTO calendar_events 
-        (summary, location, description, start_dateTime, start_timeZone, 
-        end_dateTime, end_timeZone, attendees, recurrence, reminders,
-        visibility, colorId, transparency, status)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        RETURNING id
-        """, (summary, location, description, start_datetime, start_timezone, 
-              end_datetime, end_timezone, attendees, recurrence, reminders,
-              visibility, color_id, transparency, status))
-        
-        event_id = cur.fetchone()[0]
+        with db_conn() as conn:
+            cur = conn.cursor()
+            
+            if bulk_load:
+                # Only affects this transaction
+                cur.execute("SET LOCAL synchronous_commit = off")
+            
+            if len(rows) >= COPY_THRESHOLD:
+                event_ids = copy_event_rows(cur, rows)
+            else:
+                result = execute_values(cur, f"""
+                INSERT INTO calendar_events ({EVENT_INSERT_COLUMNS})
+                VALUES %s
+                RETURNING id
+                """, rows, template=EVENT_ROW_TEMPLATE, page_size=500, fetch=True)
+                
+                event_ids = [row[0] for row in result]
+            
+            logger.info(f"Saved {len(event_ids)} calendar events in one transaction")
+            return event_ids
+            
+    except Exception as e:
+        logger.error(f"Error saving calendar events in bulk: {str(e)}")
+        return []
+
+def copy_event_rows(cur, rows):
+    """
+    Stream event rows into calendar_events with COPY
+    
+    COPY cannot return the generated keys, so the ids are drawn from the
+    table's sequence first and written along with the rows.
+    
+    Args:
+        cur: Cursor inside the caller's transaction
+        rows (list): Row tuples in EVENT_INSERT_COLUMNS order
         
-        conn.commit()
-        logger.info(f"Saved calendar event with ID: {event_id}")
-        return event_id
+    Returns:
+        list: IDs of the inserted records in input order
+    """
+    cur.execute(
+        "SELECT nextval(pg_get_serial_sequence('calendar_events', 'id')) FROM generate_series(1, %s)",
+        (len(rows),)
+    )
+    event_ids = [row[0] for row in cur.fetchall()]
+    
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for event_id, row in zip(event_ids, rows):
+        writer.writerow([event_id] + [
+            COPY_NULL if value is None
+            else json_utils.dumps(value.adapted) if isinstance(value, Json)
+            else value
+            for value in row
+        ])
+    buffer.seek(0)
+    
+    cur.copy_expert(
+        f"COPY calendar_events (id, {EVENT_INSERT_COLUMNS}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')",
+        buffer
+    )
+    return event_ids
+
+def exclusive_end_bound(end_date):
+    """
+    Turn the upper bound of a date range into an exclusive timestamp
+    
+    A plain date (``YYYY-MM-DD`` or a date object) includes the whole day, so the
+    bound becomes midnight of the following day; date-times are used as given.
+    
+    Args:
+        end_date (str, date or datetime): Upper bound of the range
         
-    except Exception as e:
-        if conn:
-            conn.rollback()
-        logger.error(f"Error saving calendar event: {str(e)}")
-        return None
-    finally:
-        if conn:
-            return_connection(conn)
+    Returns:
+        datetime: Bound for a ``start_datetime < bound`` comparison
+    """
+    if isinstance(end_date, datetime):
+        return end_date
+    if isinstance(end_date, date):
+        return datetime.combine(end_date + timedelta(days=1), time.min)
+    
+    end_dt = datetime.fromisoformat(str(end_date).replace('Z', '+00:00'))
+    if len(str(end_date)) == 10:  # YYYY-MM-DD format
+        return datetime.combine(end_dt.date() + timedelta(days=1), time.min)
+    return end_dt
 
-def get_events_by_date_range(start_date, end_date, limit=50):
+def get_events_by_date_range(start_date, end_date, limit=50, full=False):
     """
     Retrieve calendar events within a date range
     
     Args:
-        start_date (str): Start date in ISO format
-        end_date (str): End date in ISO format
+        start_date (str or datetime): Start date in ISO format
+        end_date (str or datetime): End date in ISO format, a plain date includes that whole day
         limit (int, optional): Maximum number of records to return
+        full (bool, optional): Return every column instead of EVENT_FIELDS_SHORT
         
     Returns:
-        list: List of calendar event records as dictionaries
+        list: Calendar event records as named tuples
     """
-    conn = None
     try:
-        conn = get_connection()
-        cur = conn.cursor(cursor_factory=RealDictCursor)
+        end_bound = exclusive_end_bound(end_date)
+        statement = "stmt_events_by_date_range_full" if full else "stmt_events_by_date_range_short"
         
-        cur.execute("""
-        SELECT *
-        FROM calendar_events
-        WHERE start_dateTime >= %s AND start_dateTime <= %s
-        ORDER BY start_dateTime ASC
-        LIMIT %s
-        """, (start_date, end_date, limit))
-        
-        results = cur.fetchall()
-        return results
+        with db_conn(read_only=True) as conn:
+            prepare_statements(conn)
+            cur = conn.cursor(cursor_factory=NamedTupleCursor)
+            
+            cur.execute(f"EXECUTE {statement} (%s, %s, %s)", (start_date, end_bound, limit))
+            
+            results = cur.fetchall()
+            return results
     except Exception as e:
         logger.error(f"Error retrieving calendar events by date range: {str(e)}")
         return []
-    finally:
-        if conn:
-            return_connection(conn)
 
-def get_upcoming_events(limit=10):
+def get_upcoming_events(limit=10, full=False):
     """
     Retrieve upcoming calendar events
     
     Args:
         limit (int, optional): Maximum number of records to return
+        full (bool, optional): Return every column instead of EVENT_FIELDS_SHORT
         
     Returns:
-        list: List of calendar event records as dictionaries
+        list: Calendar event records as named tuples
     """
-    conn = None
     try:
-        conn = get_connection()
-        cur = conn.cursor(cursor_factory=RealDictCursor)
-        
-        cur.execute("""
-        SELECT *
-        FROM calendar_events
-        WHERE start_dateTime >= CURRENT_TIMESTAMP
-        ORDER BY start_dateTime ASC
-        LIMIT %s
-        """, (limit,))
+        statement = "stmt_upcoming_events_full" if full else "stmt_upcoming_events_short"
         
-        results = cur.fetchall()
-        return results
+        with db_conn(read_only=True) as conn:
+            prepare_statements(conn)
+            cur = conn.cursor(cursor_factory=NamedTupleCursor)
+            
+            cur.execute(f"EXECUTE {statement} (%s)", (limit,))
+            
+            results = cur.fetchall()
+            return results
     except Exception as e:
         logger.error(f"Error retrieving upcoming events: {str(e)}")
         return []
-    finally:
-        if conn:
-            return_connection(conn)
 
-def get_calendar_events_by_config_interval():
+@functools.lru_cache(maxsize=1)
+def _load_db_utils_config(mtime_ns):
+    """Parse db_utils_config.json, cached per modification time"""
+    return json_utils.load_file(DB_UTILS_CONFIG_PATH)
+
+def get_db_utils_config():
+    """
+    Get the contents of db_utils_config.json
+    
+    The file is only parsed again after it changes on disk.
+    
+    Returns:
+        dict: Parsed configuration
+        
+    Raises:
+        FileNotFoundError: If the config file does not exist
+    """
+    return _load_db_utils_config(os.stat(DB_UTILS_CONFIG_PATH).st_mtime_ns)
+
+def get_calendar_events_by_config_interval(full=False):
     """
     Retrieve calendar events from the database based on the date interval 
     and limit configured in db_utils_config.json
     
+    Args:
+        full (bool, optional): Return every column instead of EVENT_FIELDS_SHORT
+        
     Returns:
-        list: List of calendar event records as dictionaries
+        list: Calendar event records as named tuples
     """
-    conn = None
     try:
         # Load the configuration to get the date interval
-        from pathlib import Path
-        import json
-        from datetime import datetime, timedelta
-        
-        # Get the config path
-        db_utils_dir = Path(__file__).parent
-        config_path = db_utils_dir / 'db_utils_config' / 'db_utils_config.json'
-        
-        # Load the config
-        if not config_path.exists():
-            logger.error(f"Config file not found at {config_path}")
+        try:
+            config = get_db_utils_config()
+        except FileNotFoundError:
+            logger.error(f"Config file not found at {DB_UTILS_CONFIG_PATH}")
             return []
-            
-        with open(config_path, 'r') as f:
-            config = json.load(f)
         
         # Get the date interval from config
         date_interval = config.get('calender_date_interval', [])
         
         # Default to today's date if interval is empty or invalid
         if not date_interval or len(date_interval) < 2:
-            today = datetime.now().strftime("%Y-%m-%d")
+            today = datetime.now().date().isoformat()
             logger.info(f"Using default date (today): {today}")
             start_date = today
             end_date = today
@@ -291,42 +636,62 @@ def get_calendar_events_by_config_interval():
         # Get the query limit from config (default to 100 if not specified)
         query_limit = config.get('query_limit', 100)
         
-        # Ensure dates have the right format for comparison with TIMESTAMP fields
-        # If only dates are specified (no time), append start/end of day time
-        if isinstance(start_date, str) and len(start_date) == 10:  # YYYY-MM-DD format
-            start_date = f"{start_date}T00:00:00"
+        # Bind real datetimes for the TIMESTAMP WITH TIME ZONE columns as a
+        # half-open interval, plain dates cover the whole day
+        start_date = datetime.fromisoformat(str(start_date).replace('Z', '+00:00'))
+        end_date = exclusive_end_bound(end_date)
         
-        if isinstance(end_date, str) and len(end_date) == 10:  # YYYY-MM-DD format
-            end_date = f"{end_date}T23:59:59"
+        statement = "stmt_events_by_date_range_full" if full else "stmt_events_by_date_range_short"
         
         # Get the database connection
-        conn = get_connection()
-        cur = conn.cursor(cursor_factory=RealDictCursor)
-        
-        # Query events within the date range
-        # psycopg2 will handle the conversion of ISO strings to proper timestamp values
-        cur.execute("""
-        SELECT *
-        FROM calendar_events
-        WHERE start_dateTime >= %s AND start_dateTime <= %s
-        ORDER BY start_dateTime ASC
-        LIMIT %s
-        """, (start_date, end_date, query_limit))
-        
-        results = cur.fetchall()
-        
-        logger.info(f"Retrieved {len(results)} calendar events between {start_date} and {end_date} (limit: {query_limit})")
-        return results
-        
+        with db_conn(read_only=True) as conn:
+            prepare_statements(conn)
+            cur = conn.cursor(cursor_factory=NamedTupleCursor)
+            
+            # Query events within the date range
+            # psycopg2 adapts the datetime bounds to timestamp values
+            cur.execute(f"EXECUTE {statement} (%s, %s, %s)", (start_date, end_date, query_limit))
+            
+            results = cur.fetchall()
+            
+            logger.info(f"Retrieved {len(results)} calendar events between {start_date} and {end_date} (limit: {query_limit})")
+            return results
+            
     except Exception as e:
-        logger.error(f"Error retrieving calendar events by config interval: {str(e)}")
-        logger.error(f"Detail: {type(e).__name__}: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error retrieving calendar events by config interval: {str(e)}")
         return []
-    finally:
-        if conn:
-            return_connection(conn)
+
+def build_update_set(fields):
+    """
+    Build the SET clause and bind values for an event update
+    
+    Columns are validated against UPDATABLE_COLUMNS and sorted, so the same
+    field set always produces the same SQL text.
+    
+    Args:
+        fields (dict): Values keyed by calendar_events column name
+        
+    Returns:
+        tuple: (set_clause, values)
+        
+    Raises:
+        ValueError: If a field is not an updatable column
+    """
+    unknown = [key for key in fields if key.lower() not in UPDATABLE_COLUMNS]
+    if unknown:
+        raise ValueError(f"Cannot update unknown calendar event columns: {', '.join(sorted(unknown))}")
+    
+    assignments = []
+    values = []
+    
+    for key in sorted(fields, key=str.lower):
+        assignments.append(f"{key.lower()} = %s")
+        if key.lower() in JSONB_COLUMNS:
+            values.append(as_jsonb(fields[key]))
+        else:
+            values.append(fields[key])
+    
+    return ", ".join(assignments), values
 
 def update_calendar_event(event_id, **kwargs):
     """
@@ -334,63 +699,90 @@ def update_calendar_event(event_id, **kwargs):
     
     Args:
         event_id (int): ID of the event to update
-        **kwargs: Fields to update
+        **kwargs: Fields to update, keyed by calendar_events column name
         
     Returns:
         bool: True if successful, False otherwise
+        
+    Raises:
+        ValueError: If a field is not an updatable column
     """
-    conn = None
+    set_clause, values = build_update_set(kwargs)
     
-    # Process complex objects
-    if 'attendees' in kwargs and isinstance(kwargs['attendees'], list):
-        kwargs['attendees'] = json.dumps(kwargs['attendees'])
-        
-    if 'recurrence' in kwargs and isinstance(kwargs['recurrence'], list):
-        kwargs['recurrence'] = json.dumps(kwargs['recurrence'])
-        
-    if 'reminders' in kwargs and isinstance(kwargs['reminders'], dict):
-        kwargs['reminders'] = json.dumps(kwargs['reminders'])
+    if not values:
+        logger.warning("No fields to update")
+        return False
+    
+    values.append(event_id)  # For the WHERE clause
     
     try:
-        conn = get_connection()
-        cur = conn.cursor()
-        
-        # Build the update query dynamically based on provided fields
-        fields = []
-        values = []
-        
-        for key, value in kwargs.items():
-            fields.append(f"{key} = %s")
-            values.append(value)
+        with db_conn() as conn:
+            cur = conn.cursor()
             
-        if not fields:
-            logger.warning("No fields to update")
-            return False
+            query = f"""
+            UPDATE calendar_events
+            SET {set_clause}
+            WHERE id = %s
+            RETURNING id
+            """
             
-        values.append(event_id)  # For the WHERE clause
-        
-        query = f"""
-        UPDATE calendar_events
-        SET {", ".join(fields)}
-        WHERE id = %s
-        """
-        
-        cur.execute(query, values)
-        
-        rows_affected = cur.rowcount
-        conn.commit()
+            cur.execute(query, values)
+            updated = cur.fetchone() is not None
+            
+            logger.info(f"Updated calendar event ID {event_id}: {'done' if updated else 'not found'}")
+            return updated
+            
+    except Exception as e:
+        logger.error(f"Error updating calendar event: {str(e)}")
+        return False
+
+def update_calendar_events_bulk(updates):
+    """
+    Update many calendar events in one transaction
+    
+    Updates that change the same set of columns share one statement, which
+    is sent with execute_batch so each page of rows is a single round trip.
+    
+    Args:
+        updates (list): (event_id, fields) pairs, with fields keyed by column
+            name as for update_calendar_event
         
-        logger.info(f"Updated calendar event ID {event_id}, {rows_affected} rows affected")
-        return rows_affected > 0
+    Returns:
+        bool: True if successful, False otherwise; per-row match counts are
+            not reported because execute_batch does not expose them
         
+    Raises:
+        ValueError: If a field is not an updatable column
+    """
+    # Group the bind rows by their SET clause
+    groups = {}
+    for event_id, fields in updates:
+        if not fields:
+            continue
+        set_clause, values = build_update_set(fields)
+        groups.setdefault(set_clause, []).append(values + [event_id])
+    
+    if not groups:
+        logger.warning("No fields to update")
+        return False
+    
+    try:
+        with db_conn() as conn:
+            cur = conn.cursor()
+            
+            for set_clause, rows in groups.items():
+                execute_batch(cur, f"""
+                UPDATE calendar_events
+                SET {set_clause}
+                WHERE id = %s
+                """, rows, page_size=200)
+            
+            logger.info(f"Applied {sum(len(rows) for rows in groups.values())} calendar event updates in one transaction")
+            return True
+            
     except Exception as e:
-        if conn:
-            conn.rollback()
-        logger.error(f"Error updating calendar event: {str(e)}")
+        logger.error(f"Error updating calendar events in bulk: {str(e)}")
         return False
-    finally:
-        if conn:
-            return_connection(conn)
 
 def delete_calendar_event(event_id):
     """
@@ -402,26 +794,19 @@ def delete_calendar_event(event_id):
     Returns:
         bool: True if successful, False otherwise
     """
-    conn = None
     try:
-        conn = get_connection()
-        cur = conn.cursor()
-        
-        cur.execute("""
-        DELETE FROM calendar_events
-        WHERE id = %s
-        """, (event_id,))
-        
-        rows_affected = cur.rowcount
-        conn.commit()
-        
-        logger.info(f"Deleted calendar event ID {event_id}, {rows_affected} rows affected")
-        return rows_affected > 0
+        with db_conn() as conn:
+            cur = conn.cursor()
+            
+            cur.execute("""
+            DELETE FROM calendar_events
+            WHERE id = %s
+            RETURNING id
+            """, (event_id,))
+            deleted = cur.fetchone() is not None
+            
+            logger.info(f"Deleted calendar event ID {event_id}: {'done' if deleted else 'not found'}")
+            return deleted
     except Exception as e:
-        if conn:
-            conn.rollback()
         logger.error(f"Error deleting calendar event: {str(e)}")
         return False
-    finally:
-        if conn:
-            return_connection(conn)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Typed views of calendar event data.
+
+Parsed events arrive as Google Calendar style dictionaries. These dataclasses
+extract and type-check the fields in a single pass so callers don't need
+chains of .get() calls and malformed input is rejected up front.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _optional_str(data: Dict[str, Any], key: str, coerce: bool = False) -> Optional[str]:
+    """
+    Get an optional string field, rejecting other types
+
+    With coerce, numbers and booleans are converted to strings and other
+    values are dropped with a warning instead.
+    """
+    value = data.get(key)
+    if value is None or isinstance(value, str):
+        return value
+    if not coerce:
+        raise TypeError(f"'{key}' must be a string, got {type(value).__name__}")
+    if isinstance(value, (int, float)):
+        return str(value)
+    logger.warning(f"Dropping '{key}': expected a string, got {type(value).__name__}")
+    return None
+
+
+@dataclass
+class TimePoint:
+    """Start or end of an event: a dateTime, or a date for all-day events"""
+    dateTime: Optional[str] = None
+    date: Optional[str] = None
+    timeZone: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]], coerce: bool = False) -> "TimePoint":
+        if data is None:
+            return cls()
+        if not isinstance(data, dict):
+            raise TypeError(f"Event time must be an object, got {type(data).__name__}")
+        return cls(
+            dateTime=_optional_str(data, 'dateTime', coerce),
+            date=_optional_str(data, 'date', coerce),
+            timeZone=_optional_str(data, 'timeZone', coerce),
+        )
+
+    @property
+    def value(self) -> str:
+        """The dateTime, falling back to the date, or '' when neither is set"""
+        return self.dateTime or self.date or ''
+
+
+@dataclass
+class CalendarEvent:
+    """A calendar event as produced by the parse entry agent"""
+    summary: str
+    start: TimePoint
+    end: TimePoint = field(default_factory=TimePoint)
+    location: Optional[str] = None
+    description: Optional[str] = None
+    attendees: Optional[List[Dict[str, Any]]] = None
+    recurrence: Optional[List[str]] = None
+    reminders: Optional[Dict[str, Any]] = None
+    visibility: Optional[str] = None
+    colorId: Optional[str] = None
+    transparency: Optional[str] = None
+    status: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], coerce: bool = False) -> "CalendarEvent":
+        """
+        Build an event from a Google Calendar style dictionary
+
+        Args:
+            data: Event dictionary
+            coerce: Convert numeric text fields to strings and drop other
+                mistyped ones instead of raising TypeError
+
+        Raises:
+            TypeError: If a field has the wrong type
+            ValueError: If summary or start is missing
+        """
+        if not isinstance(data, dict):
+            raise TypeError(f"Event must be an object, got {type(data).__name__}")
+
+        summary = _optional_str(data, 'summary', coerce)
+        if not summary:
+            raise ValueError("Event is missing 'summary'")
+
+        start = TimePoint.from_dict(data.get('start'), coerce)
+        if not start.value:
+            raise ValueError("Event is missing 'start'")
+
+        return cls(
+            summary=summary,
+            start=start,
+            end=TimePoint.from_dict(data.get('end'), coerce),
+            location=_optional_str(data, 'location', coerce),
+            description=_optional_str(data, 'description', coerce),
+            attendees=data.get('attendees'),
+            recurrence=data.get('recurrence'),
+            reminders=data.get('reminders'),
+            visibility=_optional_str(data, 'visibility', coerce),
+            # Google accepts numeric color ids, stored as text
+            colorId=str(data['colorId']) if data.get('colorId') is not None else None,
+            transparency=_optional_str(data, 'transparency', coerce),
+            status=_optional_str(data, 'status', coerce),
+        )
+
+    def to_db_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments for db_manager.save_calendar_event"""
+        return {
+            'summary': self.summary,
+            'start_datetime': self.start.value,
+            'end_datetime': self.end.value,
+            'location': self.location,
+            'description': self.description,
+            'start_timezone': self.start.timeZone,
+            'end_timezone': self.end.timeZone,
+            'attendees': self.attendees,
+            'recurrence': self.recurrence,
+            'reminders': self.reminders,
+            'visibility': self.visibility,
+            'color_id': self.colorId,
+            'transparency': self.transparency,
+            'status': self.status,
+        }
@@ -5,10 +5,13 @@ Database Migration Script for Timestamp Types
 This script updates the schema of an existing database to:
 1. Convert TEXT date columns to TIMESTAMP WITH TIME ZONE
 2. Add NOT NULL constraints to critical date fields
-3. Add additional indexes for performance
-4. Add created_at timestamp
+3. Convert the JSON text columns (attendees, recurrence, reminders) to JSONB
+4. Add additional indexes for performance
+5. Add created_at timestamp
+6. Rename the old colorId column to snake_case color_id
 
-Run this only if you have an existing database with the old schema.
+Databases created before these changes must be migrated: initialize_db
+refuses to start against the old schema.
 """
 
 import logging
@@ -25,6 +28,19 @@ logger = logging.getLogger(__name__)
 
 # Import from voice_calender package
 from voice_calender.db_utils.db_config import get_db_url
+from voice_calender.db_utils.db_manager import create_indexes_concurrently
+
+# USING expressions turning the old JSON text columns into JSONB; recurrence
+# may also hold comma-separated RRULEs, which become a JSON array
+JSONB_CONVERSIONS = {
+    'attendees': "NULLIF(attendees, '')::JSONB",
+    'recurrence': """CASE
+        WHEN NULLIF(recurrence, '') IS NULL THEN NULL
+        WHEN left(recurrence, 1) = '[' THEN recurrence::JSONB
+        ELSE to_jsonb(string_to_array(recurrence, ','))
+    END""",
+    'reminders': "NULLIF(reminders, '')::JSONB",
+}
 
 def migrate_schema():
     """Migrate the database schema to use proper timestamp fields"""
@@ -37,17 +53,16 @@ def migrate_schema():
         
         logger.info("Starting database schema migration...")
         
-        # 1. Check if the table exists
+        # 1. Fetch every column type in one query, no columns means no table
         cur.execute("""
-        SELECT EXISTS (
-            SELECT FROM information_schema.tables 
-            WHERE table_schema = 'public' 
-            AND table_name = 'calendar_events'
-        )
+        SELECT column_name, data_type
+        FROM information_schema.columns
+        WHERE table_schema = 'public'
+        AND table_name = 'calendar_events'
         """)
         
-        table_exists = cur.fetchone()[0]
-        if not table_exists:
+        column_types = {column_name: data_type.lower() for column_name, data_type in cur.fetchall()}
+        if not column_types:
             logger.info("Table 'calendar_events' doesn't exist. No migration needed.")
             return True
         
@@ -55,123 +70,74 @@ def migrate_schema():
         logger.info("Beginning transaction...")
         
         # 3. Check column types
-        cur.execute("""
-        SELECT column_name, data_type
-        FROM information_schema.columns
-        WHERE table_name = 'calendar_events'
-        AND (column_name = 'start_dateTime' OR column_name = 'end_dateTime')
-        """)
-        
-        columns = cur.fetchall()
         needs_migration = False
         
-        for column_name, data_type in columns:
-            if data_type.lower() == 'text':
+        for column_name in ('start_datetime', 'end_datetime'):
+            if column_types.get(column_name) == 'text':
                 needs_migration = True
                 logger.info(f"Column {column_name} is currently TEXT type. Will be migrated.")
         
         if not needs_migration:
             logger.info("Date columns are already proper timestamp types. Skipping column migration.")
         else:
-            # 4. Create temporary columns
-            logger.info("Creating temporary timestamp columns...")
-            cur.execute("""
-            ALTER TABLE calendar_events 
-            ADD COLUMN start_dateTime_new TIMESTAMP WITH TIME ZONE,
-            ADD COLUMN end_dateTime_new TIMESTAMP WITH TIME ZONE
-            """)
-            
-            # 5. Copy data with conversion
-            logger.info("Converting data from TEXT to TIMESTAMP WITH TIME ZONE...")
-            cur.execute("""
-            UPDATE calendar_events
-            SET 
-                start_dateTime_new = start_dateTime::TIMESTAMP WITH TIME ZONE,
-                end_dateTime_new = end_dateTime::TIMESTAMP WITH TIME ZONE
-            """)
-            
-            # 6. Drop old columns and rename new ones
-            logger.info("Replacing old columns with new timestamp columns...")
-            cur.execute("""
-            ALTER TABLE calendar_events 
-            DROP COLUMN start_dateTime,
-            DROP COLUMN end_dateTime,
-            RENAME COLUMN start_dateTime_new TO start_dateTime,
-            RENAME COLUMN end_dateTime_new TO end_dateTime
-            """)
-            
-            # 7. Add NOT NULL constraints
-            logger.info("Adding NOT NULL constraints...")
+            # 4-7. Convert the columns and add NOT NULL constraints in a single
+            # ALTER TABLE, so Postgres rewrites the table (and its indexes) once
+            # instead of copying every row into temporary columns first.
+            # It runs inside the migration transaction, so a failure leaves the table untouched.
+            logger.info("Converting date columns from TEXT to TIMESTAMP WITH TIME ZONE...")
             cur.execute("""
             ALTER TABLE calendar_events
-            ALTER COLUMN start_dateTime SET NOT NULL,
-            ALTER COLUMN end_dateTime SET NOT NULL
+            ALTER COLUMN start_datetime TYPE TIMESTAMP WITH TIME ZONE
+                USING NULLIF(start_datetime, '')::TIMESTAMP WITH TIME ZONE,
+            ALTER COLUMN end_datetime TYPE TIMESTAMP WITH TIME ZONE
+                USING NULLIF(end_datetime, '')::TIMESTAMP WITH TIME ZONE,
+            ALTER COLUMN start_datetime SET NOT NULL,
+            ALTER COLUMN end_datetime SET NOT NULL
             """)
             
-        # 8. Add created_at column if not exists
-        cur.execute("""
-        SELECT EXISTS (
-            SELECT FROM information_schema.columns 
-            WHERE table_name = 'calendar_events' 
-            AND column_name = 'created_at'
-        )
-        """)
-        
-        created_at_exists = cur.fetchone()[0]
-        if not created_at_exists:
-            logger.info("Adding created_at column...")
-            cur.execute("""
-            ALTER TABLE calendar_events
-            ADD COLUMN created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-            """)
+        # 8. Convert JSON text columns to JSONB
+        json_text_columns = [column for column in JSONB_CONVERSIONS if column_types.get(column) == 'text']
+        if json_text_columns:
+            logger.info(f"Converting {', '.join(json_text_columns)} from TEXT to JSONB...")
+            cur.execute("ALTER TABLE calendar_events " + ", ".join(
+                f"ALTER COLUMN {column} TYPE JSONB USING {JSONB_CONVERSIONS[column]}"
+                for column in json_text_columns
+            ))
         
-        # 9. Check and create indexes
-        # For end_dateTime
+        # 9. Add created_at column if not exists
         cur.execute("""
-        SELECT EXISTS (
-            SELECT FROM pg_indexes 
-            WHERE tablename = 'calendar_events' 
-            AND indexname = 'idx_calendar_events_end_datetime'
-        )
+        ALTER TABLE calendar_events
+        ADD COLUMN IF NOT EXISTS created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
         """)
         
-        end_index_exists = cur.fetchone()[0]
-        if not end_index_exists:
-            logger.info("Creating index on end_dateTime...")
+        # 9b. Rename colorId, which Postgres folded to colorid, to snake_case
+        if 'colorid' in column_types and 'color_id' not in column_types:
+            logger.info("Renaming colorid column to color_id...")
             cur.execute("""
-            CREATE INDEX idx_calendar_events_end_datetime 
-            ON calendar_events(end_dateTime)
+            ALTER TABLE calendar_events RENAME COLUMN colorid TO color_id
             """)
         
-        # For date range
+        # 10. Drop the redundant index
+        # The composite date range index leads with start_datetime, a separate one is redundant
+        logger.info("Dropping redundant index on start_datetime...")
         cur.execute("""
-        SELECT EXISTS (
-            SELECT FROM pg_indexes 
-            WHERE tablename = 'calendar_events' 
-            AND indexname = 'idx_calendar_events_date_range'
-        )
+        DROP INDEX IF EXISTS idx_calendar_events_start_datetime
         """)
         
-        range_index_exists = cur.fetchone()[0]
-        if not range_index_exists:
-            logger.info("Creating composite index on date range...")
-            cur.execute("""
-            CREATE INDEX idx_calendar_events_date_range 
-            ON calendar_events(start_dateTime, end_dateTime)
-            """)
-        
-        # 10. Commit the transaction
+        # 11. Commit the transaction
         conn.commit()
+        
+        # 12. Create missing indexes without blocking writers
+        logger.info("Creating missing indexes concurrently...")
+        create_indexes_concurrently(conn)
+        
         logger.info("Migration completed successfully!")
         return True
         
     except Exception as e:
         if conn:
             conn.rollback()
-        logger.error(f"Migration failed: {str(e)}")
-        logger.error(f"Detail: {type(e).__name__}: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"Migration failed: {str(e)}")
         return False
     finally:
         if conn:
@@ -8,11 +8,16 @@ with special handling for incomplete or inconsistent data.
 
 import logging
 import json
+import re
 from datetime import datetime, timedelta
 from voice_calender.db_utils.db_manager import save_calendar_event
+from voice_calender.db_utils.event_models import CalendarEvent
 
 logger = logging.getLogger(__name__)
 
+# Splits an ISO 8601 date-time into its local part and UTC offset suffix ('Z', '+02:00', '-0700')
+_ISO_TZ_RE = re.compile(r'^(.*?)(Z|[+-]\d{2}:?\d{2})?$')
+
 def validate_and_complete_event(event_data):
     """
     Validate event data and attempt to complete missing fields
@@ -30,6 +35,9 @@ def validate_and_complete_event(event_data):
     if not data:
         return False, None, "Event data is empty"
     
+    # One timestamp for every default filled in below
+    now = datetime.now()
+    
     # Check for summary
     if not data.get('summary'):
         # Try to generate a summary if possible
@@ -40,69 +48,63 @@ def validate_and_complete_event(event_data):
             logger.info(f"Generated summary from description: {summary_text}")
         else:
             # Create a placeholder summary with timestamp
-            ts = datetime.now().strftime("%Y-%m-%d %H:%M")
+            ts = now.strftime("%Y-%m-%d %H:%M")
             data['summary'] = f"Calendar Event {ts}"
             logger.info(f"Created placeholder summary: {data['summary']}")
     
-    # Process start date/time
-    start_data = data.get('start', {})
-    start_datetime = start_data.get('dateTime') or start_data.get('date')
+    # Process start date/time, the sub-dicts are looked up once and filled in place
+    start = data.setdefault('start', {})
+    end = data.setdefault('end', {})
     
-    if not start_datetime:
+    if not (start.get('dateTime') or start.get('date')):
         # No start time specified, use current time
-        now = datetime.now()
-        data['start'] = data.get('start', {})
-        data['start']['dateTime'] = now.isoformat()
-        logger.info(f"Using current time for missing start time: {data['start']['dateTime']}")
+        start['dateTime'] = now.isoformat()
+        logger.info(f"Using current time for missing start time: {start['dateTime']}")
     
     # Process end date/time
-    end_data = data.get('end', {})
-    end_datetime = end_data.get('dateTime') or end_data.get('date')
-    
-    if not end_datetime:
+    if not (end.get('dateTime') or end.get('date')):
         # No end time, create one based on start
-        data['end'] = data.get('end', {})
-        
         # Use start date/time as basis
-        if 'dateTime' in data.get('start', {}):
+        if 'dateTime' in start:
             # Parse the start time and add 1 hour
             try:
-                start_dt = data['start']['dateTime']
+                start_dt = start['dateTime']
                 
                 # Handle different formats
                 if 'T' in start_dt:
-                    if '+' in start_dt:
-                        dt_part, tz_part = start_dt.split('+', 1)
-                        tz_info = '+' + tz_part
-                    elif 'Z' in start_dt:
-                        dt_part = start_dt.replace('Z', '')
-                        tz_info = 'Z'
-                    else:
-                        dt_part = start_dt
-                        tz_info = ''
-                    
-                    # Parse datetime
-                    dt_obj = datetime.fromisoformat(dt_part.replace('Z', ''))
+                    # Split off the offset in one pass and parse only the local part,
+                    # adding an hour never changes the offset so it is reused verbatim
+                    naive, tz = _ISO_TZ_RE.match(start_dt).group(1, 2)
+                    dt_obj = datetime.fromisoformat(naive)
                     
                     # Add duration
                     end_dt = dt_obj + timedelta(hours=1)
                     
-                    # Format back to ISO
-                    data['end']['dateTime'] = end_dt.isoformat() + tz_info
-                    logger.info(f"Created end time 1 hour after start: {data['end']['dateTime']}")
+                    # Format back to ISO, in the same offset notation as the start
+                    end['dateTime'] = end_dt.isoformat() + (tz or '')
+                    logger.info(f"Created end time 1 hour after start: {end['dateTime']}")
                 else:
                     # Just copy start time to end time if format is unknown
-                    data['end']['dateTime'] = data['start']['dateTime']
+                    end['dateTime'] = start_dt
             except (ValueError, TypeError) as e:
                 logger.warning(f"Error calculating end time: {e}")
                 # Fallback: just use the same value
-                data['end']['dateTime'] = data['start']['dateTime']
-        elif 'date' in data.get('start', {}):
+                end['dateTime'] = start['dateTime']
+        elif 'date' in start:
             # For all-day events, use the same date
-            data['end']['date'] = data['start']['date']
+            end['date'] = start['date']
     
     return True, data, ""
 
+def _is_complete(event_data):
+    """Check whether an event already has everything validate_and_complete_event would fill in"""
+    return bool(
+        event_data
+        and event_data.get('summary')
+        and (event_data.get('start') or {}).get('dateTime')
+        and (event_data.get('end') or {}).get('dateTime')
+    )
+
 def save_event_flexible(event_data):
     """
     Save calendar event with flexible validation
@@ -114,54 +116,23 @@ def save_event_flexible(event_data):
         int or None: Database ID of the saved event, or None if save failed
     """
     try:
-        # Validate and complete event data
-        valid, completed_data, error = validate_and_complete_event(event_data)
-        
-        if not valid:
-            logger.error(f"Invalid event data: {error}")
-            return None
-        
-        # Extract fields needed for database
-        summary = completed_data.get('summary', '')
-        
-        # Extract start date/time
-        start_data = completed_data.get('start', {})
-        start_datetime = start_data.get('dateTime') or start_data.get('date') or ''
-        start_timezone = start_data.get('timeZone')
-        
-        # Extract end date/time
-        end_data = completed_data.get('end', {})
-        end_datetime = end_data.get('dateTime') or end_data.get('date') or ''
-        end_timezone = end_data.get('timeZone')
+        if _is_complete(event_data):
+            # Nothing to complete, skip the validation pass
+            completed_data = event_data
+        else:
+            # Validate and complete event data
+            valid, completed_data, error = validate_and_complete_event(event_data)
+            
+            if not valid:
+                logger.error(f"Invalid event data: {error}")
+                return None
         
-        # Extract other optional fields
-        location = completed_data.get('location')
-        description = completed_data.get('description')
-        attendees = completed_data.get('attendees')
-        recurrence = completed_data.get('recurrence')
-        reminders = completed_data.get('reminders')
-        visibility = completed_data.get('visibility')
-        color_id = completed_data.get('colorId')
-        transparency = completed_data.get('transparency')
-        status = completed_data.get('status')
+        # Extract fields needed for database in one pass; a mistyped text
+        # field (e.g. a numeric location) is converted or dropped, not fatal
+        event = CalendarEvent.from_dict(completed_data, coerce=True)
         
         # Save to database
-        event_id = save_calendar_event(
-            summary=summary,
-            start_datetime=start_datetime,
-            end_datetime=end_datetime,
-            location=location,
-            description=description,
-            start_timezone=start_timezone,
-            end_timezone=end_timezone,
-            attendees=attendees,
-            recurrence=recurrence,
-            reminders=reminders,
-            visibility=visibility,
-            color_id=color_id,
-            transparency=transparency,
-            status=status
-        )
+        event_id = save_calendar_event(**event.to_db_kwargs())
         
         if event_id:
             logger.info(f"Successfully saved event to database with ID: {event_id}")
@@ -170,7 +141,5 @@ def save_event_flexible(event_data):
         
         return event_id
     except Exception as e:
-        logger.error(f"Error in save_event_flexible: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error in save_event_flexible: {str(e)}")
         return None 
\ No newline at end of file
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Tests for the query helpers in db_manager that don't need a database.
+"""
+
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("psycopg2")
+
+from psycopg2.extras import Json
+
+from voice_calender.db_utils import db_manager
+
+
+def test_exclusive_end_bound_keeps_datetimes():
+    bound = datetime(2025, 4, 10, 15, 30)
+    assert db_manager.exclusive_end_bound(bound) is bound
+
+
+def test_exclusive_end_bound_includes_whole_date():
+    expected = datetime(2025, 4, 11)
+    assert db_manager.exclusive_end_bound(date(2025, 4, 10)) == expected
+    assert db_manager.exclusive_end_bound('2025-04-10') == expected
+
+
+def test_exclusive_end_bound_parses_iso_datetimes():
+    assert db_manager.exclusive_end_bound('2025-04-10T15:30:00Z') == \
+        datetime(2025, 4, 10, 15, 30, tzinfo=timezone.utc)
+    assert db_manager.exclusive_end_bound('2025-04-10T15:30:00+02:00') == \
+        datetime(2025, 4, 10, 15, 30, tzinfo=timezone(timedelta(hours=2)))
+
+
+def test_build_update_set_sorts_and_lowercases_columns():
+    clause, values = db_manager.build_update_set({'Summary': 'New', 'location': 'Here'})
+    assert clause == "location = %s, summary = %s"
+    assert values == ['Here', 'New']
+
+
+def test_build_update_set_wraps_jsonb_columns():
+    clause, values = db_manager.build_update_set({'attendees': [{'email': 'a@example.com'}]})
+    assert clause == "attendees = %s"
+    assert isinstance(values[0], Json)
+    assert values[0].adapted == [{'email': 'a@example.com'}]
+
+
+def test_build_update_set_rejects_unknown_columns():
+    with pytest.raises(ValueError, match="id, summary; DROP"):
+        db_manager.build_update_set({'summary; DROP': 'x', 'id': 1, 'location': 'ok'})
+
+
+class _FakeCursor:
+    def execute(self, query, params=None):
+        pass
+
+
+class _FakeConnection:
+    def cursor(self):
+        return _FakeCursor()
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    """Route save_calendar_events_bulk to a fake connection and record the write path"""
+    calls = []
+
+    @contextmanager
+    def fake_db_conn(read_only=False):
+        yield _FakeConnection()
+
+    def fake_execute_values(cur, query, rows, **kwargs):
+        calls.append(('execute_values', len(rows)))
+        return [(i + 1,) for i in range(len(rows))]
+
+    def fake_copy_event_rows(cur, rows):
+        calls.append(('copy', len(rows)))
+        return list(range(1, len(rows) + 1))
+
+    monkeypatch.setattr(db_manager, 'db_conn', fake_db_conn)
+    monkeypatch.setattr(db_manager, 'execute_values', fake_execute_values)
+    monkeypatch.setattr(db_manager, 'copy_event_rows', fake_copy_event_rows)
+    return calls
+
+
+def _events(count):
+    return [{'summary': f"Event {i}", 'start_datetime': '2025-04-10T09:00:00'} for i in range(count)]
+
+
+def test_small_batches_use_execute_values(fake_db):
+    count = db_manager.COPY_THRESHOLD - 1
+    assert db_manager.save_calendar_events_bulk(_events(count)) == list(range(1, count + 1))
+    assert fake_db == [('execute_values', count)]
+
+
+def test_large_batches_use_copy(fake_db):
+    count = db_manager.COPY_THRESHOLD
+    assert db_manager.save_calendar_events_bulk(_events(count)) == list(range(1, count + 1))
+    assert fake_db == [('copy', count)]
+
+
+def test_empty_batch_skips_the_database(fake_db):
+    assert db_manager.save_calendar_events_bulk([]) == []
+    assert fake_db == []
+
+
+
+class _SchemaCursor:
+    def __init__(self, columns):
+        self.columns = columns
+
+    def execute(self, query, params=None):
+        pass
+
+    def fetchall(self):
+        return self.columns
+
+
+class _SchemaConnection:
+    """Fake connection whose information_schema lists the given columns"""
+    def __init__(self, columns):
+        self.columns = columns
+
+    def cursor(self):
+        return _SchemaCursor(self.columns)
+
+
+def test_check_schema_migrated_accepts_current_schema():
+    db_manager.check_schema_migrated(_SchemaConnection([
+        ('color_id', 'text'), ('start_datetime', 'timestamp with time zone'), ('attendees', 'jsonb'),
+    ]))
+
+
+def test_check_schema_migrated_names_old_columns():
+    conn = _SchemaConnection([
+        ('colorid', 'text'), ('start_datetime', 'TEXT'), ('attendees', 'text'), ('summary', 'text'),
+    ])
+    with pytest.raises(RuntimeError, match="attendees, colorid, start_datetime.*migrate_timestamp_schema"):
+        db_manager.check_schema_migrated(conn)
+
+
+class _FakePool:
+    """Stands in for ThreadedConnectionPool, handing out one fake connection"""
+    instances = []
+
+    def __init__(self, minconn, maxconn, dsn, **kwargs):
+        self.closed = False
+        self.conn = _SchemaConnection([])
+        self.conn.commit = self.conn.rollback = lambda: None
+        _FakePool.instances.append(self)
+
+    def getconn(self):
+        return self.conn
+
+    def putconn(self, conn):
+        pass
+
+    def closeall(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_pools(monkeypatch):
+    _FakePool.instances = []
+    monkeypatch.setattr(db_manager.pool, 'ThreadedConnectionPool', _FakePool)
+    monkeypatch.setattr(db_manager, 'get_db_url', lambda: "postgresql://test")
+    monkeypatch.setattr(db_manager, 'connection_pool', None)
+    monkeypatch.setattr(db_manager, 'read_pool', None)
+    monkeypatch.setattr(db_manager, '_atexit_registered', True)
+    return _FakePool.instances
+
+
+def test_failed_initialization_closes_pools_and_can_retry(fake_pools, monkeypatch):
+    def failing_create_tables(conn):
+        raise RuntimeError("no permission")
+
+    monkeypatch.setattr(db_manager, 'create_tables', failing_create_tables)
+    assert db_manager.initialize_db() is False
+    assert db_manager.connection_pool is None and db_manager.read_pool is None
+    assert len(fake_pools) == 2 and all(created.closed for created in fake_pools)
+
+    monkeypatch.setattr(db_manager, 'create_tables', lambda conn: None)
+    assert db_manager.initialize_db() is True
+    assert db_manager.connection_pool is fake_pools[2]
+    assert db_manager.read_pool is fake_pools[3]
+
+
+class _IndexConnection:
+    """Fake connection reporting the given indexes as invalid and recording statements"""
+    def __init__(self, invalid):
+        self.invalid = invalid
+        self.statements = []
+        self.autocommit = False
+
+    def cursor(self):
+        return self
+
+    def execute(self, query, params=None):
+        self.statements.append(" ".join(query.split()))
+
+    def fetchall(self):
+        return [(name,) for name in self.invalid]
+
+
+def test_create_indexes_concurrently_rebuilds_invalid_indexes():
+    conn = _IndexConnection(["idx_calendar_events_date_range"])
+    db_manager.create_indexes_concurrently(conn)
+    assert conn.autocommit
+    statements = conn.statements[1:]
+    assert statements == [
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_calendar_events_end_datetime ON calendar_events(end_datetime)",
+        "DROP INDEX CONCURRENTLY IF EXISTS idx_calendar_events_date_range",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_calendar_events_date_range "
+        "ON calendar_events(start_datetime, end_datetime)",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_calendar_events_upcoming_covering "
+        "ON calendar_events(start_datetime) INCLUDE (id, summary, location, end_datetime, status)",
+    ]
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for the typed calendar event views.
+"""
+
+import pytest
+
+from voice_calender.db_utils.event_models import CalendarEvent, TimePoint
+
+
+def test_time_point_value_prefers_datetime():
+    point = TimePoint.from_dict({'dateTime': '2025-04-10T09:00:00', 'date': '2025-04-10'})
+    assert point.value == '2025-04-10T09:00:00'
+
+
+def test_time_point_value_falls_back_to_date():
+    assert TimePoint.from_dict({'date': '2025-04-10'}).value == '2025-04-10'
+    assert TimePoint.from_dict(None).value == ''
+
+
+def test_time_point_rejects_non_dict():
+    with pytest.raises(TypeError):
+        TimePoint.from_dict('2025-04-10')
+
+
+def test_from_dict_parses_google_style_event():
+    event = CalendarEvent.from_dict({
+        'summary': 'Dentist',
+        'start': {'dateTime': '2025-04-10T09:00:00+01:00', 'timeZone': 'Europe/Lisbon'},
+        'end': {'dateTime': '2025-04-10T10:00:00+01:00'},
+        'attendees': [{'email': 'a@example.com'}],
+        'colorId': 5,
+    })
+    assert event.summary == 'Dentist'
+    assert event.start.timeZone == 'Europe/Lisbon'
+    assert event.attendees == [{'email': 'a@example.com'}]
+    assert event.colorId == '5'
+
+
+@pytest.mark.parametrize('data', [
+    {'start': {'date': '2025-04-10'}},
+    {'summary': '', 'start': {'date': '2025-04-10'}},
+    {'summary': 'No start'},
+    {'summary': 'Empty start', 'start': {}},
+])
+def test_from_dict_requires_summary_and_start(data):
+    with pytest.raises(ValueError):
+        CalendarEvent.from_dict(data)
+
+
+@pytest.mark.parametrize('data', [
+    ['not', 'a', 'dict'],
+    {'summary': 42, 'start': {'date': '2025-04-10'}},
+    {'summary': 'Bad location', 'start': {'date': '2025-04-10'}, 'location': ['x']},
+    {'summary': 'Bad start', 'start': '2025-04-10'},
+])
+def test_from_dict_rejects_wrong_types(data):
+    with pytest.raises(TypeError):
+        CalendarEvent.from_dict(data)
+
+
+def test_to_db_kwargs_maps_to_column_names():
+    event = CalendarEvent.from_dict({
+        'summary': 'Standup',
+        'start': {'dateTime': '2025-04-10T09:00:00Z', 'timeZone': 'UTC'},
+        'colorId': '2',
+    })
+    kwargs = event.to_db_kwargs()
+    assert kwargs['summary'] == 'Standup'
+    assert kwargs['start_datetime'] == '2025-04-10T09:00:00Z'
+    assert kwargs['start_timezone'] == 'UTC'
+    assert kwargs['end_datetime'] == ''
+    assert kwargs['end_timezone'] is None
+    assert kwargs['color_id'] == '2'
+    assert 'colorId' not in kwargs
+
+
+def test_from_dict_coerce_converts_numbers_and_drops_other_types():
+    event = CalendarEvent.from_dict({
+        'summary': 'Flat viewing',
+        'start': {'dateTime': '2025-04-10T09:00:00'},
+        'location': 221,
+        'description': ['not', 'text'],
+    }, coerce=True)
+    assert event.location == '221'
+    assert event.description is None
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for filling in missing event fields before saving.
+"""
+
+import pytest
+
+pytest.importorskip("psycopg2")
+
+from voice_calender.db_utils import save_event_helper
+from voice_calender.db_utils.save_event_helper import _ISO_TZ_RE, validate_and_complete_event
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('2025-04-10T09:00:00', ('2025-04-10T09:00:00', None)),
+    ('2025-04-10T09:00:00Z', ('2025-04-10T09:00:00', 'Z')),
+    ('2025-04-10T09:00:00+02:00', ('2025-04-10T09:00:00', '+02:00')),
+    ('2025-04-10T09:00:00-0700', ('2025-04-10T09:00:00', '-0700')),
+])
+def test_iso_tz_re_splits_offset(value, expected):
+    assert _ISO_TZ_RE.match(value).group(1, 2) == expected
+
+
+@pytest.mark.parametrize('start, end', [
+    ('2025-04-10T09:00:00', '2025-04-10T10:00:00'),
+    ('2025-04-10T23:30:00Z', '2025-04-11T00:30:00Z'),
+    ('2025-04-10T09:00:00+02:00', '2025-04-10T10:00:00+02:00'),
+    ('2025-04-10T09:00:00-0700', '2025-04-10T10:00:00-0700'),
+])
+def test_end_defaults_to_one_hour_after_start(start, end):
+    is_valid, data, error = validate_and_complete_event({'summary': 'Call', 'start': {'dateTime': start}})
+    assert is_valid and error == ""
+    assert data['end']['dateTime'] == end
+
+
+def test_all_day_event_ends_on_start_date():
+    is_valid, data, _ = validate_and_complete_event({'summary': 'Holiday', 'start': {'date': '2025-04-10'}})
+    assert is_valid
+    assert data['end'] == {'date': '2025-04-10'}
+
+
+def test_empty_event_is_rejected():
+    assert validate_and_complete_event({}) == (False, None, "Event data is empty")
+
+
+def test_save_event_flexible_keeps_events_with_mistyped_fields(monkeypatch):
+    saved = []
+
+    def fake_save_calendar_event(**kwargs):
+        saved.append(kwargs)
+        return 7
+
+    monkeypatch.setattr(save_event_helper, 'save_calendar_event', fake_save_calendar_event)
+    event_id = save_event_helper.save_event_flexible({
+        'summary': 'Flat viewing',
+        'start': {'dateTime': '2025-04-10T09:00:00'},
+        'location': 221,
+        'visibility': {'level': 'private'},
+    })
+    assert event_id == 7
+    assert saved[0]['location'] == '221'
+    assert saved[0]['visibility'] is None
@@ -5,19 +5,47 @@ Calendar Event Writer
 A simple script with functions to write calendar event data to the database.
 """
 
-import json
 import logging
 from typing import Dict, Any, Optional, Union, List
 
-from voice_calender.db_utils.db_manager import save_calendar_event, initialize_db
+from voice_calender.db_utils.db_manager import save_calendar_event, save_calendar_events_bulk, initialize_db
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Handlers are left to the application, main() configures them when run as a script
 logger = logging.getLogger(__name__)
 
+def event_to_db_fields(event_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map an event in Google Calendar format to save_calendar_event arguments
+    
+    Args:
+        event_data: Dictionary containing event data, see write_event_to_db
+    
+    Returns:
+        Dict of keyword arguments for save_calendar_event, also accepted by
+        save_calendar_events_bulk
+    """
+    # Handle start and end times
+    start = event_data.get('start') or {}
+    end = event_data.get('end') or {}
+    
+    # Complex fields are stored as JSONB, the db layer adapts them
+    return dict(
+        summary=event_data.get('summary'),
+        start_datetime=start.get('dateTime'),
+        end_datetime=end.get('dateTime'),
+        location=event_data.get('location'),
+        description=event_data.get('description'),
+        start_timezone=start.get('timeZone'),
+        end_timezone=end.get('timeZone'),
+        attendees=event_data.get('attendees'),
+        recurrence=event_data.get('recurrence'),
+        reminders=event_data.get('reminders'),
+        visibility=event_data.get('visibility'),
+        color_id=event_data.get('colorId'),
+        transparency=event_data.get('transparency'),
+        status=event_data.get('status')
+    )
+
 def write_event_to_db(event_data: Dict[str, Any]) -> Optional[int]:
     """
     Write a calendar event to the database
@@ -63,60 +91,10 @@ def write_event_to_db(event_data: Dict[str, Any]) -> Optional[int]:
     Returns:
         int: ID of the inserted record or None if error
     """
-    # Extract fields from the event data
     summary = event_data.get('summary')
-    location = event_data.get('location')
-    description = event_data.get('description')
-    
-    # Handle start and end times
-    start_datetime = None
-    start_timezone = None
-    if 'start' in event_data:
-        start_datetime = event_data['start'].get('dateTime')
-        start_timezone = event_data['start'].get('timeZone')
-    
-    end_datetime = None
-    end_timezone = None
-    if 'end' in event_data:
-        end_datetime = event_data['end'].get('dateTime')
-        end_timezone = event_data['end'].get('timeZone')
-    
-    # Handle complex fields
-    attendees = event_data.get('attendees')
-    if attendees and isinstance(attendees, list):
-        attendees = json.dumps(attendees)
-        
-    recurrence = event_data.get('recurrence')
-    if recurrence and isinstance(recurrence, list):
-        recurrence = json.dumps(recurrence)
-        
-    reminders = event_data.get('reminders')
-    if reminders and isinstance(reminders, dict):
-        reminders = json.dumps(reminders)
-    
-    # Other fields
-    visibility = event_data.get('visibility')
-    color_id = event_data.get('colorId')
-    transparency = event_data.get('transparency')
-    status = event_data.get('status')
     
     # Save the event to the database
-    event_id = save_calendar_event(
-        summary=summary,
-        start_datetime=start_datetime,
-        end_datetime=end_datetime,
-        location=location,
-        description=description,
-        start_timezone=start_timezone,
-        end_timezone=end_timezone,
-        attendees=attendees,
-        recurrence=recurrence,
-        reminders=reminders,
-        visibility=visibility,
-        color_id=color_id,
-        transparency=transparency,
-        status=status
-    )
+    event_id = save_calendar_event(**event_to_db_fields(event_data))
     
     if event_id:
         logger.info(f"Successfully wrote event '{summary}' to database with ID: {event_id}")
@@ -127,20 +105,16 @@ def write_event_to_db(event_data: Dict[str, Any]) -> Optional[int]:
 
 def write_events_to_db(events_list: List[Dict[str, Any]]) -> List[int]:
     """
-    Write multiple calendar events to the database
+    Write multiple calendar events to the database in one transaction
     
     Args:
         events_list: List of dictionaries containing event data
     
     Returns:
-        List of event IDs that were successfully inserted
+        List of event IDs that were successfully inserted; the batch is saved
+        as a whole, so this is empty if the insert failed
     """
-    event_ids = []
-    
-    for event_data in events_list:
-        event_id = write_event_to_db(event_data)
-        if event_id:
-            event_ids.append(event_id)
+    event_ids = save_calendar_events_bulk([event_to_db_fields(event_data) for event_data in events_list])
     
     logger.info(f"Successfully wrote {len(event_ids)} out of {len(events_list)} events to database")
     return event_ids
@@ -196,4 +170,8 @@ def main():
     print(f"Wrote event to database with ID: {event_id}")
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     main() 
\ No newline at end of file
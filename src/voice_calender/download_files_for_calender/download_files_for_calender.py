@@ -28,6 +28,8 @@ from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload
 
+from voice_calender import json_utils
+
 # Initialize paths - handling both frozen (PyInstaller) and regular Python execution
 if getattr(sys, 'frozen', False):
     # Running as compiled executable
@@ -45,6 +47,9 @@ LOGS_DIR = SCRIPT_DIR / "logs"
 # Make sure the log directory exists
 LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
+# Drive changes feed position saved between runs
+CHANGES_STATE_FILE = SCRIPT_DIR / "drive_changes_state.json"
+
 # Updated path to the configuration file
 CONFIG_DIR = PROJECT_ROOT / "project_modules_configs" / "config_dwnload_files"
 CONFIG_FILE = CONFIG_DIR / "dwnload_from_gdrive_conf.json"
@@ -93,8 +98,7 @@ def ensure_directory_exists(directory_path, purpose="directory"):
 # Load configuration
 try:
     if CONFIG_FILE.exists():
-        with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-            CONFIG = json.load(f)
+        CONFIG = json_utils.load_file(CONFIG_FILE)
         # Add paths section if missing
         if 'downloads_path' not in CONFIG:
             CONFIG['downloads_path'] = {}
@@ -429,6 +433,72 @@ def download_file(service, file_id, file_name=None, download_dir=None):
             "error": str(e)
         }
 
+def load_changes_page_token():
+    """Load the saved Drive changes page token, or None if there isn't one."""
+    try:
+        return json_utils.load_file(CHANGES_STATE_FILE).get('page_token')
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Could not read Drive changes state: {str(e)}")
+        return None
+
+def save_changes_page_token(page_token):
+    """Save the Drive changes page token for the next run."""
+    try:
+        json_utils.dump_file({'page_token': page_token}, CHANGES_STATE_FILE, indent=False, atomic=True)
+    except Exception as e:
+        logger.warning(f"Could not save Drive changes state: {str(e)}")
+
+def check_drive_changes(service):
+    """Check the Drive changes feed for new files of the configured types.
+    
+    On the first run there is no saved position, so a folder scan is always
+    needed and only the current position is fetched.
+    
+    Args:
+        service: Google Drive service instance
+        
+    Returns:
+        tuple: (bool, str) Whether new matching files may exist, and the page
+            token to save once they have been processed (None if unavailable)
+    """
+    try:
+        page_token = load_changes_page_token()
+        if page_token is None:
+            response = service.changes().getStartPageToken().execute()
+            return True, response.get('startPageToken')
+        
+        extensions = tuple(
+            ext.lower()
+            for file_types in ('audio_file_types', 'image_file_types', 'video_file_types')
+            for ext in CONFIG.get(file_types, {}).get('include', [])
+        )
+        
+        has_changes = False
+        while page_token:
+            response = service.changes().list(
+                pageToken=page_token,
+                spaces='drive',
+                fields="nextPageToken, newStartPageToken, changes(removed, file(name, trashed))",
+                pageSize=1000
+            ).execute()
+            
+            for change in response.get('changes', []):
+                file_info = change.get('file', {})
+                if (not change.get('removed') and not file_info.get('trashed')
+                        and file_info.get('name', '').lower().endswith(extensions)):
+                    has_changes = True
+            
+            if 'newStartPageToken' in response:
+                return has_changes, response['newStartPageToken']
+            page_token = response.get('nextPageToken')
+        
+        return has_changes, None
+    except Exception as e:
+        logger.warning(f"Could not read Drive changes, scanning folders instead: {str(e)}")
+        return True, None
+
 def delete_file(service, file_id, file_name=None):
     """Delete a file from Google Drive.
     
@@ -455,6 +525,41 @@ def delete_file(service, file_id, file_name=None):
         logger.error(f"Error deleting file '{file_name}': {str(e)}")
         return False
 
+def delete_files_batch(service, items):
+    """Delete several files from Google Drive using batch requests.
+    
+    Args:
+        service: Google Drive API service instance
+        items: File objects with 'id' and 'name' keys
+        
+    Returns:
+        int: Number of files deleted successfully
+    """
+    deleted = 0
+    
+    def on_delete_result(request_id, response, exception):
+        nonlocal deleted
+        file_name = items[int(request_id)].get('name', 'Unknown file')
+        if exception is not None:
+            logger.error(f"Error deleting file '{file_name}': {str(exception)}")
+        else:
+            logger.info(f"File '{file_name}' deleted successfully.")
+            deleted += 1
+    
+    # The Drive API accepts up to 100 calls per batch request
+    for offset in range(0, len(items), 100):
+        batch = service.new_batch_http_request(callback=on_delete_result)
+        for index in range(offset, min(offset + 100, len(items))):
+            logger.info(f"Deleting file: {items[index].get('name', 'Unknown file')}")
+            batch.add(service.files().delete(fileId=items[index]['id']), request_id=str(index))
+        
+        try:
+            batch.execute()
+        except Exception as e:
+            logger.error(f"Error deleting files in batch: {str(e)}")
+    
+    return deleted
+
 def process_folder(service, folder_id, folder_name, dry_run=False):
     """Process files in a Google Drive folder (non-recursively)."""
     try:
@@ -521,6 +626,9 @@ def process_folder(service, folder_id, folder_name, dry_run=False):
         # Log the types of files found
         logger.info(f"Found {len(audio_items)} audio files, {len(image_items)} image files, and {len(video_items)} video files in folder: {folder_name}")
         
+        # Files to delete from Google Drive once the downloads are done
+        items_to_delete = []
+        
         # Process each file to download
         for item in items_to_download:
             item_id = item['id']
@@ -584,14 +692,17 @@ def process_folder(service, folder_id, folder_name, dry_run=False):
                     
                     # Delete file from Google Drive if configured
                     if CONFIG.get('download', {}).get('delete_after_download', False):
-                        delete_file(service, item_id, item_name)
-                        stats['deleted_files'] += 1
+                        items_to_delete.append(item)
                 else:
                     stats['error_files'] += 1
             except Exception as e:
                 logger.error(f"Error processing file {item_name}: {str(e)}")
                 stats['error_files'] += 1
         
+        # Delete the downloaded files from Google Drive in batched requests
+        if items_to_delete:
+            stats['deleted_files'] = delete_files_batch(service, items_to_delete)
+        
         # Log statistics for this folder
         logger.info(f"Folder '{folder_name}' statistics:")
         logger.info(f"  - Total files: {stats['total_files']}")
@@ -665,6 +776,18 @@ def main():
             logger.info("Running in DRY RUN mode - no files will be downloaded or deleted")
             print("\n=== DRY RUN MODE - NO FILES WILL BE DOWNLOADED OR DELETED ===\n")
         
+        # Skip the folder scan when the changes feed shows no new files since the last run
+        new_page_token = None
+        if CONFIG.get('download', {}).get('skip_if_unchanged', True) and not dry_run:
+            has_changes, new_page_token = check_drive_changes(service)
+            if not has_changes:
+                logger.info("No new files in Google Drive since the last run. Skipping folder scan.")
+                if new_page_token:
+                    save_changes_page_token(new_page_token)
+                return
+        
+        error_files = 0
+        
         # Process each target folder
         for folder_name in target_folders:
             if folder_name.lower() == 'root':
@@ -683,7 +806,12 @@ def main():
                 logger.info(f"Processing folder: {folder_name} (ID: {folder_id})")
             
             # Process files in the folder
-            process_folder(service, folder_id, folder_name, dry_run=dry_run)
+            stats = process_folder(service, folder_id, folder_name, dry_run=dry_run)
+            error_files += stats['error_files']
+        
+        # Only move past these changes once every file was downloaded, so failures are retried
+        if new_page_token and error_files == 0:
+            save_changes_page_token(new_page_token)
         
         logger.info("Google Drive download process for calendar files completed.")
         
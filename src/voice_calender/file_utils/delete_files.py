@@ -8,12 +8,15 @@ based on file extensions and configuration.
 
 import os
 import sys
-import json
+import signal
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from logging.handlers import RotatingFileHandler
-from typing import Dict, List, Tuple, Set, Optional, Union
-import glob
+from typing import Callable, Dict, FrozenSet, Iterable, List, Tuple, Set, Optional, Union
+
+from voice_calender import json_utils
 
 # Handle both frozen (PyInstaller) and regular Python execution
 SCRIPT_DIR = Path(sys._MEIPASS) if getattr(sys, 'frozen', False) else Path(__file__).resolve().parent
@@ -22,10 +25,23 @@ SCRIPT_DIR = Path(sys._MEIPASS) if getattr(sys, 'frozen', False) else Path(__fil
 PROJECT_ROOT = SCRIPT_DIR.parent
 
 
+@lru_cache(maxsize=16)
+def _load_config_cached(resolved_path: str, mtime_ns: int) -> Dict:
+    """
+    Parse a JSON config file, cached per path and modification time.
+    
+    The mtime is only part of the cache key, so editing the file invalidates it.
+    """
+    return json_utils.load_file(resolved_path)
+
+
 def load_config(config_path: Union[str, Path]) -> Dict:
     """
     Load configuration from JSON file.
     
+    The parsed result is cached until the file changes, so callers share the
+    returned dictionary and must not modify it.
+    
     Args:
         config_path: Path to the configuration file
         
@@ -36,8 +52,8 @@ def load_config(config_path: Union[str, Path]) -> Dict:
         FileNotFoundError: If the config file is not found
         json.JSONDecodeError: If the config file is not valid JSON
     """
-    with open(config_path, 'r') as config_file:
-        return json.load(config_file)
+    resolved_path = Path(config_path).resolve()
+    return _load_config_cached(str(resolved_path), resolved_path.stat().st_mtime_ns)
 
 
 def load_gdrive_config() -> Dict:
@@ -49,13 +65,60 @@ def load_gdrive_config() -> Dict:
     """
     gdrive_config_path = PROJECT_ROOT / "project_modules_configs" / "config_dwnload_files" / "dwnload_from_gdrive_conf.json"
     
-    if not gdrive_config_path.exists():
-        raise FileNotFoundError(f"Google Drive config file not found at {gdrive_config_path}")
-        
-    with open(gdrive_config_path, 'r') as f:
-        gdrive_config = json.load(f)
+    # No exists() precheck, load_config raises FileNotFoundError naming the path
+    return load_config(gdrive_config_path)
+
+
+# Log records are buffered up to this many bytes before they are written out
+LOG_BUFFER_SIZE = 65536
+
+
+class FastRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that stays off the filesystem for routine records.
+    
+    Since Python 3.9.8 shouldRollover calls os.path.exists and os.path.isfile
+    for each emitted record, which is slow on network mounts. The log file
+    does not change type while it is open, so the check is done at startup,
+    and the file size is tracked in memory instead of with seek/tell.
+    Records are written through a LOG_BUFFER_SIZE buffer rather than flushed
+    one by one; errors, rollovers and logging.shutdown still flush.
+    """
+    
+    def __init__(self, filename, *args, **kwargs):
+        super().__init__(filename, *args, **kwargs)
+        # Rotating something that is not a regular file (e.g. /dev/null) is skipped
+        self._is_regular_file = not os.path.exists(self.baseFilename) or os.path.isfile(self.baseFilename)
+        self._bytes_written = 0
+        self._defer_flush = False
+    
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=LOG_BUFFER_SIZE, encoding=self.encoding)
+        self._bytes_written = os.fstat(stream.fileno()).st_size
+        return stream
+    
+    def shouldRollover(self, record):
+        if not self._is_regular_file or self.maxBytes <= 0:
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+        size = self._bytes_written + len("%s\n" % self.format(record))
+        if size >= self.maxBytes:
+            return True
+        self._bytes_written = size
+        return False
+    
+    def emit(self, record):
+        # StreamHandler.emit flushes after every record, keep it buffered below ERROR
+        self._defer_flush = record.levelno < logging.ERROR
+        try:
+            super().emit(record)
+        finally:
+            self._defer_flush = False
     
-    return gdrive_config
+    def flush(self):
+        if not self._defer_flush:
+            super().flush()
 
 
 def setup_logging(config: Dict) -> logging.Logger:
@@ -84,20 +147,25 @@ def setup_logging(config: Dict) -> logging.Logger:
     logger = logging.getLogger('file_deleter')
     logger.setLevel(getattr(logging, log_level))
     
-    # Clear existing handlers to prevent duplicates
+    # Clear existing handlers to prevent duplicates, closing them writes out anything buffered
+    for handler in logger.handlers:
+        handler.close()
     logger.handlers = []
     
     # Create handler for logging to file with rotation
-    file_handler = RotatingFileHandler(
+    file_handler = FastRotatingFileHandler(
         log_path, 
         maxBytes=max_bytes, 
-        backupCount=backup_count
+        backupCount=backup_count,
+        delay=True
     )
-    file_handler.setFormatter(logging.Formatter(log_format))
+    # One formatter for both handlers
+    formatter = logging.Formatter(log_format)
+    file_handler.setFormatter(formatter)
     
     # Create handler for logging to console
     console_handler = logging.StreamHandler()
-    console_handler.setFormatter(logging.Formatter(log_format))
+    console_handler.setFormatter(formatter)
     
     # Add handlers to logger
     logger.addHandler(file_handler)
@@ -133,14 +201,60 @@ def get_supported_extensions(gdrive_config: Dict) -> List[str]:
     return extensions
 
 
-def delete_files_in_directory(directory: Path, extensions: List[str], logger: logging.Logger) -> Tuple[int, int]:
+def get_categorized_extensions(gdrive_config: Dict) -> Dict[str, FrozenSet[str]]:
+    """
+    Build lowercased, dot-prefixed extension sets per file category.
+    
+    Args:
+        gdrive_config: Google Drive configuration dictionary
+        
+    Returns:
+        Dictionary with 'audio', 'image', 'video' and 'all' extension sets
+    """
+    categorized = {}
+    for category in ('audio', 'image', 'video'):
+        include = gdrive_config.get(f'{category}_file_types', {}).get('include', [])
+        categorized[category] = frozenset(
+            (ext if ext.startswith('.') else f'.{ext}').lower() for ext in include
+        )
+    categorized['all'] = categorized['audio'] | categorized['image'] | categorized['video']
+    
+    return categorized
+
+
+def run_deletions(delete_file: Callable[[str], bool], names: List[str], max_workers: int) -> Tuple[int, int]:
+    """
+    Apply delete_file to every name, on a thread pool when max_workers > 1.
+    
+    Args:
+        delete_file: Deletes one file, returning True on success
+        names: Files to delete, in the form delete_file expects
+        max_workers: Number of threads unlinking at once, 1 deletes serially
+        
+    Returns:
+        Tuple of (files_deleted, files_failed)
+    """
+    # unlink releases the GIL, so threads overlap the syscalls on slow filesystems
+    if max_workers > 1 and len(names) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(names))) as executor:
+            results = list(executor.map(delete_file, names))
+    else:
+        results = [delete_file(name) for name in names]
+    
+    files_deleted = sum(results)
+    return files_deleted, len(results) - files_deleted
+
+
+def delete_files_in_directory(directory: Path, extensions: Iterable[str], logger: logging.Logger,
+                              max_workers: int = 1) -> Tuple[int, int]:
     """
     Delete files with matching extensions in the specified directory.
     
     Args:
         directory: Path to the directory containing files to delete
-        extensions: List of file extensions to match
+        extensions: File extensions to match, all files if empty
         logger: Logger instance for logging
+        max_workers: Number of threads unlinking at once, 1 deletes serially
         
     Returns:
         Tuple of (files_deleted, files_failed)
@@ -148,52 +262,136 @@ def delete_files_in_directory(directory: Path, extensions: List[str], logger: lo
     files_deleted = 0
     files_failed = 0
     
-    if not directory.exists():
+    # Lowercased and stored without the dot once, so a file name is matched
+    # with one partition and one set lookup; an empty set means every file matches
+    wanted = frozenset(ext.lower().lstrip('.') for ext in extensions)
+    
+    # Where supported, open the directory once and unlink names relative to it
+    # (unlinkat), so the kernel does not resolve the full path for every file.
+    # No exists()/is_dir() prechecks, opening the directory reports both cases
+    dir_fd = None
+    try:
+        if os.scandir in os.supports_fd and os.unlink in os.supports_dir_fd:
+            dir_fd = os.open(directory, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+        entries = os.scandir(os.fspath(directory) if dir_fd is None else dir_fd)
+    except FileNotFoundError:
         logger.warning(f"Directory does not exist: {directory}")
         return files_deleted, files_failed
-    
-    if not directory.is_dir():
+    except NotADirectoryError:
         logger.warning(f"Path is not a directory: {directory}")
         return files_deleted, files_failed
+    except BaseException:
+        if dir_fd is not None:
+            os.close(dir_fd)
+        raise
     
     logger.info(f"Processing files in directory: {directory}")
     
-    # Get all files in the directory
-    all_files = [f for f in directory.iterdir() if f.is_file()]
+    try:
+        # scandir entries answer is_file() from the directory read, no stat per file
+        file_names = []
+        with entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                if wanted:
+                    # Same suffix Path.suffix would give, dotfiles have none
+                    head, _, ext = entry.name.rpartition('.')
+                    if not (head and ext and ext.lower() in wanted):
+                        continue
+                file_names.append(entry.name)
+        
+        if not file_names:
+            logger.info(f"No matching files found in {directory}")
+            return files_deleted, files_failed
+        
+        logger.info(f"Found {len(file_names)} files to delete in {directory}")
+        
+        def delete_file(file_name: str) -> bool:
+            file_path = os.path.join(directory, file_name)
+            try:
+                os.unlink(file_path if dir_fd is None else file_name, dir_fd=dir_fd)
+                # Per-file detail only at DEBUG, lazily formatted; the caller logs the totals
+                logger.debug("Deleted file: %s", file_path)
+                return True
+            except Exception as e:
+                logger.error(f"Error deleting file {file_path}: {str(e)}")
+                return False
+        
+        files_deleted, files_failed = run_deletions(delete_file, file_names, max_workers)
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
     
-    # If extensions is empty, use all files, otherwise filter by extension
-    files_to_delete = all_files if not extensions else [f for f in all_files if f.suffix.lower() in extensions]
+    return files_deleted, files_failed
+
+
+def delete_files_in_tree(root: Path, extensions: Iterable[str], logger: logging.Logger,
+                         max_workers: int = 1) -> Tuple[int, int]:
+    """
+    Delete files with matching extensions in root and all of its subdirectories.
     
-    if not files_to_delete:
-        logger.info(f"No matching files found in {directory}")
-        return files_deleted, files_failed
+    Directories themselves are left in place.
     
-    logger.info(f"Found {len(files_to_delete)} files to delete in {directory}")
+    Args:
+        root: Top of the directory tree containing files to delete
+        extensions: File extensions to match, all files if empty
+        logger: Logger instance for logging
+        max_workers: Number of threads unlinking at once, 1 deletes serially
+        
+    Returns:
+        Tuple of (files_deleted, files_failed)
+    """
+    if not root.is_dir():
+        logger.warning(f"Directory does not exist or is not a directory: {root}")
+        return 0, 0
+    
+    logger.info(f"Processing files in directory tree: {root}")
+    
+    # Same matching as delete_files_in_directory
+    wanted = frozenset(ext.lower().lstrip('.') for ext in extensions)
     
-    for file_path in files_to_delete:
+    # os.walk hands back plain name strings, no Path per file
+    file_paths = []
+    for dir_path, _, file_names in os.walk(root):
+        for file_name in file_names:
+            if wanted:
+                head, _, ext = file_name.rpartition('.')
+                if not (head and ext and ext.lower() in wanted):
+                    continue
+            file_paths.append(os.path.join(dir_path, file_name))
+    
+    if not file_paths:
+        logger.info(f"No matching files found in {root}")
+        return 0, 0
+    
+    logger.info(f"Found {len(file_paths)} files to delete under {root}")
+    
+    def delete_file(file_path: str) -> bool:
         try:
-            file_path.unlink()
-            logger.info(f"Deleted file: {file_path}")
-            files_deleted += 1
+            os.unlink(file_path)
+            logger.debug("Deleted file: %s", file_path)
+            return True
         except Exception as e:
             logger.error(f"Error deleting file {file_path}: {str(e)}")
-            files_failed += 1
+            return False
     
-    return files_deleted, files_failed
+    return run_deletions(delete_file, file_paths, max_workers)
 
 
-def delete_json_files(directory: Path, logger: logging.Logger) -> Tuple[int, int]:
+def delete_json_files(directory: Path, logger: logging.Logger, max_workers: int = 1) -> Tuple[int, int]:
     """
     Delete JSON files in the specified directory.
     
     Args:
         directory: Path to the directory containing JSON files to delete
         logger: Logger instance for logging
+        max_workers: Number of threads unlinking at once, 1 deletes serially
         
     Returns:
         Tuple of (files_deleted, files_failed)
     """
-    return delete_files_in_directory(directory, ['.json'], logger)
+    return delete_files_in_directory(directory, ['.json'], logger, max_workers)
 
 
 def process_deletions(config: Dict, logger: logging.Logger) -> Tuple[int, int]:
@@ -216,11 +414,23 @@ def process_deletions(config: Dict, logger: logging.Logger) -> Tuple[int, int]:
     # Load Google Drive config for file extensions
     try:
         gdrive_config = load_gdrive_config()
-        extensions = get_supported_extensions(gdrive_config)
-        logger.info(f"Using extensions for file matching: {extensions}")
+        categorized_extensions = get_categorized_extensions(gdrive_config)
+        logger.info(f"Using extensions for file matching: {sorted(categorized_extensions['all'])}")
     except Exception as e:
         logger.error(f"Error loading Google Drive config: {str(e)}")
-        extensions = []  # If can't load extensions, will match all files
+        categorized_extensions = {}  # If can't load extensions, will match all files
+    
+    # Unlinks are syscall bound, so optionally run several per directory at once
+    if config.get('processing', {}).get('parallel_deletes', False):
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+    else:
+        max_workers = 1
+    
+    # Descend into subdirectories (e.g. nested transcriptions) when configured
+    if config.get('processing', {}).get('recursive', False):
+        delete_matching = delete_files_in_tree
+    else:
+        delete_matching = delete_files_in_directory
     
     total_deleted = 0
     total_failed = 0
@@ -231,9 +441,9 @@ def process_deletions(config: Dict, logger: logging.Logger) -> Tuple[int, int]:
     # Process audio files directory
     if 'audio_files_dir' in source_dirs:
         audio_dir = Path(source_dirs['audio_files_dir'])
-        audio_extensions = [ext for ext in extensions if ext in gdrive_config.get('audio_file_types', {}).get('include', [])]
+        audio_extensions = categorized_extensions.get('audio', frozenset())
         logger.info(f"Processing audio files in {audio_dir}")
-        audio_deleted, audio_failed = delete_files_in_directory(audio_dir, audio_extensions, logger)
+        audio_deleted, audio_failed = delete_matching(audio_dir, audio_extensions, logger, max_workers)
         total_deleted += audio_deleted
         total_failed += audio_failed
         logger.info(f"Audio files processed: {audio_deleted} deleted, {audio_failed} failed")
@@ -242,7 +452,7 @@ def process_deletions(config: Dict, logger: logging.Logger) -> Tuple[int, int]:
     if 'json_files_dir' in source_dirs:
         json_dir = Path(source_dirs['json_files_dir'])
         logger.info(f"Processing JSON files in {json_dir}")
-        json_deleted, json_failed = delete_json_files(json_dir, logger)
+        json_deleted, json_failed = delete_matching(json_dir, ['.json'], logger, max_workers)
         total_deleted += json_deleted
         total_failed += json_failed
         logger.info(f"JSON files processed: {json_deleted} deleted, {json_failed} failed")
@@ -252,7 +462,7 @@ def process_deletions(config: Dict, logger: logging.Logger) -> Tuple[int, int]:
         video_dir = Path(source_dirs['video_files_dir'])
         # Look for .txt files in the transcriptions directory
         logger.info(f"Processing transcription files in {video_dir}")
-        video_deleted, video_failed = delete_files_in_directory(video_dir, ['.txt'], logger)
+        video_deleted, video_failed = delete_matching(video_dir, ['.txt'], logger, max_workers)
         total_deleted += video_deleted
         total_failed += video_failed
         logger.info(f"Transcription files processed: {video_deleted} deleted, {video_failed} failed")
@@ -267,6 +477,7 @@ def main():
     # Determine the config file path relative to project root
     config_path = PROJECT_ROOT / 'project_modules_configs' / 'config_file_utils' / 'file_utils_config.json'
     
+    logger = None
     try:
         # Load configuration
         config = load_config(config_path)
@@ -285,7 +496,15 @@ def main():
     except Exception as e:
         print(f"Error: {str(e)}")
         return 1  # Failure
+    finally:
+        # The file handler buffers records during the run; write them out once
+        # here, the scheduler calls main() in a process that keeps running
+        if logger is not None:
+            for handler in logger.handlers:
+                handler.flush()
 
 
 if __name__ == "__main__":
+    # Turn SIGTERM into a normal exit so logging.shutdown still flushes the log
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
     sys.exit(main())
@@ -8,12 +8,17 @@ target directories based on file extensions.
 
 import os
 import sys
-import json
+import errno
 import shutil
 import logging
+from collections import deque
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from logging.handlers import RotatingFileHandler
-from typing import Dict, List, Tuple, Set, Optional, Union
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple, Set, Optional, Union
+
+from voice_calender import json_utils
 
 # Handle both frozen (PyInstaller) and regular Python execution
 SCRIPT_DIR = Path(sys._MEIPASS) if getattr(sys, 'frozen', False) else Path(__file__).resolve().parent
@@ -22,10 +27,23 @@ SCRIPT_DIR = Path(sys._MEIPASS) if getattr(sys, 'frozen', False) else Path(__fil
 PROJECT_ROOT = SCRIPT_DIR.parent
 
 
+@lru_cache(maxsize=16)
+def _load_config_cached(resolved_path: str, mtime_ns: int) -> Dict:
+    """
+    Parse a JSON config file, cached per path and modification time.
+    
+    The mtime is only part of the cache key, so editing the file invalidates it.
+    """
+    return json_utils.load_file(resolved_path)
+
+
 def load_config(config_path: Union[str, Path]) -> Dict:
     """
     Load configuration from JSON file.
     
+    The parsed result is cached until the file changes, so callers share the
+    returned dictionary and must not modify it.
+    
     Args:
         config_path: Path to the configuration file
         
@@ -36,8 +54,8 @@ def load_config(config_path: Union[str, Path]) -> Dict:
         FileNotFoundError: If the config file is not found
         json.JSONDecodeError: If the config file is not valid JSON
     """
-    with open(config_path, 'r') as config_file:
-        return json.load(config_file)
+    resolved_path = Path(config_path).resolve()
+    return _load_config_cached(str(resolved_path), resolved_path.stat().st_mtime_ns)
 
 
 def load_gdrive_config() -> Dict:
@@ -52,10 +70,7 @@ def load_gdrive_config() -> Dict:
     if not gdrive_config_path.exists():
         raise FileNotFoundError(f"Google Drive config file not found at {gdrive_config_path}")
         
-    with open(gdrive_config_path, 'r') as f:
-        gdrive_config = json.load(f)
-    
-    return gdrive_config
+    return load_config(gdrive_config_path)
 
 
 def setup_logging(config: Dict) -> logging.Logger:
@@ -145,6 +160,91 @@ def get_file_type(file_path: Path, gdrive_config: Dict, local_config: Dict) -> O
     return None
 
 
+def reserve_destination_path(destination_dir: Path, file_name: str) -> Path:
+    """
+    Claim a free path for file_name in destination_dir.
+    
+    Name collisions get a _1, _2, ... suffix as before, but the free suffix is
+    found with a galloping search, so a directory already holding name_1 to
+    name_N costs O(log N) stat calls instead of N. The chosen path is then
+    created with O_EXCL, so concurrent movers never pick the same name; the
+    empty placeholder is overwritten by the copy or move.
+    
+    Args:
+        destination_dir: Directory the file is going to
+        file_name: Original file name
+        
+    Returns:
+        Path of the reserved (empty) destination file
+    """
+    first_choice = destination_dir / file_name
+    base_name = first_choice.stem
+    extension = first_choice.suffix
+    
+    def candidate(counter: int) -> Path:
+        return first_choice if counter == 0 else destination_dir / f"{base_name}_{counter}{extension}"
+    
+    counter = 0
+    if first_choice.exists():
+        # Double until a free suffix is found, then binary search for the first free one
+        low, high = 0, 1
+        while candidate(high).exists():
+            low, high = high, high * 2
+        while high - low > 1:
+            middle = (low + high) // 2
+            if candidate(middle).exists():
+                low = middle
+            else:
+                high = middle
+        counter = high
+    
+    while True:
+        destination_path = candidate(counter)
+        try:
+            os.close(os.open(destination_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return destination_path
+        except FileExistsError:
+            # Taken since the search, by a gap in the numbering or another mover
+            counter += 1
+
+
+def fast_copy2(source_path: Path, destination_path: Path) -> None:
+    """
+    Copy a file with its timestamps and permission bits, like shutil.copy2.
+    
+    The data is copied with os.sendfile, which stays inside the kernel on
+    Linux, and falls back to shutil.copy2 where sendfile is unavailable or
+    refuses the files.
+    
+    Args:
+        source_path: File to copy
+        destination_path: Path to write the copy to
+    """
+    try:
+        in_fd = os.open(source_path, os.O_RDONLY)
+        try:
+            out_fd = os.open(destination_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                size = os.fstat(in_fd).st_size
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            finally:
+                os.close(out_fd)
+        finally:
+            os.close(in_fd)
+    except (AttributeError, OSError):
+        shutil.copy2(source_path, destination_path)
+        return
+    
+    source_stat = os.stat(source_path)
+    os.utime(destination_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+    os.chmod(destination_path, source_stat.st_mode & 0o777)
+
+
 def move_file(file_path: Path, destination_dir: Path, logger: logging.Logger, 
               delete_source: bool = False) -> bool:
     """
@@ -159,38 +259,67 @@ def move_file(file_path: Path, destination_dir: Path, logger: logging.Logger,
     Returns:
         True if successful, False otherwise
     """
+    destination_path = None
     try:
         # Ensure destination directory exists
         destination_dir.mkdir(parents=True, exist_ok=True)
         
-        # Create destination path
-        destination_path = destination_dir / file_path.name
-        
-        # Handle duplicate file names
-        if destination_path.exists():
-            base_name = destination_path.stem
-            extension = destination_path.suffix
-            counter = 1
-            
-            while destination_path.exists():
-                new_name = f"{base_name}_{counter}{extension}"
-                destination_path = destination_dir / new_name
-                counter += 1
+        # Create destination path, handling duplicate file names
+        destination_path = reserve_destination_path(destination_dir, file_path.name)
         
         # If delete_source is True, move the file; otherwise, copy it
         if delete_source:
-            shutil.move(str(file_path), str(destination_path))
+            try:
+                # A single rename when both paths are on the same filesystem
+                os.replace(file_path, destination_path)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                fast_copy2(file_path, destination_path)
+                file_path.unlink()
             logger.info(f"Moved {file_path} to {destination_path}")
         else:
-            shutil.copy2(str(file_path), str(destination_path))
+            fast_copy2(file_path, destination_path)
             logger.info(f"Copied {file_path} to {destination_path}")
         
         return True
     except Exception as e:
         logger.error(f"Error moving/copying {file_path}: {str(e)}")
+        # Don't leave the empty placeholder behind
+        if destination_path is not None and file_path.exists():
+            try:
+                destination_path.unlink()
+            except OSError:
+                pass
         return False
 
 
+def bounded_map(executor: ThreadPoolExecutor, fn: Callable, items: Iterable,
+                window: int) -> Iterator:
+    """
+    Like executor.map, but pulls items lazily, with at most window in flight.
+    
+    executor.map submits the whole iterable up front, so a huge source
+    directory would be held in memory before the first file moves.
+    
+    Args:
+        executor: Executor to run fn on
+        fn: Function applied to each item
+        items: Iterable of arguments, consumed as results come back
+        window: Maximum number of submitted but unfinished calls
+        
+    Yields:
+        Results of fn, in input order
+    """
+    pending = deque()
+    for item in items:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, item))
+    while pending:
+        yield pending.popleft().result()
+
+
 def process_files(config: Dict, logger: logging.Logger) -> Tuple[int, int]:
     """
     Process files according to the configuration.
@@ -230,29 +359,43 @@ def process_files(config: Dict, logger: logging.Logger) -> Tuple[int, int]:
     # Get delete_source setting
     delete_source = config['processing'].get('delete_source_after_move', False)
     
+    # Moves are I/O bound, so several run at once; keep this low for rotational disks
+    max_workers = config['processing'].get('max_parallel_files', 8)
+    
+    target_dirs = {'audio': audio_dir, 'image': image_dir, 'video': video_dir}
+    
     # Track statistics
     files_processed = 0
     files_failed = 0
     
-    # Process each file in the source directory
-    if source_dir.exists() and source_dir.is_dir():
-        for file_path in source_dir.iterdir():
-            if file_path.is_file():
+    def iter_moves(entries) -> Iterator[Tuple[Path, Path]]:
+        # scandir entries answer is_file() from the directory read, no stat per file
+        for entry in entries:
+            if entry.is_file():
+                file_path = Path(entry.path)
                 file_type = get_file_type(file_path, gdrive_config, config)
                 
-                if file_type == 'audio':
-                    success = move_file(file_path, audio_dir, logger, delete_source)
-                elif file_type == 'image':
-                    success = move_file(file_path, image_dir, logger, delete_source)
-                elif file_type == 'video':
-                    success = move_file(file_path, video_dir, logger, delete_source)
+                if file_type in target_dirs:
+                    yield file_path, target_dirs[file_type]
                 else:
                     logger.info(f"Skipping {file_path} - not a recognized file type")
-                    success = True  # Not a failure, just not processed
-                
-                if success and file_type is not None:
+    
+    # Process each file in the source directory
+    if source_dir.exists() and source_dir.is_dir():
+        # Files are moved while the directory is still being listed, so memory
+        # stays flat however many files there are. The target directories
+        # already exist, and reserve_destination_path keeps concurrent moves
+        # from claiming the same name
+        with os.scandir(source_dir) as entries, ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for moved in bounded_map(
+                executor,
+                lambda move: move_file(move[0], move[1], logger, delete_source),
+                iter_moves(entries),
+                max_workers * 2
+            ):
+                if moved:
                     files_processed += 1
-                elif not success:
+                else:
                     files_failed += 1
     else:
         logger.error(f"Source directory {source_dir} does not exist or is not a directory")
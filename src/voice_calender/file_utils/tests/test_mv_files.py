@@ -21,10 +21,10 @@ if str(parent_dir) not in sys.path:
 
 # Try package import first, then fallback to relative import if running as standalone script
 try:
-    from voice_diary.file_utils.mv_files import load_config, setup_logging, process_files, load_gdrive_config
+    from voice_calender.file_utils.mv_files import load_config, setup_logging, process_files, load_gdrive_config
 except ImportError:
     # Fallback to direct import when running as a standalone script
-    from voice_diary.file_utils.mv_files import load_config, setup_logging, process_files, load_gdrive_config
+    from voice_calender.file_utils.mv_files import load_config, setup_logging, process_files, load_gdrive_config
 
 
 def create_test_files(source_dir: Path):
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Tests for picking a free destination name when moving files.
+"""
+
+from voice_calender.file_utils.mv_files import reserve_destination_path
+
+
+def test_free_name_is_used_as_is(tmp_path):
+    path = reserve_destination_path(tmp_path, "note.mp3")
+    assert path == tmp_path / "note.mp3"
+    assert path.exists() and path.stat().st_size == 0
+
+
+def test_collision_gets_first_suffix(tmp_path):
+    (tmp_path / "note.mp3").touch()
+    assert reserve_destination_path(tmp_path, "note.mp3") == tmp_path / "note_1.mp3"
+
+
+def test_galloping_search_finds_next_suffix(tmp_path):
+    (tmp_path / "note.mp3").touch()
+    for i in range(1, 38):
+        (tmp_path / f"note_{i}.mp3").touch()
+    assert reserve_destination_path(tmp_path, "note.mp3") == tmp_path / "note_38.mp3"
+
+
+def test_gaps_below_the_highest_suffix_are_not_reused(tmp_path):
+    # note_3 is free, but the search lands past the highest taken suffix
+    for name in ("note.mp3", "note_1.mp3", "note_2.mp3", "note_4.mp3"):
+        (tmp_path / name).touch()
+    assert reserve_destination_path(tmp_path, "note.mp3") == tmp_path / "note_5.mp3"
+
+
+def test_repeated_reservations_never_collide(tmp_path):
+    paths = {reserve_destination_path(tmp_path, "note.mp3") for _ in range(20)}
+    assert len(paths) == 20
+    assert all(path.exists() for path in paths)
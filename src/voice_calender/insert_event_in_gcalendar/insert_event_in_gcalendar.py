@@ -5,18 +5,17 @@ Requires credentials to be stored in gcalendar_credentials.json.
 """
 
 import os
-import json
 import logging
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+# The Google client libraries pull in httplib2, requests and friends, so they
+# are imported where they are first needed rather than at module import
+
+from voice_calender import json_utils
 
 # Initialize paths - handling both frozen (PyInstaller) and regular Python execution
 if getattr(sys, 'frozen', False):
@@ -45,21 +44,21 @@ DEFAULT_CREDENTIALS_PATH = DEFAULT_CREDENTIALS_DIR / "gcalendar_credentials.json
 def load_config():
     """Load configuration from JSON file and return credentials path"""
     try:
-        if CONFIG_PATH.exists():
-            with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                
-            # Check if credentials_path is specified in config
-            if 'credentials_path' in config:
-                credentials_path = config['credentials_path']
-                # Handle relative paths
-                if not os.path.isabs(credentials_path):
-                    credentials_path = Path(WORKSPACE_ROOT / credentials_path).resolve()
-                else:
-                    credentials_path = Path(credentials_path)
-                
-                logger.info(f"Using credentials path from config: {credentials_path}")
-                return str(credentials_path)
+        # Just try the open, a missing file is the uncommon case
+        try:
+            config = json_utils.load_file(CONFIG_PATH)
+        except FileNotFoundError:
+            config = {}
+            
+        # Check if credentials_path is specified in config
+        if 'credentials_path' in config:
+            credentials_path = config['credentials_path']
+            # Handle relative paths, normalized lexically without touching the disk
+            if not os.path.isabs(credentials_path):
+                credentials_path = os.path.abspath(WORKSPACE_ROOT / credentials_path)
+            
+            logger.info(f"Using credentials path from config: {credentials_path}")
+            return str(credentials_path)
         
         # If config doesn't exist or doesn't specify credentials_path, use default
         logger.info(f"Using default credentials path: {DEFAULT_CREDENTIALS_PATH}")
@@ -76,6 +75,28 @@ CREDENTIALS_PATH = load_config()
 # If modifying these scopes, delete the file token.json.
 SCOPES = ['https://www.googleapis.com/auth/calendar']  # Full access only
 
+# Maximum number of calls the Calendar API accepts in one batch request
+MAX_BATCH_SIZE = 50
+
+# Authenticated (credentials, service) pairs shared by every manager in the
+# process, keyed by credentials path, so the HTTP client and its TLS connection
+# are set up once rather than per GoogleCalendarManager
+_services: Dict[str, Tuple[object, object]] = {}
+_services_lock = threading.Lock()
+
+def invalidate_service(credentials_path: str = None) -> None:
+    """
+    Forget the shared service for credentials_path so the next authenticate() starts over.
+    
+    Call this after a request fails outright, e.g. a RefreshError once the
+    token was revoked; otherwise new managers get the same dead credentials.
+    
+    Args:
+        credentials_path: Credentials file the service was built from
+    """
+    with _services_lock:
+        _services.pop(credentials_path or CREDENTIALS_PATH, None)
+
 class GoogleCalendarManager:
     """Class to manage Google Calendar operations."""
     
@@ -87,36 +108,55 @@ class GoogleCalendarManager:
             credentials_path: Path to the credentials JSON file
         """
         self.credentials_path = credentials_path or CREDENTIALS_PATH
+        # The OAuth token is cached next to the client credentials
+        self._token_path = os.path.join(os.path.dirname(self.credentials_path), 'token.json')
         self.creds = None
         self.service = None
+        # Transport/auth error that aborted part of the last insert_events call, if any
+        self.last_insert_error = None
         logger.info(f"GoogleCalendarManager initialized with credentials path: {self.credentials_path}")
         
     def authenticate(self) -> None:
-        """Authenticate with Google Calendar API."""
-        # Make sure the credentials file exists
-        if not os.path.exists(self.credentials_path):
-            error_msg = f"Credentials file not found at: {self.credentials_path}"
-            logger.error(error_msg)
-            raise FileNotFoundError(error_msg)
-            
-        token_path = os.path.join(os.path.dirname(self.credentials_path), 'token.json')
+        """Authenticate with Google Calendar API, reusing this process's service if there is one."""
+        with _services_lock:
+            if self.credentials_path not in _services:
+                self._build_service()
+                _services[self.credentials_path] = (self.creds, self.service)
+            self.creds, self.service = _services[self.credentials_path]
         
-        if os.path.exists(token_path):
-            self.creds = Credentials.from_authorized_user_file(token_path, SCOPES)
+    def _build_service(self) -> None:
+        """Load or obtain credentials and build the Calendar API service."""
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from google.auth.transport.requests import Request
+        from googleapiclient.discovery import build
+        
+        # Reuse the saved token if there is one
+        try:
+            self.creds = Credentials.from_authorized_user_file(self._token_path, SCOPES)
+        except FileNotFoundError:
+            pass
             
         if not self.creds or not self.creds.valid:
             if self.creds and self.creds.expired and self.creds.refresh_token:
                 self.creds.refresh(Request())
             else:
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    self.credentials_path, SCOPES)
+                # The client credentials are only read when a new token is needed
+                try:
+                    flow = InstalledAppFlow.from_client_secrets_file(
+                        self.credentials_path, SCOPES)
+                except FileNotFoundError:
+                    error_msg = f"Credentials file not found at: {self.credentials_path}"
+                    logger.error(error_msg)
+                    raise FileNotFoundError(error_msg)
                 self.creds = flow.run_local_server(port=0)
                 
             # Save the credentials for the next run
-            with open(token_path, 'w') as token:
+            with open(self._token_path, 'w') as token:
                 token.write(self.creds.to_json())
                 
-        self.service = build('calendar', 'v3', credentials=self.creds)
+        # The discovery document ships with the client library, skip the on-disk cache
+        self.service = build('calendar', 'v3', credentials=self.creds, cache_discovery=False)
         
     def insert_event(self, event_data: Dict) -> Optional[Dict]:
         """
@@ -136,6 +176,8 @@ class GoogleCalendarManager:
         Returns:
             Dict containing the created event details if successful, None if failed
         """
+        from googleapiclient.errors import HttpError
+        
         try:
             if not self.service:
                 self.authenticate()
@@ -151,6 +193,56 @@ class GoogleCalendarManager:
         except HttpError as error:
             print(f'An error occurred: {error}')
             return None
+    
+    def insert_events(self, events: List[Dict]) -> List[Optional[Dict]]:
+        """
+        Insert several events into Google Calendar using batch requests,
+        sending up to MAX_BATCH_SIZE events per HTTP round trip.
+        
+        Args:
+            events: List of event dictionaries, as accepted by insert_event
+                
+        Returns:
+            List with the created event details for each input event, in the
+            same order, or None for the events that failed. A chunk whose
+            request fails outright (auth, transport, timeout) leaves None in
+            its slots and is recorded in last_insert_error; the events created
+            by the other chunks are still returned
+        """
+        results: List[Optional[Dict]] = [None] * len(events)
+        self.last_insert_error = None
+        
+        def on_insert_result(request_id, response, exception):
+            if exception is not None:
+                print(f'An error occurred: {exception}')
+                return
+            results[int(request_id)] = response
+            print(f'Event created: {response.get("htmlLink")}')
+        
+        try:
+            if not self.service:
+                self.authenticate()
+        except Exception as error:
+            print(f'An error occurred: {error}')
+            self.last_insert_error = error
+            return results
+        
+        for offset in range(0, len(events), MAX_BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=on_insert_result)
+            for index in range(offset, min(offset + MAX_BATCH_SIZE, len(events))):
+                batch.add(
+                    self.service.events().insert(calendarId='primary', body=events[index]),
+                    request_id=str(index)
+                )
+            
+            # Earlier chunks are already in the calendar, a failure here must not lose them
+            try:
+                batch.execute()
+            except Exception as error:
+                print(f'An error occurred: {error}')
+                self.last_insert_error = error
+        
+        return results
 
 def main():
     """Example usage of the GoogleCalendarManager class."""
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+JSON helpers shared by the Voice Calendar modules.
+
+Uses orjson when it is installed (pip install voice_calender[fast]) and falls
+back to the standard library json module otherwise. Decode errors raised by
+either backend are subclasses of json.JSONDecodeError.
+"""
+
+import json
+import os
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def loads(data):
+    """
+    Parse a JSON document
+
+    Args:
+        data (str | bytes): JSON text
+
+    Returns:
+        The parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj, indent=False):
+    """
+    Serialize an object to UTF-8 encoded JSON
+
+    Args:
+        obj: Object to serialize
+        indent (bool): Pretty-print with a two space indent
+
+    Returns:
+        bytes: JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+
+def dumps(obj, indent=False):
+    """
+    Serialize an object to a JSON string
+
+    Args:
+        obj: Object to serialize
+        indent (bool): Pretty-print with a two space indent
+
+    Returns:
+        str: JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode('utf-8')
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def load_file(path):
+    """
+    Read and parse a JSON file
+
+    Args:
+        path (str | Path): File to read
+
+    Returns:
+        The parsed Python object
+    """
+    # The whole file is read at once, so skip the buffer: an unbuffered
+    # readall() sizes a single read from the file's stat
+    with open(path, 'rb', buffering=0) as f:
+        return loads(f.read())
+
+
+def dump_file(obj, path, indent=True, atomic=False):
+    """
+    Serialize an object and write it to a JSON file in a single write
+
+    Args:
+        obj: Object to serialize
+        path (str | Path): File to write
+        indent (bool): Pretty-print with a two space indent
+        atomic (bool): Write to a temporary file and rename it into place, so
+            readers never see a partially written file
+    """
+    data = dumps_bytes(obj, indent=indent)
+    if not atomic:
+        with open(path, 'wb') as f:
+            f.write(data)
+        return
+
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
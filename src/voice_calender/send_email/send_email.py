@@ -27,6 +27,8 @@ from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 
+from voice_calender import json_utils
+
 # Initialize paths - handling both frozen (PyInstaller) and regular Python execution
 if getattr(sys, 'frozen', False):
     # Running as compiled executable
@@ -92,8 +94,7 @@ def ensure_directory_exists(directory_path, purpose="directory"):
 # Load configuration
 try:
     if CONFIG_FILE.exists():
-        with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-            CONFIG = json.load(f)
+        CONFIG = json_utils.load_file(CONFIG_FILE)
     else:
         print(f"ERROR: Config file not found at {CONFIG_FILE}")
         print("Please ensure a valid config file exists before running this script.")
@@ -131,12 +132,12 @@ logger.addHandler(file_handler)
 logger.info("Voice Calendar Email Service")
 logger.info(f"Logging to {log_path}")
 
+# Basic RFC 5322 compliant email regex pattern
+EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9.!#$%&'*+/=?^_`{|}~-]+@[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$")
+
 def validate_email_format(email):
     """Validate email address format using regex with additional domain duplication check"""
-    # Basic RFC 5322 compliant email regex pattern
-    pattern = r"^[a-zA-Z0-9.!#$%&'*+/=?^_`{|}~-]+@[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$"
-    
-    if not re.match(pattern, email):
+    if not EMAIL_PATTERN.match(email):
         return False
     
     # Additional checks for common mistakes
@@ -353,10 +354,19 @@ def send_message(service, user_id, message):
         logger.error(f'Error sending message: {e}')
         return None
 
-def main():
-    """Main function to send email via Gmail API."""
+def main(subject=None, message=None):
+    """
+    Main function to send email via Gmail API.
+    
+    Args:
+        subject (str, optional): Subject to send instead of the configured one
+        message (str, optional): Message body to send instead of the configured one
+    
+    Returns:
+        int: 0 if the email was sent, 1 otherwise (including when sending is disabled)
+    """
     if not check_credentials_file():
-        return
+        return 1
     
     try:
         # Load email configuration
@@ -365,14 +375,17 @@ def main():
         # Exit if email sending is disabled
         if not email_config:
             logger.info("Email sending is disabled in config. Exiting.")
-            return
+            return 1
+        
+        subject = subject if subject is not None else email_config['subject']
+        message_text = message if message is not None else email_config['message']
         
         # Authenticate with Gmail
         logger.info("Authenticating with Gmail...")
         service = authenticate_gmail()
         if not service:
             logger.error("Failed to authenticate with Gmail.")
-            return
+            return 1
 
         # Get the authenticated user's email address
         user_profile = service.users().getProfile(userId='me').execute()
@@ -389,8 +402,8 @@ def main():
             message = create_message_with_attachment(
                 sender,
                 email_config['to'],
-                email_config['subject'],
-                email_config['message'],
+                subject,
+                message_text,
                 attachment_path
             )
         else:
@@ -398,8 +411,8 @@ def main():
             message = create_message(
                 sender,
                 email_config['to'],
-                email_config['subject'],
-                email_config['message']
+                subject,
+                message_text
             )
         
         # Send the email
@@ -410,6 +423,7 @@ def main():
             logger.info("Email sent successfully!")
         else:
             logger.error("Failed to send email.")
+            return 1
             
     except Exception as e:
         logger.exception(f"An error occurred during the email sending process: {str(e)}")
@@ -418,4 +432,4 @@ def main():
     return 0
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    sys.exit(main()) 
\ No newline at end of file
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared JSON helpers.
+"""
+
+import json
+
+import pytest
+
+from voice_calender import json_utils
+
+
+def test_dump_file_round_trips(tmp_path):
+    path = tmp_path / "data.json"
+    json_utils.dump_file({'a': [1, 2], 'b': 'ç'}, path)
+    assert json_utils.load_file(path) == {'a': [1, 2], 'b': 'ç'}
+
+
+def test_atomic_dump_file_replaces_existing_file(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text('{"old": true}')
+    json_utils.dump_file({'new': True}, path, atomic=True)
+    assert json_utils.load_file(path) == {'new': True}
+    assert not (tmp_path / "data.json.tmp").exists()
+
+
+def test_atomic_dump_file_keeps_original_on_failure(tmp_path, monkeypatch):
+    path = tmp_path / "data.json"
+    path.write_text('{"old": true}')
+
+    def failing_replace(src, dst):
+        raise OSError("rename failed")
+
+    monkeypatch.setattr(json_utils.os, 'replace', failing_replace)
+    with pytest.raises(OSError):
+        json_utils.dump_file({'new': True}, path, atomic=True)
+
+    assert json_utils.load_file(path) == {'old': True}
+    assert not (tmp_path / "data.json.tmp").exists()
+
+
+def test_load_file_errors_are_json_decode_errors(tmp_path):
+    path = tmp_path / "broken.json"
+    path.write_text('{"unterminated": ')
+    with pytest.raises(json.JSONDecodeError):
+        json_utils.load_file(path)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for stitching chunk transcriptions and recording transcribed files.
+"""
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("openai")
+pytest.importorskip("httpx")
+
+from voice_calender.transcribe_audio_for_calender import transcribe_audio_for_calender as transcribe
+
+
+@pytest.fixture
+def audio_dir(tmp_path, monkeypatch):
+    """Two recordings: short.mp3 uploads whole, long.mp3 is split into three chunks"""
+    downloads = tmp_path / "downloads"
+    downloads.mkdir()
+    (downloads / "short.mp3").write_bytes(b"short audio")
+    (downloads / "long.mp3").write_bytes(b"long audio" * 10)
+
+    def fake_split(file_path, chunk_dir):
+        return [Path(chunk_dir) / f"{Path(file_path).stem}_{i:03d}.mp3" for i in range(3)]
+
+    monkeypatch.setattr(transcribe, 'MAX_UPLOAD_SIZE_BYTES', 50)
+    monkeypatch.setattr(transcribe, 'TRANSCRIBED_HASHES_FILE', tmp_path / "hashes.txt")
+    monkeypatch.setattr(transcribe, 'get_local_model', lambda: None)
+    monkeypatch.setattr(transcribe, 'split_audio_file', fake_split)
+    return downloads
+
+
+def _run(audio_dir, tmp_path, monkeypatch, failing_chunk=None):
+    def fake_transcribe(client, file_path):
+        name = Path(file_path).name
+        return None if name == failing_chunk else f"<{name}>"
+
+    monkeypatch.setattr(transcribe, 'transcribe_audio_file', fake_transcribe)
+    files = [audio_dir / "short.mp3", audio_dir / "long.mp3"]
+    output_dir = tmp_path / "out"
+    assert transcribe.process_audio_files(None, files, output_dir, "out.txt")
+    text = next(output_dir.iterdir()).read_text(encoding='utf-8')
+    return text, transcribe.load_transcribed_hashes()
+
+
+def test_chunks_are_stitched_in_order(audio_dir, tmp_path, monkeypatch):
+    text, hashes = _run(audio_dir, tmp_path, monkeypatch)
+    assert "<short.mp3>" in text
+    assert "<long_000.mp3> <long_001.mp3> <long_002.mp3>" in text
+    assert hashes == {transcribe.hash_audio_file(audio_dir / name) for name in ("short.mp3", "long.mp3")}
+
+
+def test_failed_chunk_drops_file_and_its_hash(audio_dir, tmp_path, monkeypatch):
+    text, hashes = _run(audio_dir, tmp_path, monkeypatch, failing_chunk="long_001.mp3")
+    assert "<short.mp3>" in text
+    assert "long.mp3" not in text and "<long_000.mp3>" not in text
+    assert hashes == {transcribe.hash_audio_file(audio_dir / "short.mp3")}
+
+    # The recording is picked up again on the next run
+    remaining, _ = transcribe.skip_transcribed_files([audio_dir / "short.mp3", audio_dir / "long.mp3"])
+    assert remaining == [audio_dir / "long.mp3"]
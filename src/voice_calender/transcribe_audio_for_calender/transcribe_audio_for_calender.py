@@ -15,7 +15,7 @@ The transcriptions will be used for calendar event creation.
 
 import os
 import sys
-import json
+import hashlib
 import logging
 import time
 from datetime import datetime
@@ -24,8 +24,14 @@ import traceback
 import subprocess
 import logging.handlers
 import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import httpx
 from openai import OpenAI
 
+from voice_calender import json_utils
+
 
 # Initialize paths - handling both frozen (PyInstaller) and regular Python execution
 if getattr(sys, 'frozen', False):
@@ -56,8 +62,7 @@ def load_config():
             print(f"Error: Configuration file not found at {config_path}")
             sys.exit(1)
             
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        config = json_utils.load_file(config_path)
 
         return config
     except Exception as e:
@@ -78,8 +83,7 @@ def load_openai_config():
             print(f"Error: OpenAI configuration file not found at {config_path}")
             sys.exit(1)
             
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        config = json_utils.load_file(config_path)
 
         return config
     except Exception as e:
@@ -121,9 +125,56 @@ logger.addHandler(file_handler)
 logger.info("Voice Calendar Transcription Service")
 logger.info(f"Logging to {log_path}")
 
+# Number of audio files transcribed in parallel
+MAX_WORKERS = config.get("max_workers", 8)
+
+# Caps in-flight transcription requests to stay within the OpenAI rate limit
+MAX_CONCURRENT_REQUESTS = openai_config.get("rate_limits", {}).get("max_concurrent_requests", 6)
+_request_semaphore = threading.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+# Files above this size are split before upload (the API rejects files over 25 MB);
+# chunks are at most CHUNK_DURATION_SECONDS long, shorter for high-bitrate audio
+chunking_config = config.get("chunking", {})
+MAX_UPLOAD_SIZE_BYTES = chunking_config.get("max_file_size_bytes", 20 * 1024 * 1024)
+CHUNK_DURATION_SECONDS = chunking_config.get("chunk_duration_seconds", 600)
+
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# OpenAI client shared by all transcriptions in this process
+_client = None
+
+# Local faster-whisper model, loaded on first use when a CUDA GPU is available
+local_transcription_config = config.get("local_transcription", {})
+_local_model = None
+_local_model_loaded = False
+_local_model_lock = threading.Lock()
+
+# Content hashes of audio files already transcribed, one per line
+TRANSCRIBED_HASHES_FILE = SCRIPT_DIR / "transcribed_audio_hashes.txt"
+
+# Timestamp in YYYYMMDD_HHMMSS format embedded in downloaded file names,
+# one group per field so it converts to a datetime without strptime
+FILENAME_TIMESTAMP_PATTERN = re.compile(r'(\d{4})(\d{2})(\d{2})_(\d{2})(\d{2})(\d{2})')
+
 
 def get_openai_client():
-    """Get the OpenAI client."""
+    """
+    Get the OpenAI client, creating it on first use.
+    
+    The client keeps a pooled HTTP connection (HTTP/2 when h2 is installed)
+    that is reused across transcriptions and scheduler runs, instead of
+    opening a new TLS connection for every run.
+    """
+    global _client
+    
+    if _client is not None:
+        return _client
+    
     try:
         # Get the API key from environment variable
         api_key = os.environ.get("OPENAI_API_KEY")
@@ -133,14 +184,20 @@ def get_openai_client():
             logger.error("Please set the OPENAI_API_KEY environment variable with your OpenAI API key")
             sys.exit(1)
             
-        # Create OpenAI client
-        client = OpenAI(api_key=api_key)
+        # Create OpenAI client, sized for the parallel transcription workers
+        _client = OpenAI(
+            api_key=api_key,
+            http_client=httpx.Client(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                timeout=httpx.Timeout(600.0, connect=5.0)
+            )
+        )
         logger.info("OpenAI client initialized")
-        return client
+        return _client
         
     except Exception as e:
-        logger.error(f"Error creating OpenAI client: {str(e)}")
-        traceback.print_exc()
+        logger.exception(f"Error creating OpenAI client: {str(e)}")
         sys.exit(1)
 
 
@@ -154,8 +211,7 @@ def get_audio_extensions_from_gdrive_config():
             logger.error(f"Google Drive configuration file not found at {gdrive_config_path}")
             return None
             
-        with open(gdrive_config_path, 'r') as f:
-            gdrive_config = json.load(f)
+        gdrive_config = json_utils.load_file(gdrive_config_path)
             
         # Get audio file extensions
         audio_extensions = gdrive_config.get("audio_file_types", {}).get("include", [])
@@ -179,8 +235,7 @@ def get_downloads_dir_from_gdrive_config():
             logger.error(f"Google Drive configuration file not found at {gdrive_config_path}")
             return None
             
-        with open(gdrive_config_path, 'r') as f:
-            gdrive_config = json.load(f)
+        gdrive_config = json_utils.load_file(gdrive_config_path)
             
         # Get downloads directory
         downloads_dir = gdrive_config.get("downloads_path", {}).get("downloads_dir")
@@ -312,7 +367,8 @@ def transcribe_audio_file(client, file_path):
                 params["response_format"] = response_format
             
             # Call the OpenAI API
-            response = client.audio.transcriptions.create(**params)
+            with _request_semaphore:
+                response = client.audio.transcriptions.create(**params)
         
         end_time = time.time()
         transcription_time = end_time - start_time
@@ -324,7 +380,7 @@ def transcribe_audio_file(client, file_path):
                 transcription = response.text
             else:
                 # Newer models might return a different structure
-                transcription = json.dumps(response.model_dump(), indent=2)
+                transcription = json_utils.dumps(response.model_dump(), indent=True)
         else:
             transcription = response.text
         
@@ -339,8 +395,86 @@ def transcribe_audio_file(client, file_path):
             
         return transcription
     except Exception as e:
-        logger.error(f"Error transcribing audio file: {str(e)}")
-        traceback.print_exc()
+        logger.exception(f"Error transcribing audio file: {str(e)}")
+        return None
+
+
+def get_local_model():
+    """
+    Get the local faster-whisper model, loading it on first use.
+    
+    Local transcription is used when it is enabled in the configuration, the
+    optional faster-whisper package is installed (pip install voice_calender[local])
+    and a CUDA GPU is available.
+    
+    Returns:
+        WhisperModel: The loaded model, or None to use the OpenAI API
+    """
+    global _local_model, _local_model_loaded
+    
+    with _local_model_lock:
+        if _local_model_loaded:
+            return _local_model
+        _local_model_loaded = True
+        
+        if not local_transcription_config.get("enabled", True):
+            return None
+        
+        try:
+            import ctranslate2
+            from faster_whisper import WhisperModel
+        except ImportError:
+            return None
+        
+        try:
+            if ctranslate2.get_cuda_device_count() == 0:
+                logger.info("No CUDA GPU found, transcribing with the OpenAI API")
+                return None
+            
+            model_name = local_transcription_config.get("model", "large-v3")
+            compute_type = local_transcription_config.get("compute_type", "int8_float16")
+            logger.info(f"Loading local transcription model {model_name} ({compute_type}) on GPU")
+            _local_model = WhisperModel(model_name, device="cuda", compute_type=compute_type)
+        except Exception as e:
+            logger.error(f"Error loading local transcription model: {str(e)}")
+            _local_model = None
+        
+        return _local_model
+
+
+def transcribe_audio_file_locally(model, file_path):
+    """
+    Transcribe an audio file on the local GPU with faster-whisper.
+    
+    Returns:
+        str: The transcription, or None if it failed
+    """
+    try:
+        language = openai_config.get("settings", {}).get("language")
+        start_time = time.time()
+        
+        # One transcription at a time, the GPU is the bottleneck
+        with _local_model_lock:
+            segments, info = model.transcribe(
+                str(file_path),
+                language=language,
+                beam_size=local_transcription_config.get("beam_size", 1),
+                vad_filter=local_transcription_config.get("vad_filter", True)
+            )
+            transcription = "".join(segment.text for segment in segments).strip()
+        
+        transcription_time = time.time() - start_time
+        logger.info(f"Local transcription completed in {transcription_time:.2f} seconds")
+        logger.info(f"Transcription speed: {info.duration/transcription_time:.2f}x real-time")
+        
+        if transcription:
+            logger.info(f"Transcription successful: {len(transcription)} characters")
+        else:
+            logger.warning("Transcription returned empty result")
+            
+        return transcription
+    except Exception as e:
+        logger.error(f"Error transcribing audio file locally: {str(e)}")
         return None
 
 
@@ -371,12 +505,11 @@ def get_audio_files(directory):
     def get_timestamp_from_filename(filepath):
         filename = filepath.name
         # Try to extract timestamp in format YYYYMMDD_HHMMSS from filename
-        timestamp_match = re.search(r'(\d{8}_\d{6})', filename)
+        timestamp_match = FILENAME_TIMESTAMP_PATTERN.search(filename)
         if timestamp_match:
             try:
                 # If timestamp found in filename, use it
-                timestamp_str = timestamp_match.group(1)
-                return datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
+                return datetime(*map(int, timestamp_match.groups()))
             except ValueError:
                 pass
         
@@ -384,15 +517,18 @@ def get_audio_files(directory):
         # or if timestamp couldn't be parsed
         return datetime.fromtimestamp(os.path.getctime(filepath))
     
-    # Sort files by timestamp
+    # Sort files by timestamp, extracting each file's timestamp once
     logger.info("Sorting audio files by creation time (chronological order)")
-    sorted_files = sorted(audio_files, key=get_timestamp_from_filename)
+    timestamped_files = sorted(
+        ((get_timestamp_from_filename(file), file) for file in audio_files),
+        key=lambda item: item[0]
+    )
+    sorted_files = [file for _, file in timestamped_files]
     
     # Log the sorted files
     if sorted_files:
         logger.info("Files will be processed in the following order:")
-        for i, file in enumerate(sorted_files, 1):
-            timestamp = get_timestamp_from_filename(file)
+        for i, (timestamp, file) in enumerate(timestamped_files, 1):
             logger.info(f"{i}. {file.name} (Created: {timestamp.strftime('%Y-%m-%d %H:%M:%S')})")
     
     return sorted_files
@@ -423,11 +559,131 @@ def save_transcription(text, output_path, file_name):
         return True
         
     except Exception as e:
-        logger.error(f"Error saving transcription: {str(e)}")
-        traceback.print_exc()
+        logger.exception(f"Error saving transcription: {str(e)}")
         return False
 
 
+def get_chunk_duration(file_path):
+    """
+    Get the chunk length in seconds that keeps each chunk of an audio file
+    under MAX_UPLOAD_SIZE_BYTES, assuming a constant bitrate.
+    
+    Returns:
+        int: Chunk length, at most CHUNK_DURATION_SECONDS
+    """
+    duration = calculate_duration(file_path)
+    if not duration:
+        return CHUNK_DURATION_SECONDS
+    
+    bytes_per_second = os.path.getsize(file_path) / duration
+    if bytes_per_second <= 0:
+        return CHUNK_DURATION_SECONDS
+    
+    # Leave 10% headroom for variable bitrate and container overhead
+    max_seconds = int(MAX_UPLOAD_SIZE_BYTES * 0.9 / bytes_per_second)
+    return max(1, min(CHUNK_DURATION_SECONDS, max_seconds))
+
+
+def split_audio_file(file_path, chunk_dir):
+    """
+    Split a large audio file into chunks small enough to upload using ffmpeg.
+    
+    Returns:
+        list: Chunk paths in playback order, or [file_path] if splitting failed
+    """
+    file_path = Path(file_path)
+    chunk_pattern = Path(chunk_dir) / f"{file_path.stem}_%03d{file_path.suffix}"
+    chunk_duration = get_chunk_duration(file_path)
+    try:
+        result = subprocess.run(
+            [
+                "ffmpeg",
+                "-v", "error",
+                "-i", str(file_path),
+                "-f", "segment",
+                "-segment_time", str(chunk_duration),
+                "-c", "copy",
+                str(chunk_pattern)
+            ],
+            capture_output=True,
+            text=True
+        )
+        if result.returncode != 0:
+            logger.warning(f"Unable to split {file_path.name}: {result.stderr}")
+            return [file_path]
+    except Exception as e:
+        logger.error(f"Error splitting audio file {file_path.name}: {str(e)}")
+        return [file_path]
+    
+    chunks = sorted(Path(chunk_dir).glob(f"{file_path.stem}_*{file_path.suffix}"))
+    if not chunks:
+        return [file_path]
+    
+    logger.info(f"Split {file_path.name} into {len(chunks)} chunk(s) of up to {chunk_duration} seconds")
+    return chunks
+
+
+def hash_audio_file(file_path):
+    """Get the BLAKE2b hash of an audio file's content."""
+    digest = hashlib.blake2b()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_transcribed_hashes():
+    """Load the content hashes of audio files transcribed in earlier runs."""
+    try:
+        with open(TRANSCRIBED_HASHES_FILE, 'r', encoding='utf-8') as f:
+            return {line.strip() for line in f if line.strip()}
+    except FileNotFoundError:
+        return set()
+    except Exception as e:
+        logger.warning(f"Could not read transcribed audio hashes: {str(e)}")
+        return set()
+
+
+def record_transcribed_hashes(file_hashes):
+    """Append the content hashes of newly transcribed audio files."""
+    try:
+        with open(TRANSCRIBED_HASHES_FILE, 'a', encoding='utf-8') as f:
+            f.writelines(f"{file_hash}\n" for file_hash in file_hashes)
+    except Exception as e:
+        logger.warning(f"Could not save transcribed audio hashes: {str(e)}")
+
+
+def skip_transcribed_files(audio_files):
+    """
+    Drop audio files whose content was already transcribed, e.g. a recording
+    downloaded again because deleting it from Google Drive failed.
+    
+    Returns:
+        tuple: (list, dict) Files still to transcribe, and their content hashes
+    """
+    known_hashes = load_transcribed_hashes()
+    new_files = []
+    file_hashes = {}
+    
+    for file_path in audio_files:
+        try:
+            file_hash = hash_audio_file(file_path)
+        except OSError as e:
+            logger.warning(f"Could not hash {file_path}: {str(e)}")
+            new_files.append(file_path)
+            continue
+        
+        if file_hash in known_hashes:
+            logger.info(f"Skipping {file_path.name}: identical audio was already transcribed")
+            continue
+        
+        known_hashes.add(file_hash)
+        file_hashes[file_path] = file_hash
+        new_files.append(file_path)
+    
+    return new_files, file_hashes
+
+
 def process_audio_files(client, audio_files, output_path, output_file):
     """Process all audio files and save their transcriptions."""
     if not audio_files:
@@ -436,14 +692,61 @@ def process_audio_files(client, audio_files, output_path, output_file):
         
     logger.info(f"Found {len(audio_files)} audio file(s) to process")
     
+    file_hashes = {}
+    if config.get("skip_duplicate_audio", True):
+        audio_files, file_hashes = skip_transcribed_files(audio_files)
+        if not audio_files:
+            logger.info("All audio files were already transcribed")
+            return False
+    
     all_transcriptions = []
+    transcribed_hashes = []
     
-    for file_path in audio_files:
+    local_model = get_local_model()
+    
+    def transcribe(file_path):
         logger.info(f"Processing {file_path}")
+        if local_model is not None:
+            transcription = transcribe_audio_file_locally(local_model, file_path)
+            if transcription is not None:
+                return transcription
+            logger.warning(f"Local transcription of {file_path} failed, falling back to the OpenAI API")
+        return transcribe_audio_file(client, file_path)
+    
+    with tempfile.TemporaryDirectory(prefix="voice_calender_chunks_") as chunk_root:
+        # Split large files so every upload stays under the API limit;
+        # the chunks of one file are transcribed in parallel like separate files
+        file_parts = []
+        for index, file_path in enumerate(audio_files):
+            if os.path.getsize(file_path) > MAX_UPLOAD_SIZE_BYTES:
+                chunk_dir = Path(chunk_root) / str(index)
+                chunk_dir.mkdir()
+                file_parts.append(split_audio_file(file_path, chunk_dir))
+            else:
+                file_parts.append([file_path])
         
-        # Transcribe the audio file
-        transcription = transcribe_audio_file(client, file_path)
+        parts = [part for file_chunks in file_parts for part in file_chunks]
         
+        # Transcribe in parallel; map() yields results in chronological order
+        max_workers = max(1, min(MAX_WORKERS, len(parts)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            part_transcriptions = iter(list(executor.map(transcribe, parts)))
+    
+    # Stitch chunk transcriptions back together per file
+    transcriptions = []
+    for file_path, file_chunks in zip(audio_files, file_parts):
+        texts = [next(part_transcriptions) for _ in file_chunks]
+        failed = [chunk for chunk, text in zip(file_chunks, texts) if text is None]
+        if failed:
+            # A partial transcription would silently drop the failed chunks' speech
+            logger.error(f"Skipping {file_path.name}: transcription failed for chunk(s) "
+                         f"{', '.join(Path(chunk).name for chunk in failed)}")
+            transcriptions.append(None)
+            continue
+        texts = [text for text in texts if text]
+        transcriptions.append(" ".join(texts) if texts else None)
+    
+    for file_path, transcription in zip(audio_files, transcriptions):
         if transcription:
             # Add file name and timestamp to the transcription
             file_name = file_path.name
@@ -451,11 +754,16 @@ def process_audio_files(client, audio_files, output_path, output_file):
             formatted_transcription = f"File: {file_name}\nTimestamp: {timestamp}\n\n{transcription}\n\n"
             
             all_transcriptions.append(formatted_transcription)
+            # Only complete files get here, so a file with a failed chunk
+            # is not recorded and is transcribed again on the next run
+            if file_path in file_hashes:
+                transcribed_hashes.append(file_hashes[file_path])
     
     # Combine all transcriptions and save them
     if all_transcriptions:
         combined_text = "\n".join(all_transcriptions)
-        save_transcription(combined_text, output_path, output_file)
+        if save_transcription(combined_text, output_path, output_file):
+            record_transcribed_hashes(transcribed_hashes)
         return True
     
     return False
@@ -518,8 +826,7 @@ def run_transcribe():
             
         return success
     except Exception as e:
-        logger.error(f"Error running transcription process: {str(e)}")
-        traceback.print_exc()
+        logger.exception(f"Error running transcription process: {str(e)}")
         sys.exit(1)
 
 